@@ -13,6 +13,8 @@
 # limitations under the License.
 # ===========================================================================
 """Cost model splitter"""
+import heapq
+from collections import deque
 from functools import reduce
 from .model import PrimLib, Graph, Tensor
 
@@ -39,6 +41,8 @@ class GraphSplitByPattern:
                 self.mode = self.MODE_COMPOSITE
             self.is_output = is_output
             self.output_excluded = set()
+            # the position in the topological order of the areas, maintained by GraphSplitByPattern
+            self.topo_pos = 0
             if self.pattern == PrimLib.REDUCE:
                 def _gather_reduce_exclude(op):
                     for to in op.output.to_ops:
@@ -118,14 +122,18 @@ class GraphSplitByPattern:
 
         def check_circle(self, to):
             """Check circle. It returns false if circle exists"""
-            def _reached(area, to):
-                for out, _ in area.out_relations.items():
-                    if out == to or _reached(out, to):
-                        return True
-                return False
-            for out, _ in self.out_relations.items():
-                if out != to and _reached(out, to):
-                    return False
+            # only the areas before `to` in the topological order can reach it
+            visited = set()
+            stack = [out for out in self.out_relations if out != to]
+            while stack:
+                area = stack.pop()
+                if area in visited or area.topo_pos > to.topo_pos:
+                    continue
+                visited.add(area)
+                for out in area.out_relations:
+                    if out == to:
+                        return False
+                    stack.append(out)
             return True
 
         def dom_op(self):
@@ -155,29 +163,96 @@ class GraphSplitByPattern:
             a.link_input(area_map)
         for a in self.areas:
             a.link_output()
+        self.topo_order = self._sort_areas()
+
+    def _sort_areas(self):
+        """Sort the areas in topological order"""
+        in_degrees = {a: len(a.in_relations) for a in self.areas}
+        queue = deque([a for a in self.areas if not a.in_relations])
+        topo_order = []
+        while queue:
+            a = queue.popleft()
+            a.topo_pos = len(topo_order)
+            topo_order.append(a)
+            for out in a.out_relations:
+                in_degrees[out] -= 1
+                if in_degrees[out] == 0:
+                    queue.append(out)
+        return topo_order
+
+    def _update_topo_order(self, area, fused_area):
+        """Update the topological order after `fused_area` is fused to `area`"""
+        begin, end = sorted((area.topo_pos, fused_area.topo_pos))
+        # the areas between the two which reach the later one are moved before the fused area, the others after it,
+        # the fused area has no circle so the order is kept for all relations
+        reach_fused = set()
+        stack = [area]
+        while stack:
+            for a in stack.pop().in_relations:
+                if begin < a.topo_pos < end and a not in reach_fused:
+                    reach_fused.add(a)
+                    stack.append(a)
+        window = self.topo_order[begin:end + 1]
+        new_window = [a for a in window if a in reach_fused]
+        new_window.append(area)
+        new_window.extend([a for a in window if a is not None and a not in reach_fused and
+                           a is not area and a is not fused_area])
+        # the places of the removed areas are left empty to keep the positions of the other areas
+        new_window.extend([None] * (len(window) - len(new_window)))
+        for i, a in enumerate(new_window, begin):
+            if a is not None:
+                a.topo_pos = i
+        self.topo_order[begin:end + 1] = new_window
 
     def fuse(self, selector):
         """Fuse areas"""
+        def _fuse_area(area, fused_area):
+            area.fuse(fused_area)
+            self._update_topo_order(area, fused_area)
+            fused_areas.add(fused_area)
+
+        def _near_areas(area):
+            """The areas whose result of selector may be changed by a fusion to `area`"""
+            near_areas = {area}
+            for a in list(area.in_relations) + list(area.out_relations):
+                near_areas.add(a)
+                near_areas.update(a.in_relations)
+                near_areas.update(a.out_relations)
+            return near_areas
+
+        # the first area in self.areas which is selected is fused and the search restarts. A fusion only changes
+        # the result of selector on the areas near the fused area, while for the other areas, the circle checks
+        # may only turn to fail, so only the near areas need to be tried again.
         changed = False
-        while True:
-            for dominant in self.areas:
-                result = selector(dominant)
-                if result is not None and result[0]:
-                    fuse_areas, is_forward = result
-                    if is_forward:
-                        for area in fuse_areas:
-                            dominant.fuse(area)
-                            self.areas.remove(area)
-                    else:
-                        forward_area = dominant
-                        for area in fuse_areas:
-                            area.fuse(forward_area)
-                            self.areas.remove(forward_area)
-                            forward_area = area
-                    changed = True
-                    break
+        fused_areas = set()
+        area_index = {a: i for i, a in enumerate(self.areas)}
+        worklist = list(range(len(self.areas)))
+        in_worklist = [True] * len(self.areas)
+        while worklist:
+            idx = heapq.heappop(worklist)
+            in_worklist[idx] = False
+            dominant = self.areas[idx]
+            if dominant in fused_areas:
+                continue
+            result = selector(dominant)
+            if result is None or not result[0]:
+                continue
+            fuse_areas, is_forward = result
+            if is_forward:
+                for area in fuse_areas:
+                    _fuse_area(dominant, area)
             else:
-                return changed
+                for area in fuse_areas:
+                    _fuse_area(area, dominant)
+                    dominant = area
+            changed = True
+            for a in _near_areas(dominant):
+                idx = area_index[a]
+                if not in_worklist[idx]:
+                    in_worklist[idx] = True
+                    heapq.heappush(worklist, idx)
+        self.areas = [a for a in self.areas if a not in fused_areas]
+        return changed
 
     def to_subgraphs(self):
         """Transform op groups to subgraphs"""
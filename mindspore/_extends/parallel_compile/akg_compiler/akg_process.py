@@ -13,25 +13,46 @@
 # limitations under the License.
 # ============================================================================
 """akg process"""
-import os
-import subprocess
-import sys
+import json
+import time
 from multiprocessing import Pool, cpu_count
+from .compiler import run_compiler
+from ..kernel_cache import get_compiler_version, get_kernel_cache
 
-def _compile_akg_task(*json_strs):
+def _init_akg_worker():
     """
-    compile func called in single process
+    init func of the worker processes, akg is imported once per worker instead of once per kernel
+    """
+    try:
+        __import__("akg", globals(), locals(), ['ms'], 0)
+    except ImportError:
+        # the import error is reported when compiling the kernels
+        pass
+
+def _compile_akg_task(json_str):
+    """
+    compile func called in a worker process, the kernels compiled before are loaded from the kernel cache when it
+    is enabled by the env MS_KERNEL_CACHE_PATH
 
     Parameters:
-        json_strs: list. List contains multiple kernel infos, suitable for json compile api.
+        json_str: str. Kernel info, suitable for json compile api.
+
+    Returns:
+        str, the error message, empty if the compilation succeeded.
     """
-    akg_compiler = os.path.join(os.path.split(
-        os.path.realpath(__file__))[0], "compiler.py")
-    for json_str in json_strs:
-        res = subprocess.run(
-            [sys.executable, akg_compiler, json_str], text=True)
-        if res.returncode != 0:
-            raise ValueError("Failed, args: {}!".format(json_str))
+    try:
+        cache = get_kernel_cache()
+        if cache is not None:
+            cache_key = cache.get_key(json_str, "akg", get_compiler_version("akg"))
+            if cache.load(cache_key) is not None:
+                return ""
+        run_compiler(json_str)
+        if cache is not None:
+            cache.store(cache_key, json.loads(json_str)["op"])
+    except Exception as e: # pylint: disable=broad-except
+        # the exceptions of akg may be not picklable, so only the message is returned
+        return "{}: {}".format(type(e).__name__, e)
+    return ""
 
 def create_akg_parallel_process(process_num, wait_time):
     """
@@ -43,7 +64,14 @@ def create_akg_parallel_process(process_num, wait_time):
     return AkgProcess(process_num, wait_time)
 
 class AkgProcess:
-    """akg kernel parallel process"""
+    """
+    akg kernel parallel process
+
+    The worker processes are kept warm between the compilations, every kernel is a task of the pool and an idle
+    worker takes the next one.
+    """
+    _pool = None
+    _pool_size = 0
 
     def __init__(self, process_num, wait_time):
         """
@@ -57,12 +85,30 @@ class AkgProcess:
             raise ValueError("wait time must be a num")
         if process_num == 0:
             process_num = 1
-        max_proc_num = 16
-        self.process_num = min([cpu_count(), max_proc_num, process_num])
-        self.args = [[] for _ in range(self.process_num)]
+        self.process_num = min([cpu_count(), process_num])
+        self.args = []
         self.wait_time = wait_time
         self.argc = 0
 
+    @classmethod
+    def _get_pool(cls, process_num):
+        """get the warm worker pool, it is created again only if the number of processes changes"""
+        if cls._pool is not None and cls._pool_size != process_num:
+            cls.close_pool()
+        if cls._pool is None:
+            cls._pool = Pool(processes=process_num, initializer=_init_akg_worker)
+            cls._pool_size = process_num
+        return cls._pool
+
+    @classmethod
+    def close_pool(cls):
+        """terminate the worker processes"""
+        if cls._pool is not None:
+            cls._pool.terminate()
+            cls._pool.join()
+            cls._pool = None
+            cls._pool_size = 0
+
     def compile(self):
         """
         compile kernel by multi processes
@@ -71,18 +117,27 @@ class AkgProcess:
         """
         if self.argc == 0:
             raise ValueError("json must be not null")
-        with Pool(processes=self.process_num) as pool:
-            res = pool.starmap_async(_compile_akg_task, self.args)
-            res.get(timeout=self.wait_time)
+        pool = self._get_pool(self.process_num)
+        res_list = [pool.apply_async(_compile_akg_task, (json_str,)) for json_str in self.args]
+        deadline = time.time() + self.wait_time
+        try:
+            for json_str, res in zip(self.args, res_list):
+                error = res.get(timeout=max(deadline - time.time(), 0))
+                if error:
+                    raise ValueError("Failed, args: {}! {}".format(json_str, error))
+        except BaseException:
+            # do not leave the remaining kernels running in the warm workers
+            self.close_pool()
+            raise
         return True
 
-    def accept_json(self, json):
+    def accept_json(self, json_str):
         """
         accept json data before compile
         Args:
-            json: str. kernel info.
+            json_str: str. kernel info.
         """
-        if not isinstance(json, str):
+        if not isinstance(json_str, str):
             raise ValueError("json must be a str")
-        self.args[self.argc % self.process_num].append(json)
+        self.args.append(json_str)
         self.argc += 1
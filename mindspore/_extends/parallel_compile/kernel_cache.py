@@ -0,0 +1,233 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""content-addressed cache of compiled kernels shared by processes"""
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import time
+
+KERNEL_META_PATH = "./kernel_meta"
+# the cache is enabled when the env is set to the cache directory
+CACHE_PATH_ENV = "MS_KERNEL_CACHE_PATH"
+# the maximum size of the cache in MB
+CACHE_SIZE_ENV = "MS_KERNEL_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 4096
+# the temporary directories of the writers which are older than this, in seconds, are left by dead writers
+STALE_TMP_TIME = 3600
+
+_RESULT_FILE = "compile_result"
+_TMP_PREFIX = ".tmp_"
+_DEL_PREFIX = ".del_"
+# the kernel caches of the process, keyed on the configuration of the env
+_kernel_caches = {}
+
+
+def get_compiler_version(module_name, *extra_info):
+    """
+    get the version of a compiler, made of the path and modification time of its module
+
+    Args:
+        module_name (str): The module name of the compiler, e.g. akg.
+        extra_info (str): Other info the compiled kernels depend on, e.g. the path of the op implementations.
+
+    Returns:
+        str, the version, empty if the module is not found.
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or not spec.origin:
+        return ""
+    try:
+        mtime = os.stat(spec.origin).st_mtime_ns
+    except OSError:
+        mtime = 0
+    return "|".join([spec.origin, str(mtime)] + [str(info) for info in extra_info])
+
+
+class KernelCache:
+    """
+    Cache of compiled kernels, keyed on the normalized kernel json, the target and the compiler version.
+
+    An entry holds the kernel files `<kernel_name>.*` of the kernel meta directory and the result of the compiler.
+    The entries are published by renaming, so the processes on a host can share the cache directory; the least
+    recently used entries are evicted when the cache exceeds its maximum size. The size of the cache is scanned
+    only when the running total of the scanned size and the sizes stored since goes over the maximum size, so the
+    entries stored by the other processes meanwhile are counted at the next scan.
+
+    Args:
+        cache_path (str): The cache directory.
+        max_size (int): The maximum size of the cache in bytes.
+        kernel_meta_path (str): The directory of the compiled kernel files. Default: "./kernel_meta".
+    """
+
+    def __init__(self, cache_path, max_size, kernel_meta_path=KERNEL_META_PATH):
+        self.cache_path = os.path.realpath(cache_path)
+        self.max_size = max_size
+        self.kernel_meta_path = kernel_meta_path
+        # the size of the cache, None until it is scanned
+        self._size = None
+        os.makedirs(self.cache_path, exist_ok=True)
+
+    @staticmethod
+    def get_key(json_str, target, version):
+        """
+        get the cache key of a kernel
+
+        Args:
+            json_str (str): The kernel json.
+            target (str): The compiler target, e.g. akg or tbe.
+            version (str): The compiler version.
+
+        Returns:
+            str, the key.
+        """
+        try:
+            normalized = json.dumps(json.loads(json_str), sort_keys=True, separators=(',', ':'))
+        except ValueError:
+            normalized = json_str
+        digest = hashlib.sha256()
+        for item in (target, version, normalized):
+            digest.update(item.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def load(self, key):
+        """
+        copy the kernel files of a cached kernel into the kernel meta directory
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            str, the result of the compiler, None if the kernel is not cached.
+        """
+        entry_path = os.path.join(self.cache_path, key)
+        try:
+            with open(os.path.join(entry_path, _RESULT_FILE), 'r') as f:
+                result = f.read()
+            os.makedirs(self.kernel_meta_path, exist_ok=True)
+            for file_name in os.listdir(entry_path):
+                if file_name == _RESULT_FILE:
+                    continue
+                # the kernel files appear complete to the readers of kernel meta directory
+                dst = os.path.join(self.kernel_meta_path, file_name)
+                tmp = "{}.{}{}".format(dst, _TMP_PREFIX, os.getpid())
+                shutil.copyfile(os.path.join(entry_path, file_name), tmp)
+                os.replace(tmp, dst)
+            # the modification time of the entry is its last use
+            os.utime(entry_path)
+        except OSError:
+            # not cached, or evicted meanwhile
+            return None
+        return result
+
+    def store(self, key, kernel_name, result=""):
+        """
+        store the kernel files of a compiled kernel
+
+        Args:
+            key (str): The cache key.
+            kernel_name (str): The kernel name, the kernel files are `<kernel_name>.*` in the kernel meta directory.
+            result (str): The result of the compiler.
+        """
+        entry_path = os.path.join(self.cache_path, key)
+        if os.path.isdir(entry_path):
+            return
+        kernel_files = glob.glob(os.path.join(glob.escape(self.kernel_meta_path), glob.escape(kernel_name) + ".*"))
+        try:
+            tmp_path = tempfile.mkdtemp(prefix=_TMP_PREFIX, dir=self.cache_path)
+        except OSError:
+            return
+        try:
+            size = 0
+            for kernel_file in kernel_files:
+                shutil.copyfile(kernel_file, os.path.join(tmp_path, os.path.basename(kernel_file)))
+                size += os.path.getsize(kernel_file)
+            with open(os.path.join(tmp_path, _RESULT_FILE), 'w') as f:
+                f.write(result)
+            size += len(result.encode())
+            # publish the entry, it fails if another process has published it
+            os.rename(tmp_path, entry_path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return
+        if self._size is not None:
+            self._size += size
+            if self._size <= self.max_size:
+                return
+        self._evict()
+
+    def _evict(self):
+        """remove the least recently used entries until the cache does not exceed the maximum size"""
+        entries = []
+        total_size = 0
+        now = time.time()
+        for entry_name in os.listdir(self.cache_path):
+            entry_path = os.path.join(self.cache_path, entry_name)
+            try:
+                if entry_name.startswith(_TMP_PREFIX):
+                    if now - os.stat(entry_path).st_mtime > STALE_TMP_TIME:
+                        shutil.rmtree(entry_path, ignore_errors=True)
+                    continue
+                if entry_name.startswith(_DEL_PREFIX):
+                    continue
+                size = sum(os.path.getsize(os.path.join(entry_path, file_name))
+                           for file_name in os.listdir(entry_path))
+                entries.append((os.stat(entry_path).st_mtime, size, entry_name))
+            except OSError:
+                # removed by another process
+                continue
+            total_size += size
+
+        entries.sort()
+        for _, size, entry_name in entries:
+            if total_size <= self.max_size:
+                break
+            # the entry disappears at once for the readers, and is removed afterwards
+            del_path = os.path.join(self.cache_path, "{}{}_{}".format(_DEL_PREFIX, entry_name, os.getpid()))
+            try:
+                os.rename(os.path.join(self.cache_path, entry_name), del_path)
+            except OSError:
+                continue
+            shutil.rmtree(del_path, ignore_errors=True)
+            total_size -= size
+        self._size = total_size
+
+
+def get_kernel_cache():
+    """
+    get the kernel cache configured by the env MS_KERNEL_CACHE_PATH and MS_KERNEL_CACHE_SIZE, the same cache is
+    returned for the same configuration, so its running size total is kept over the compiled kernels
+
+    Returns:
+        KernelCache, None if the cache is disabled.
+    """
+    cache_path = os.environ.get(CACHE_PATH_ENV)
+    if not cache_path:
+        return None
+    try:
+        max_size = int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+    except ValueError:
+        raise ValueError("The env {} must be an int, the size in MB.".format(CACHE_SIZE_ENV))
+    config = (cache_path, max_size)
+    if config not in _kernel_caches:
+        _kernel_caches[config] = KernelCache(cache_path, max_size * 1024 * 1024)
+    return _kernel_caches[config]
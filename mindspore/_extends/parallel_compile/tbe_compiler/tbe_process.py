@@ -21,6 +21,7 @@ import os
 import json
 from .common import check_kernel_info, TBEException
 from .helper import _op_select_format, _check_supported
+from ..kernel_cache import get_compiler_version, get_kernel_cache
 
 def create_tbe_parallel_process():
     """
@@ -75,9 +76,17 @@ def check_supported(op_json: str):
 
     return ret
 
+def _get_kernel_name(op_json):
+    """get the kernel name of an op or a fusion op, whose kernel files are kernel_meta/<kernel_name>.*"""
+    json_info = json.loads(op_json)
+    if "fusion_op" in json_info:
+        return json_info["fusion_op"]["fusion_op_name"]
+    return json_info["op_info"]["kernel_name"]
+
 def run_compiler(op_json):
     """
-    run compiler to compile op with subprocess
+    run compiler to compile op with subprocess, the kernels compiled before are loaded from the kernel cache
+    when it is enabled by the env MS_KERNEL_CACHE_PATH
 
     Args:
         op_json (str): json string of the op
@@ -85,12 +94,20 @@ def run_compiler(op_json):
     Returns:
         result type, result.
     """
+    cache = get_kernel_cache()
+    if cache is not None:
+        cache_key = cache.get_key(op_json, "tbe", get_compiler_version("te", os.environ.get("TBE_IMPL_PATH", "")))
+        out = cache.load(cache_key)
+        if out is not None:
+            return "Success", out
     try:
         tbe_compiler = os.path.join(os.path.split(os.path.realpath(__file__))[0], "compiler.py")
         completed_object = subprocess.run([sys.executable, tbe_compiler], input=op_json, timeout=300,
                                           text=True, capture_output=True, check=True)
         if completed_object:
             out = completed_object.stdout
+        if cache is not None:
+            cache.store(cache_key, _get_kernel_name(op_json), out)
         return "Success", out
     except subprocess.TimeoutExpired:
         tb = traceback.format_exc()
@@ -19,6 +19,10 @@
 import ast
 import hashlib
 import inspect
+import os
+import pickle
+import stat
+import sys
 import types
 from dataclasses import is_dataclass
 from textwrap import dedent
@@ -74,6 +78,15 @@ parse_expr_statement_white_list = (
     "append",
 )
 
+# The parsed ast trees are also cached in this directory when the env is set, to be reused by other processes.
+# The cache files are unpickled, so anyone who can write into the directory can run code in the processes loading
+# them. The directory is only used when it is owned by the current user and not accessible by others, i.e. 0o700,
+# it is created so when missing.
+AST_CACHE_PATH_ENV = "MS_AST_CACHE_PATH"
+
+# the ast cache directories found unsafe, warned about once
+_unsafe_ast_cache_paths = set()
+
 
 def create_slice_obj(start, end, step):
     """Create slice object"""
@@ -346,6 +359,72 @@ def get_object_description(obj, fname, fline):
     return str(obj)
 
 
+def _check_ast_cache_path(cache_path):
+    """Check the disk cache directory is owned by the current user and private to it, create it if missing."""
+    if not hasattr(os, "getuid"):
+        return False
+    try:
+        if not os.path.exists(cache_path):
+            os.makedirs(cache_path, mode=stat.S_IRWXU, exist_ok=True)
+            os.chmod(cache_path, stat.S_IRWXU)
+        path_stat = os.stat(cache_path)
+    except OSError as ex:
+        logger.warning("Failed to create the ast cache directory '%s'. %s", cache_path, ex)
+        return False
+    return stat.S_ISDIR(path_stat.st_mode) and path_stat.st_uid == os.getuid() \
+        and not stat.S_IMODE(path_stat.st_mode) & (stat.S_IRWXG | stat.S_IRWXO)
+
+
+def _get_ast_cache_file(hexstr):
+    """Get the file of the ast tree of a source in the disk cache, None if the disk cache is disabled or unsafe."""
+    cache_path = os.environ.get(AST_CACHE_PATH_ENV)
+    if not cache_path:
+        return None
+    cache_path = os.path.realpath(cache_path)
+    if not _check_ast_cache_path(cache_path):
+        if cache_path not in _unsafe_ast_cache_paths:
+            _unsafe_ast_cache_paths.add(cache_path)
+            logger.warning("The ast cache directory '%s' is not used, it must be a directory owned by the current "
+                           "user with the permission 0o700.", cache_path)
+        return None
+    # the pickled ast tree and tokens depend on the versions of python and asttokens
+    version = f"{sys.version}|{getattr(asttokens, '__version__', '')}"
+    key = hashlib.sha256(f"{hexstr}|{version}".encode()).hexdigest()
+    return os.path.join(cache_path, key + ".ast")
+
+
+def _load_ast_cache(hexstr):
+    """Load the ast tree and the column offset of a source from the disk cache, None if it is not cached."""
+    cache_file = _get_ast_cache_file(hexstr)
+    if cache_file is None or not os.path.isfile(cache_file):
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception as ex: # pylint: disable=broad-except
+        # a broken or stale cache file is ignored
+        logger.warning("Failed to load the ast cache file '%s', it is parsed again. %s", cache_file, ex)
+    return None
+
+
+def _dump_ast_cache(hexstr, cached):
+    """Dump the ast tree and the column offset of a source to the disk cache."""
+    cache_file = _get_ast_cache_file(hexstr)
+    if cache_file is None:
+        return
+    # the file appears complete to the other processes
+    tmp_file = f"{cache_file}.{os.getpid()}"
+    try:
+        with open(tmp_file, 'wb') as f:
+            os.chmod(tmp_file, stat.S_IWUSR | stat.S_IRUSR)
+            pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PicklingError, RecursionError) as ex:
+        logger.warning("Failed to dump the ast cache file '%s'. %s", cache_file, ex)
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
 class Parser:
     """
     Parser python code to ast tree.
@@ -353,9 +432,11 @@ class Parser:
     Args:
         fn(FunctionType/MethodType): Need parse object instance.
         parse_method(ExtendInfoOfParseObj): Extend information for parse the function.
-        ast_cache: Dictionary for caching ast tree.
+        ast_cache: Dictionary for caching ast tree and its column offset.
+        ast_cache_stats: Counters of the ast trees got from the memory cache, from the disk cache and parsed.
     """
     ast_cache = {}
+    ast_cache_stats = {"memory_hit": 0, "disk_hit": 0, "miss": 0}
 
     def __init__(self, fn: (types.FunctionType, types.MethodType), parse_method=None) -> None:
         self.fn = fn
@@ -379,25 +460,38 @@ class Parser:
             lines, self.line_offset = inspect.getsourcelines(self.fn)
             original_src = ''.join(lines)
             hexstr = hashlib.sha256(original_src.encode()).hexdigest()
-            tree = Parser.ast_cache.get(hexstr)
-            if not tree:
-                src = dedent(original_src)
-                self.col_offset = \
-                    len(original_src.split('\n')[0]) - len(src.split('\n')[0])
-                logger.debug("get source = %s", src)
-                try:
-                    tree = asttokens.ASTTokens(src, parse=True).tree
-                except IndentationError as idt_err:
-                    idt_err.filename = self.filename
-                    idt_err.lineno = self.line_offset
-                    idt_err.msg = f"There are incorrect indentations in definition or comment of function: " \
-                                 f"'{self.fn.__qualname__}'."
-                    raise idt_err
-                Parser.ast_cache[hexstr] = tree
+            cached = Parser.ast_cache.get(hexstr)
+            if cached:
+                Parser.ast_cache_stats["memory_hit"] += 1
+            else:
+                cached = _load_ast_cache(hexstr)
+                if cached:
+                    Parser.ast_cache_stats["disk_hit"] += 1
+                else:
+                    Parser.ast_cache_stats["miss"] += 1
+                    cached = self._parse_source(original_src)
+                    _dump_ast_cache(hexstr, cached)
+                Parser.ast_cache[hexstr] = cached
+            tree, self.col_offset = cached
         else:
             logger.error("Fn type is invalid")
         return tree
 
+    def _parse_source(self, original_src):
+        """Parse the source of the function, return the ast tree and the column offset of the source."""
+        src = dedent(original_src)
+        col_offset = len(original_src.split('\n')[0]) - len(src.split('\n')[0])
+        logger.debug("get source = %s", src)
+        try:
+            tree = asttokens.ASTTokens(src, parse=True).tree
+        except IndentationError as idt_err:
+            idt_err.filename = self.filename
+            idt_err.lineno = self.line_offset
+            idt_err.msg = f"There are incorrect indentations in definition or comment of function: " \
+                         f"'{self.fn.__qualname__}'."
+            raise idt_err
+        return tree, col_offset
+
     def get_args(self, node):
         """Get the arg of parse object."""
         args = []
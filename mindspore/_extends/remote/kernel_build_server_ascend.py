@@ -16,7 +16,7 @@
 import sys
 from mindspore._extends.remote.kernel_build_server import Messager, get_logger
 from mindspore._extends.parallel_compile.tbe_compiler.tbe_process import create_tbe_parallel_process, op_select_format, check_supported
-from mindspore._extends.parallel_compile.akg_compiler.akg_process import create_akg_parallel_process
+from mindspore._extends.parallel_compile.akg_compiler.akg_process import create_akg_parallel_process, AkgProcess
 
 class TbeBuilder:
     """Tbe building wrapper"""
@@ -51,6 +51,9 @@ class AkgBuilder:
     def compile(self):
         return self.akg_builder.compile()
 
+    def exit(self):
+        AkgProcess.close_pool()
+
 class AscendMessager(Messager):
     '''
     Ascend Messager
@@ -137,6 +140,7 @@ class AscendMessager(Messager):
     def exit(self):
         self.tbe_builder.reset()
         self.tbe_builder.exit()
+        self.akg_builder.exit()
         get_logger().info('[TRACE]', 'Ascend Messager Exit...')
         exit()
 
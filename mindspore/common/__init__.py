@@ -14,7 +14,7 @@
 # ============================================================================
 """Top-level reference to dtype of common module."""
 from . import dtype
-from .api import ms_function
+from .api import ms_function, get_compile_cache_info
 from .dtype import *
 from .parameter import Parameter, ParameterTuple
 from .tensor import MetaTensor, Tensor, RowTensor, SparseTensor
@@ -24,7 +24,7 @@ from .seed import set_seed, get_seed
 __all__ = dtype.__all__
 __all__.extend([
     "MetaTensor", "Tensor", "RowTensor", "SparseTensor",  # tensor
-    'ms_function',  # api
+    'ms_function', 'get_compile_cache_info',  # api
     'Parameter', 'ParameterTuple',  # parameter
     "dtype",
     "set_seed", "get_seed"  # random seed
@@ -15,6 +15,7 @@
 # limitations under the License.
 # ============================================================================
 """Providing interface methods."""
+import time
 import types
 from collections import OrderedDict
 from functools import wraps
@@ -28,8 +29,83 @@ from ..parallel._ps_context import _is_role_pserver
 from ..parallel._utils import _get_device_num, _get_global_rank, _need_to_full, _check_full_batch, _to_full_tensor, \
     _get_parameter_broadcast
 
+
+class _CompileCache:
+    """
+    Cache of the phases of the compiled pipelines, with the statistics of the cache.
+
+    When the number of the cached pipelines exceeds the context `compile_cache_size`, the least recently used ones
+    are freed by `Executor_.del_net_res`. Freeing a pipeline also resets the iteration count of dataset sink mode,
+    which the pipelines compiled for dataset sink mode are built and loaded with, so nothing is freed while any of
+    them is cached.
+    """
+
+    def __init__(self):
+        self._phases = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+        _compile_caches.append(self)
+
+    def __len__(self):
+        return len(self._phases)
+
+    def get(self, key):
+        """Get the phase of the pipeline compiled for key, None if it is not cached."""
+        phase = self._phases.get(key)
+        if phase is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._phases.move_to_end(key)
+        return phase
+
+    def add(self, key, phase, dataset_sink=False):
+        """Add the phase of the pipeline compiled for key, and free the least recently used pipelines."""
+        self._phases[key] = phase
+        self._phases.move_to_end(key)
+        if dataset_sink:
+            _dataset_sink_phases.add(phase)
+        max_size = context.get_context("compile_cache_size")
+        # the pipelines are kept with GE, freeing any of them finalizes the GE backend
+        if not max_size or context.get_context("enable_ge"):
+            return
+        if _dataset_sink_phases:
+            logger.debug("The compiled pipelines are not freed while the dataset sink pipelines %r are cached.",
+                         _dataset_sink_phases)
+            return
+        while len(self._phases) > max_size:
+            # all pipelines whose phase contains the evicted phase are freed, which must not include the added one
+            evicted_phase = next((cached_phase for cached_phase in self._phases.values()
+                                  if cached_phase not in phase), None)
+            if evicted_phase is None:
+                break
+            Executor_.get_instance().del_net_res(evicted_phase)
+            for cache in _compile_caches:
+                cache.remove_phases(evicted_phase)
+            self.evictions += 1
+            logger.debug("Free the compiled pipeline %r.", evicted_phase)
+
+    def remove_phases(self, phase):
+        """Remove the phases which contain phase."""
+        for key in [key for key, cached_phase in self._phases.items() if phase in cached_phase]:
+            del self._phases[key]
+        _dataset_sink_phases.difference_update([sink_phase for sink_phase in _dataset_sink_phases
+                                                if phase in sink_phase])
+
+    def info(self):
+        """Get the statistics of the cache."""
+        return {"size": len(self._phases), "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "compile_time": self.compile_time}
+
+
+_compile_caches = []
+# the cached phases compiled for dataset sink mode
+_dataset_sink_phases = set()
+
 # store ms_function class compiled pipeline cache
-ms_compile_cache = {}
+ms_compile_cache = _CompileCache()
 
 BROADCAST_PHASE = "_broadcast_"
 
@@ -175,22 +251,25 @@ class _MindSporeFunction:
 
         key = generate_key(generate_name, dic)
         phase = str(key[1]) + generate_name
-        if key not in ms_compile_cache.keys():
+        cached_phase = ms_compile_cache.get(key)
+        if cached_phase is None:
             is_compile = False
+            start_time = time.perf_counter()
             if self.obj is None:
                 is_compile = self._executor.compile(self.fn, args_list, phase, True)
             else:
                 is_compile = self._executor.compile(self.obj, args_list, phase, True)
+            ms_compile_cache.compile_time += time.perf_counter() - start_time
             if not is_compile:
                 raise RuntimeError("Executor compile failed.")
             if context.get_context("enable_ge"):
                 self.build_data_init_graph(phase)
             # since function can be redefined, we only cache class method pipeline
             if self.obj is not None or self.identify_obj is not None:
-                ms_compile_cache[key] = phase
+                ms_compile_cache.add(key, phase)
             return phase
 
-        return ms_compile_cache[key]
+        return cached_phase
 
     @_wrap_func
     def __call__(self, *args):
@@ -339,7 +418,7 @@ class _Executor:
         # create needed graph by lazy mode
         self.is_init = False
         self._executor = Executor_.get_instance()
-        self.compile_cache = {}
+        self.compile_cache = _CompileCache()
 
     def init_dataset(self, queue_name, dataset_size, batch_size, dataset_types, dataset_shapes,
                      input_indexs, phase='dataset'):
@@ -397,13 +476,14 @@ class _Executor:
             broadcast_params_dict[param_name].set_data(param)
 
     def _set_dataset_mode(self, args_list):
-        """set dataset mode."""
+        """set dataset mode, and return whether it is dataset sink mode."""
         # decide whether to sink based on whether the inputs is virtual or args_list is ()
         if (args_list and isinstance(args_list[0], Tensor) and args_list[0].virtual_flag) or \
                 (args_list is not None and args_list == ()):
             _set_dataset_mode_config('sink')
-        else:
-            _set_dataset_mode_config('normal')
+            return True
+        _set_dataset_mode_config('normal')
+        return False
 
     def compile(self, obj, *args, phase='predict', do_convert=True, auto_parallel_mode=False):
         """
@@ -453,7 +533,7 @@ class _Executor:
             else:
                 phase = obj.phase_prefix + phase + '.' + str(obj.create_time)
 
-            if phase in self.compile_cache.keys():
+            if self.compile_cache.get(phase) is not None:
                 logger.debug("%r graph has existed.", phase)
                 return phase, False
 
@@ -471,7 +551,7 @@ class _Executor:
 
         obj.check_names()
         _check_full_batch()
-        self._set_dataset_mode(args_list)
+        dataset_sink = self._set_dataset_mode(args_list)
 
         is_sink_mode = args and isinstance(args[0], Tensor) and args[0].virtual_flag
         if auto_parallel_mode and _need_to_full() and not is_sink_mode and obj.auto_parallel_compile_and_run():
@@ -481,8 +561,10 @@ class _Executor:
         enable_debug_runtime = context.get_context("enable_debug_runtime")
         enable_ge = context.get_context("enable_ge")
         use_vm = not enable_ge or (enable_debug_runtime and context.get_context("mode") == context.PYNATIVE_MODE)
+        start_time = time.perf_counter()
         result = self._executor.compile(obj, args_list, phase, use_vm)
-        self.compile_cache[phase] = phase
+        self.compile_cache.compile_time += time.perf_counter() - start_time
+        self.compile_cache.add(phase, phase, dataset_sink)
         if not result:
             raise RuntimeError("Executor compile failed.")
         graph = self._executor.get_func_graph(phase)
@@ -594,6 +676,8 @@ class _Executor:
 
     def del_net_res(self, net_id):
         self._executor.del_net_res(net_id)
+        for cache in _compile_caches:
+            cache.remove_phases(net_id)
 
     def _get_func_graph_proto(self, obj, exec_id, ir_type="onnx_ir", use_prefix=False):
         """Get graph proto from pipeline."""
@@ -624,4 +708,24 @@ class _Executor:
 _executor = _Executor()
 _pynative_exec = _PynativeExecutor()
 
-__all__ = ['ms_function']
+
+def get_compile_cache_info():
+    """
+    Gets the statistics of the caches of the compiled graphs.
+
+    The number of the cached graphs is bounded by the context `compile_cache_size`.
+
+    Returns:
+        dict, the statistics of the cache of ms_function with the key "ms_function", and of the cache of Cell with
+        the key "cell". Each is a dict of the number of the cached graphs "size", the numbers of the cache "hits" and
+        "misses", the number of the freed graphs "evictions" and the total compile time in seconds "compile_time".
+
+    Examples:
+        >>> from mindspore import context, get_compile_cache_info
+        >>> context.set_context(compile_cache_size=16)
+        >>> cell_cache_info = get_compile_cache_info()["cell"]
+    """
+    return {"ms_function": ms_compile_cache.info(), "cell": _executor.compile_cache.info()}
+
+
+__all__ = ['ms_function', 'get_compile_cache_info']
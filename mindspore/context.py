@@ -146,6 +146,7 @@ class _Context:
         self._thread_local_info = _ThreadLocalInfo()
         self._context_switches = _ContextSwitchInfo(True)
         self._context_handle = MSContext.get_instance()
+        self._compile_cache_size = 0
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -280,6 +281,18 @@ class _Context:
         """Sets whether to save the network class name in the scope."""
         self._thread_local_info.reserve_class_name_in_scope = reserve_class_name_in_scope
 
+    @property
+    def compile_cache_size(self):
+        """Gets the maximum number of the compiled graphs kept by ms_function and by the executor of Cell."""
+        return self._compile_cache_size
+
+    @compile_cache_size.setter
+    def compile_cache_size(self, compile_cache_size):
+        """Sets the maximum number of the compiled graphs kept, 0 means unlimited."""
+        if compile_cache_size < 0:
+            raise ValueError(f"Compile cache size must be not less than 0, but got {compile_cache_size}")
+        self._compile_cache_size = compile_cache_size
+
     @property
     def enable_ge(self):
         return self._context_handle.get_backend_policy() == 'ge'
@@ -479,7 +492,7 @@ def _check_target_specific_cfgs(device, arg_key):
                  save_dump_path=str, enable_reduce_precision=bool, variable_memory_max_size=str,
                  enable_profiling=bool, profiling_options=str, enable_auto_mixed_precision=bool,
                  enable_graph_kernel=bool, check_bprop=bool, max_device_memory=str, print_file_path=str,
-                 enable_sparse=bool, max_call_depth=int)
+                 enable_sparse=bool, max_call_depth=int, compile_cache_size=int)
 def set_context(**kwargs):
     """
     Sets context for running environment.
@@ -505,14 +518,15 @@ def set_context(**kwargs):
     Common(CPU/GPU/Ascend)       Ascend                       GPU
     ===========================  ===========================  =================
     check_bprop                  enable_auto_mixed_precision  max_device_memory
-    device_id                    enable_dump                  enable_graph_kernel
-    device_target                save_dump_path
-    enable_sparse                enable_graph_kernel
-    max_call_depth               enable_reduce_precision
-    mode                         enable_profiling
-    reserve_class_name_in_scope  profiling_options
-    save_graphs                  variable_memory_max_size
-    save_graphs_path             print_file_path
+    compile_cache_size           enable_dump                  enable_graph_kernel
+    device_id                    save_dump_path
+    device_target                enable_graph_kernel
+    enable_sparse                enable_reduce_precision
+    max_call_depth               enable_profiling
+    mode                         profiling_options
+    reserve_class_name_in_scope  variable_memory_max_size
+    save_graphs                  print_file_path
+    save_graphs_path
     ===========================  ===========================  =================
 
     Args:
@@ -555,6 +569,10 @@ def set_context(**kwargs):
             suffix to the file. Default: ''.
         enable_sparse (bool): Whether to enable sparsity feature. Default: False.
         max_call_depth(int): Specify the maximum depth of function call. Default: 1000.
+        compile_cache_size (int): The maximum number of the compiled graphs kept by ms_function and by the executor
+            of Cell, the least recently used graphs are freed when it is exceeded. No graph is freed while a graph
+            compiled for dataset sink mode is kept, since freeing a graph resets the iteration count of dataset sink
+            mode. It is not supported with the GE backend. 0 means unlimited. Default: 0.
 
     Raises:
         ValueError: If input key is not an attribute in context.
@@ -576,6 +594,7 @@ def set_context(**kwargs):
         >>> context.set_context(max_device_memory="3.5GB")
         >>> context.set_context(print_file_path="print.pb")
         >>> context.set_context(max_call_depth=80)
+        >>> context.set_context(compile_cache_size=16)
     """
     ctx = _context()
     # set device target first
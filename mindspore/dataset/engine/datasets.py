@@ -43,6 +43,7 @@ from mindspore.parallel._ps_context import _is_role_pserver, _is_role_sched
 import mindspore.dataset.transforms.py_transforms as py_transforms
 
 from . import samplers
+from .queue import _SharedQueue
 from .iterators import DictIterator, TupleIterator, DummyIterator, check_iterator_cleanup, _set_iterator_cleanup, \
     ITERATORS_LIST, _unset_iterator_cleanup
 from .validators import check_batch, check_shuffle, check_map, check_filter, check_repeat, check_skip, check_zip, \
@@ -3333,6 +3334,10 @@ def _generator_fn(generator, num_samples):
             yield val
 
 
+# Number of indices fetched at once from a random accessible dataset which has __getitems__
+_GETITEMS_CHUNK_SIZE = 16
+
+
 def _py_sampler_fn(sampler, num_samples, dataset):
     """
     Generator function wrapper for mappable dataset with Python sampler.
@@ -3359,12 +3364,28 @@ def _cpp_sampler_fn(sampler, dataset):
     Generator function wrapper for mappable dataset with cpp sampler.
     """
     indices = sampler.get_indices()
+    if hasattr(dataset, "__getitems__"):
+        for i in range(0, len(indices), _GETITEMS_CHUNK_SIZE):
+            for val in _getitems(dataset, list(indices[i:i + _GETITEMS_CHUNK_SIZE])):
+                yield tuple([np.array(x, copy=False) for x in val])
+        return
     for i in indices:
         val = dataset[i]
         # convert output tensors to ndarrays
         yield tuple([np.array(x, copy=False) for x in val])
 
 
+def _getitems(dataset, indices):
+    """
+    Fetch the rows of a chunk of indices at once by the __getitems__ of a random accessible dataset.
+    """
+    rows = dataset.__getitems__(indices)
+    if len(rows) != len(indices):
+        raise RuntimeError("__getitems__ of the dataset should return {} rows for {} indices, but got {}."
+                           .format(len(indices), len(indices), len(rows)))
+    return rows
+
+
 def _cpp_sampler_fn_mp(sampler, sample_fn):
     """
     Multiprocessing generator function wrapper for mappable dataset with cpp sampler.
@@ -3401,6 +3422,7 @@ def _fetch_py_sampler_indices(sampler, num_samples):
 def _fill_worker_indices(workers, indices, idx):
     """
     Worker index queue filler, fill worker index queue in round robin order.
+    An item of indices is either an index or a chunk of indices to be fetched by __getitems__.
     """
     num_worker = len(workers)
     while idx < len(indices):
@@ -3417,10 +3439,12 @@ class SamplerFn:
     Multiprocessing or multithread generator function wrapper master process.
     """
 
-    def __init__(self, dataset, num_worker, multi_process):
+    def __init__(self, dataset, num_worker, multi_process, max_rowsize):
         self.workers = []
         self.num_worker = num_worker
         self.multi_process = multi_process
+        # Send chunks of indices to the workers if the dataset fetches rows in batch by __getitems__
+        self.chunk_size = _GETITEMS_CHUNK_SIZE if hasattr(dataset, "__getitems__") else 1
         # Event for end of epoch
         if multi_process is True:
             self.eof = multiprocessing.Event()
@@ -3429,7 +3453,7 @@ class SamplerFn:
         # Create workers
         for _ in range(num_worker):
             if multi_process is True:
-                worker = _GeneratorWorkerMp(dataset, self.eof)
+                worker = _GeneratorWorkerMp(dataset, self.eof, max_rowsize)
                 worker.daemon = True
                 # When multi processes fork a subprocess, the lock of the main process is copied to the subprocess,
                 # which may cause deadlock. Therefore, the subprocess startup is performed in che initialization phase.
@@ -3453,6 +3477,9 @@ class SamplerFn:
             if not w.is_alive():
                 w.start()
 
+        if self.chunk_size > 1:
+            indices = [list(indices[i:i + self.chunk_size]) for i in range(0, len(indices), self.chunk_size)]
+
         # Fill initial index queues
         idx_cursor = 0
         idx_cursor = _fill_worker_indices(self.workers, indices, idx_cursor)
@@ -3472,7 +3499,12 @@ class SamplerFn:
                 raise Exception("Generator worker receives KeyboardInterrupt.")
             if idx_cursor < len(indices):
                 idx_cursor = _fill_worker_indices(self.workers, indices, idx_cursor)
-            yield tuple([np.array(x, copy=False) for x in result])
+            if self.chunk_size > 1:
+                # Unpack the rows of a chunk in order
+                for row in result:
+                    yield tuple([np.array(x, copy=False) for x in row])
+            else:
+                yield tuple([np.array(x, copy=False) for x in result])
 
     def __del__(self):
         self.eof.set()
@@ -3501,7 +3533,10 @@ def _generator_worker_loop(dataset, idx_queue, result_queue, eof):
         if eof.is_set():
             return
         # Fetch data, any exception from __getitem__ will terminate worker and timeout master process
-        result = dataset[idx]
+        if isinstance(idx, list):
+            result = _getitems(dataset, idx)
+        else:
+            result = dataset[idx]
         # Send data, block
         while True:
             try:
@@ -3554,9 +3589,13 @@ class _GeneratorWorkerMp(multiprocessing.Process):
     Worker process for multiprocess Generator.
     """
 
-    def __init__(self, dataset, eof):
+    def __init__(self, dataset, eof, max_rowsize):
         self.idx_queue = multiprocessing.Queue(16)
-        self.res_queue = multiprocessing.Queue(16)
+        if max_rowsize > 0:
+            # numpy.ndarray results are passed through shared memory instead of being pickled
+            self.res_queue = _SharedQueue(16, max_rowsize)
+        else:
+            self.res_queue = multiprocessing.Queue(16)
         super().__init__(target=_generator_worker_loop, args=(dataset, self.idx_queue, self.res_queue, eof))
 
     def put(self, item):
@@ -3631,7 +3670,9 @@ class GeneratorDataset(MappableDataset):
             Iterable source is required to return a tuple of NumPy arrays as a row of the dataset on
             iter(source).next().
             Random accessible source is required to return a tuple of NumPy arrays as a row of the dataset on
-            source[idx].
+            source[idx]. If random accessible source also has `__getitems__(indices)`, which returns the list of rows
+            of a list of indices, the sampled indices are fetched in chunks of 16 through it instead, which is
+            cheaper for sources backed by a database or a memory-mapped file.
         column_names (list[str], optional): List of column names of the dataset (default=None). Users are required to
             provide either column_names or schema.
         column_types (list[mindspore.dtype], optional): List of column data types of the dataset (default=None).
@@ -3651,6 +3692,10 @@ class GeneratorDataset(MappableDataset):
             when num_shards is also specified. Random accessible input is required.
         python_multiprocessing (bool, optional): Parallelize Python operations with multiple worker process. This
             option could be beneficial if the Python operation is computational heavy (default=True).
+        max_rowsize (int, optional): Maximum size in MB of the NumPy arrays of a row, or of a chunk of rows fetched
+            by `__getitems__`, which are passed from the worker processes through shared memory instead of being
+            pickled, 0 means pickling all rows. Every worker preallocates 18 blocks of this size. Only used when
+            python_multiprocessing is True (default=6).
 
     Examples:
         >>> import mindspore.dataset as ds
@@ -3692,13 +3737,14 @@ class GeneratorDataset(MappableDataset):
     @check_generatordataset
     def __init__(self, source, column_names=None, column_types=None, schema=None, num_samples=None,
                  num_parallel_workers=1, shuffle=None, sampler=None, num_shards=None, shard_id=None,
-                 python_multiprocessing=True):
+                 python_multiprocessing=True, max_rowsize=6):
         super().__init__(num_parallel_workers=num_parallel_workers)
         self.source = source
         self.sampler = _select_sampler(num_samples, sampler, shuffle, num_shards, shard_id)
         self.num_samples = num_samples
         self.num_shards = num_shards
         self.python_multiprocessing = python_multiprocessing
+        self.max_rowsize = max_rowsize
         self.num_parallel_workers = num_parallel_workers
 
         if column_names is not None and not isinstance(column_names, list):
@@ -3742,13 +3788,15 @@ class GeneratorDataset(MappableDataset):
                 sampler_instance.set_num_rows(len(self.source))
                 sampler_instance.initialize()
                 if new_op.num_parallel_workers > 1:
-                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing)
+                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing,
+                                          self.max_rowsize)
                     new_op.source = (lambda: _cpp_sampler_fn_mp(sampler_instance, sample_fn))
                 else:
                     new_op.source = (lambda: _cpp_sampler_fn(sampler_instance, self.source))
             else:
                 if new_op.num_parallel_workers > 1:
-                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing)
+                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing,
+                                          self.max_rowsize)
                     new_op.source = (lambda: _py_sampler_fn_mp(new_op.sampler, new_op.num_samples, sample_fn))
                 else:
                     new_op.source = (lambda: _py_sampler_fn(new_op.sampler, new_op.num_samples, self.source))
@@ -0,0 +1,132 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Queue which transports the numpy.ndarray of a row through shared memory instead of pickling it.
+"""
+import ctypes
+import multiprocessing
+import multiprocessing.queues
+import numpy as np
+
+from mindspore import log as logger
+
+# Offset alignment of the arrays written into a shared memory segment.
+_SHM_ALIGN = 64
+# Kinds of the descriptors of the packed items.
+_SEQUENCE = 0
+_SHARED = 1
+_PICKLED = 2
+
+
+class _SharedQueue(multiprocessing.queues.Queue):
+    """
+    Multiprocessing queue which copies the numpy.ndarray of a row, or of a list of rows, into a preallocated shared
+    memory segment, only a small descriptor of every array is pickled through the pipe, and the consumer gets views
+    of the segment.
+
+    There are `size` + 2 segments used as a ring buffer: the segment of a row is reused only after the consumer has
+    fetched the next row, so a view returned by get is valid until the next call of get. Arrays of object dtype,
+    other items and the arrays which do not fit in a segment are pickled as usual.
+
+    Args:
+        size (int): Maximum number of rows in the queue.
+        max_rowsize (int): Size of a shared memory segment in MB, the maximum size of the arrays put at a time which
+            are transported through shared memory.
+    """
+
+    def __init__(self, size, max_rowsize):
+        super().__init__(size, ctx=multiprocessing.get_context())
+        self.seg_size = max_rowsize * 1024 * 1024
+        self.num_seg = size + 2
+        self.shm_list = [multiprocessing.RawArray(ctypes.c_uint8, self.seg_size) for _ in range(self.num_seg)]
+        self.seg_pos = 0
+        self.shm_views = None
+        self.warned = False
+
+    def __getstate__(self):
+        return (super().__getstate__(), self.seg_size, self.num_seg, self.shm_list, self.seg_pos)
+
+    def __setstate__(self, state):
+        super().__setstate__(state[0])
+        self.seg_size, self.num_seg, self.shm_list, self.seg_pos = state[1:]
+        self.shm_views = None
+        self.warned = False
+
+    def _get_shm_view(self, seg_pos):
+        """Get the uint8 numpy view of a shared memory segment, the views are created lazily in every process."""
+        if self.shm_views is None:
+            self.shm_views = [np.frombuffer(shm, dtype=np.uint8) for shm in self.shm_list]
+        return self.shm_views[seg_pos]
+
+    def _pack(self, item, shm_view, start_bytes):
+        """
+        Copy the numpy.ndarray in item, a row or a list of rows, into shm_view from start_bytes.
+
+        Returns the picklable descriptor of item and the offset after the copied arrays.
+        """
+        if isinstance(item, (tuple, list)):
+            packed = []
+            for sub_item in item:
+                packed_item, start_bytes = self._pack(sub_item, shm_view, start_bytes)
+                packed.append(packed_item)
+            return (_SEQUENCE, isinstance(item, tuple), packed), start_bytes
+        if isinstance(item, np.ndarray) and item.dtype != np.object_:
+            end_bytes = start_bytes + item.nbytes
+            if end_bytes <= self.seg_size:
+                dest = shm_view[start_bytes:end_bytes].view(item.dtype).reshape(item.shape)
+                dest[...] = item
+                return (_SHARED, item.dtype.str, item.shape, start_bytes), -(-end_bytes // _SHM_ALIGN) * _SHM_ALIGN
+            if not self.warned:
+                logger.warning("The size of a row exceeds max_rowsize {} MB, the arrays which do not fit are "
+                               "pickled instead.".format(self.seg_size // (1024 * 1024)))
+                self.warned = True
+        return (_PICKLED, item), start_bytes
+
+    def _unpack(self, packed, shm_view):
+        """Rebuild the item described by packed, its numpy.ndarray are views of shm_view."""
+        if packed[0] == _SEQUENCE:
+            items = [self._unpack(sub_packed, shm_view) for sub_packed in packed[2]]
+            return tuple(items) if packed[1] else items
+        if packed[0] == _SHARED:
+            dtype = np.dtype(packed[1])
+            shape = packed[2]
+            start_bytes = packed[3]
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            return shm_view[start_bytes:start_bytes + nbytes].view(dtype).reshape(shape)
+        return packed[1]
+
+    def put(self, obj, block=True, timeout=None):
+        """
+        Put a row, or a list of rows, into the queue, its numpy.ndarray are copied into the current shared memory
+        segment.
+
+        Raise queue.Full on timeout like multiprocessing.Queue, the segment is not consumed in that case.
+        """
+        packed, end_bytes = self._pack(obj, self._get_shm_view(self.seg_pos), 0)
+        used_shm = end_bytes > 0
+        # the segment is consumed only when the row is really put
+        super().put((used_shm, packed), block, timeout)
+        if used_shm:
+            self.seg_pos = (self.seg_pos + 1) % self.num_seg
+
+    def get(self, block=True, timeout=None):
+        """
+        Get a row, or a list of rows, from the queue, its numpy.ndarray are views of a shared memory segment.
+        """
+        used_shm, packed = super().get(block, timeout)
+        result = self._unpack(packed, self._get_shm_view(self.seg_pos))
+        if used_shm:
+            self.seg_pos = (self.seg_pos + 1) % self.num_seg
+        return result
@@ -26,7 +26,7 @@ from mindspore._c_expression import typing
 from ..core.validator_helpers import parse_user_args, type_check, type_check_list, check_value, \
     INT32_MAX, check_valid_detype, check_dir, check_file, check_sampler_shuffle_shard_options, \
     validate_dataset_param_value, check_padding_options, check_gnn_list_or_ndarray, check_num_parallel_workers, \
-    check_columns, check_pos_int32, check_valid_str
+    check_columns, check_pos_int32, check_uint32, check_valid_str
 
 from . import datasets
 from . import samplers
@@ -396,6 +396,10 @@ def check_generatordataset(method):
         nreq_param_bool = ["shuffle"]
         validate_dataset_param_value(nreq_param_bool, param_dict, bool)
 
+        max_rowsize = param_dict.get("max_rowsize")
+        if max_rowsize is not None:
+            check_uint32(max_rowsize, "max_rowsize")
+
         num_shards = param_dict.get("num_shards")
         shard_id = param_dict.get("shard_id")
         if (num_shards is None) != (shard_id is None):
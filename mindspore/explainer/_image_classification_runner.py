@@ -13,8 +13,11 @@
 # limitations under the License.
 # ============================================================================
 """Image Classification Runner."""
+import copy
 import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 
 import numpy as np
@@ -107,6 +110,10 @@ class ImageClassificationRunner:
     _DIR_MODE = 0o750
     # datafile's permission
     _FILE_MODE = 0o600
+    # no. of threads saving the image files in background
+    _SAVER_WORKERS = 4
+    # max. no. of image files waiting to be saved, the computation is blocked beyond it
+    _MAX_PENDING_SAVES = 256
 
     def __init__(self,
                  summary_dir,
@@ -134,6 +141,9 @@ class ImageClassificationRunner:
         self._benchmarkers = None
         self._summary_timestamp = None
         self._sample_index = -1
+        self._created_dirs = {}
+        self._saver = None
+        self._pending_saves = deque()
 
         self._full_network = SequentialCell([self._network, activation_fn])
 
@@ -209,10 +219,7 @@ class ImageClassificationRunner:
                                    " It should contains a timestamp after 'summary.' .")
 
             self._save_metadata(summary)
-
-            imageid_labels = self._run_inference(summary)
-            if self._is_saliency_registered:
-                self._run_saliency(summary, imageid_labels)
+            self._run_sample(summary)
 
             print("Finish running and writing. Total time elapsed: {:.3f} s".format(time() - begin))
 
@@ -240,142 +247,124 @@ class ImageClassificationRunner:
 
         print("Finish writing metadata.")
 
-    def _run_inference(self, summary, threshold=0.5):
+    def _run_sample(self, summary):
         """
-        Run inference for the dataset and write the inference related data into summary.
+        Run the inference, explanations and benchmarks in a single pass of the dataset and write them into summary.
+
+        Every batch is fed to the network once for inference, then to all explainers and benchmarkers. The image
+        files are saved by background threads while the following batches are computed.
 
         Args:
+            summary (SummaryRecord): The summary object to store the data.
+        """
+        # every explainer is evaluated by its own copies of the benchmarkers, as they accumulate the results
+        exp_benchmarkers = []
+        for _ in self._explainers or []:
+            benchmarkers = []
+            for bench in self._benchmarkers or []:
+                bench_copy = copy.copy(bench)
+                bench_copy.reset()
+                benchmarkers.append(bench_copy)
+            exp_benchmarkers.append(benchmarkers)
+        need_bboxes = any(isinstance(bench, Localization) for bench in self._benchmarkers or [])
+
+        self._sample_index = 0
+        self._created_dirs.clear()
+        ds.config.set_seed(self._DATASET_SEED)
+        try:
+            with ThreadPoolExecutor(max_workers=self._SAVER_WORKERS) as saver:
+                self._saver = saver
+                for j, next_element in enumerate(self._dataset):
+                    now = time()
+                    inputs, labels, _ = self._unpack_next_element(next_element)
+                    bboxes = self._unpack_next_element(next_element, True)[2] if need_bboxes else None
+                    unions = self._run_inference(inputs, labels, summary)
+                    for exp, benchmarkers in zip(self._explainers or [], exp_benchmarkers):
+                        saliency_dict_lst = self._run_exp_step(inputs, unions, exp, summary)
+                        for bench in benchmarkers:
+                            self._run_exp_benchmark_step(inputs, labels, bboxes, exp, bench, saliency_dict_lst)
+                    self._sample_index += len(labels)
+                    self._spaced_print("Finish running and writing {}-th batch data. Time elapsed: {:.3f} s".format(
+                        j, time() - now), end='')
+                self._wait_saves()
+        finally:
+            self._saver = None
+            self._pending_saves.clear()
+
+        for exp, benchmarkers in zip(self._explainers or [], exp_benchmarkers):
+            if not benchmarkers:
+                continue
+            explain = Explain()
+            for bench in benchmarkers:
+                benchmark = explain.benchmark.add()
+                benchmark.explain_method = exp.__class__.__name__
+                benchmark.benchmark_method = bench.__class__.__name__
+
+                benchmark.total_score = bench.performance
+                if isinstance(bench, LabelSensitiveMetric):
+                    benchmark.label_score.extend(bench.class_performances)
+            summary.add_value('explainer', 'benchmark', explain)
+            summary.record(1)
+
+    def _run_inference(self, inputs, labels, summary, threshold=0.5):
+        """
+        Run inference for a batch and write the inference related data into summary.
+
+        Args:
+            inputs (Tensor): The image data of the batch.
+            labels (list[list[int]]): The ground truth labels of the batch.
             summary (SummaryRecord): The summary object to store the data
             threshold (float): The threshold for prediction.
 
         Returns:
-            dict, The map of sample d to the union of its ground truth and predicted labels.
+            list[list[int]], The union of the ground truth and predicted labels of each sample.
         """
-        sample_id_labels = {}
-        self._sample_index = 0
-        ds.config.set_seed(self._DATASET_SEED)
-        for j, next_element in enumerate(self._dataset):
-            now = time()
-            inputs, labels, _ = self._unpack_next_element(next_element)
-            prob = self._full_network(inputs).asnumpy()
-
-            for idx, inp in enumerate(inputs):
-                gt_labels = labels[idx]
-                gt_probs = [float(prob[idx][i]) for i in gt_labels]
-
-                data_np = _convert_image_format(np.expand_dims(inp.asnumpy(), 0), 'NCHW')
-                original_image = _np_to_image(_normalize(data_np), mode='RGB')
-                original_image_path = self._save_original_image(self._sample_index, original_image)
-
-                predicted_labels = [int(i) for i in (prob[idx] > threshold).nonzero()[0]]
-                predicted_probs = [float(prob[idx][i]) for i in predicted_labels]
-
-                union_labs = list(set(gt_labels + predicted_labels))
-                sample_id_labels[str(self._sample_index)] = union_labs
-
-                explain = Explain()
-                explain.sample_id = self._sample_index
-                explain.image_path = original_image_path
-                summary.add_value("explainer", "sample", explain)
-
-                explain = Explain()
-                explain.sample_id = self._sample_index
-                explain.ground_truth_label.extend(gt_labels)
-                explain.inference.ground_truth_prob.extend(gt_probs)
-                explain.inference.predicted_label.extend(predicted_labels)
-                explain.inference.predicted_prob.extend(predicted_probs)
-
-                summary.add_value("explainer", "inference", explain)
-
-                summary.record(1)
-
-                self._sample_index += 1
-            self._spaced_print("Finish running and writing {}-th batch inference data."
-                               " Time elapsed: {:.3f} s".format(j, time() - now),
-                               end='')
-        return sample_id_labels
-
-    def _run_saliency(self, summary, sample_id_labels):
-        """Run the saliency explanations."""
-        if self._benchmarkers is None or not self._benchmarkers:
-            for exp in self._explainers:
-                start = time()
-                print("Start running and writing explanation data for {}......".format(exp.__class__.__name__))
-                self._sample_index = 0
-                ds.config.set_seed(self._DATASET_SEED)
-                for idx, next_element in enumerate(self._dataset):
-                    now = time()
-                    self._spaced_print("Start running {}-th explanation data for {}......".format(
-                        idx, exp.__class__.__name__), end='')
-                    self._run_exp_step(next_element, exp, sample_id_labels, summary)
-                    self._spaced_print("Finish writing {}-th explanation data for {}. Time elapsed: "
-                                       "{:.3f} s".format(idx, exp.__class__.__name__, time() - now), end='')
-                self._spaced_print(
-                    "Finish running and writing explanation data for {}. Time elapsed: {:.3f} s".format(
-                        exp.__class__.__name__, time() - start))
-        else:
-            for exp in self._explainers:
-                explain = Explain()
-                for bench in self._benchmarkers:
-                    bench.reset()
-                print(f"Start running and writing explanation and "
-                      f"benchmark data for {exp.__class__.__name__}......")
-                self._sample_index = 0
-                start = time()
-                ds.config.set_seed(self._DATASET_SEED)
-                for idx, next_element in enumerate(self._dataset):
-                    now = time()
-                    self._spaced_print("Start running {}-th explanation data for {}......".format(
-                        idx, exp.__class__.__name__), end='')
-                    saliency_dict_lst = self._run_exp_step(next_element, exp, sample_id_labels, summary)
-                    self._spaced_print(
-                        "Finish writing {}-th batch explanation data for {}. Time elapsed: {:.3f} s".format(
-                            idx, exp.__class__.__name__, time() - now), end='')
-                    for bench in self._benchmarkers:
-                        now = time()
-                        self._spaced_print(
-                            "Start running {}-th batch {} data for {}......".format(
-                                idx, bench.__class__.__name__, exp.__class__.__name__), end='')
-                        self._run_exp_benchmark_step(next_element, exp, bench, saliency_dict_lst)
-                        self._spaced_print(
-                            "Finish running {}-th batch {} data for {}. Time elapsed: {:.3f} s".format(
-                                idx, bench.__class__.__name__, exp.__class__.__name__, time() - now), end='')
-
-                for bench in self._benchmarkers:
-                    benchmark = explain.benchmark.add()
-                    benchmark.explain_method = exp.__class__.__name__
-                    benchmark.benchmark_method = bench.__class__.__name__
-
-                    benchmark.total_score = bench.performance
-                    if isinstance(bench, LabelSensitiveMetric):
-                        benchmark.label_score.extend(bench.class_performances)
-
-                self._spaced_print("Finish running and writing explanation and benchmark data for {}. "
-                                   "Time elapsed: {:.3f} s".format(exp.__class__.__name__, time() - start))
-                summary.add_value('explainer', 'benchmark', explain)
-                summary.record(1)
-
-    def _run_exp_step(self, next_element, explainer, sample_id_labels, summary):
+        prob = self._full_network(inputs).asnumpy()
+        inputs_np = inputs.asnumpy()
+        unions = []
+        for idx, gt_labels in enumerate(labels):
+            sample_id = self._sample_index + idx
+            gt_probs = [float(prob[idx][i]) for i in gt_labels]
+
+            data_np = _convert_image_format(np.expand_dims(inputs_np[idx], 0), 'NCHW')
+            original_image = _np_to_image(_normalize(data_np), mode='RGB')
+            original_image_path = self._save_original_image(sample_id, original_image)
+
+            predicted_labels = [int(i) for i in (prob[idx] > threshold).nonzero()[0]]
+            predicted_probs = [float(prob[idx][i]) for i in predicted_labels]
+
+            unions.append(list(set(gt_labels + predicted_labels)))
+
+            explain = Explain()
+            explain.sample_id = sample_id
+            explain.image_path = original_image_path
+            summary.add_value("explainer", "sample", explain)
+
+            explain = Explain()
+            explain.sample_id = sample_id
+            explain.ground_truth_label.extend(gt_labels)
+            explain.inference.ground_truth_prob.extend(gt_probs)
+            explain.inference.predicted_label.extend(predicted_labels)
+            explain.inference.predicted_prob.extend(predicted_probs)
+
+            summary.add_value("explainer", "inference", explain)
+
+            summary.record(1)
+        return unions
+
+    def _run_exp_step(self, inputs, unions, explainer, summary):
         """
-        Run the explanation for each step and write explanation results into summary.
+        Run the explanation for a batch and write explanation results into summary.
 
         Args:
-            next_element (Tuple): Data of one step
+            inputs (Tensor): The image data of the batch.
+            unions (list[list[int]]): The union of the ground truth and predicted labels of each sample.
             explainer (_Attribution): An Attribution object to generate saliency maps.
-            sample_id_labels (dict): A dict that maps the sample id and its union labels.
             summary (SummaryRecord): The summary object to store the data
 
         Returns:
             list, List of dict that maps label to its corresponding saliency map.
         """
-        inputs, labels, _ = self._unpack_next_element(next_element)
-        sample_index = self._sample_index
-        unions = []
-        for _ in range(len(labels)):
-            unions_labels = sample_id_labels[str(sample_index)]
-            unions.append(unions_labels)
-            sample_index += 1
-
         batch_unions = self._make_label_batch(unions)
         saliency_dict_lst = []
 
@@ -388,18 +377,20 @@ class ImageClassificationRunner:
                 batch_saliency_full.append(batch_saliency)
             concat = ms.ops.operations.Concat(1)
             batch_saliency_full = concat(tuple(batch_saliency_full))
+        # the saliency maps of the batch are fetched from device at once
+        batch_saliency_full = batch_saliency_full.asnumpy()
 
         for idx, union in enumerate(unions):
+            sample_id = self._sample_index + idx
             saliency_dict = {}
             explain = Explain()
-            explain.sample_id = self._sample_index
+            explain.sample_id = sample_id
             for k, lab in enumerate(union):
-                saliency = batch_saliency_full[idx:idx + 1, k:k + 1]
-                saliency_dict[lab] = saliency
+                saliency_np = batch_saliency_full[idx:idx + 1, k:k + 1]
+                saliency_dict[lab] = ms.Tensor(saliency_np)
 
-                saliency_np = _normalize(saliency.asnumpy().squeeze())
-                saliency_image = _np_to_image(saliency_np, mode='L')
-                heatmap_path = self._save_heatmap(explainer.__class__.__name__, lab, self._sample_index, saliency_image)
+                saliency_image = _np_to_image(_normalize(saliency_np.squeeze()), mode='L')
+                heatmap_path = self._save_heatmap(explainer.__class__.__name__, lab, sample_id, saliency_image)
 
                 explanation = explain.explanation.add()
                 explanation.explain_method = explainer.__class__.__name__
@@ -409,13 +400,12 @@ class ImageClassificationRunner:
             summary.add_value("explainer", "explanation", explain)
             summary.record(1)
 
-            self._sample_index += 1
             saliency_dict_lst.append(saliency_dict)
         return saliency_dict_lst
 
-    def _run_exp_benchmark_step(self, next_element, explainer, benchmarker, saliency_dict_lst):
-        """Run the explanation and evaluation for each step and write explanation results into summary."""
-        inputs, labels, _ = self._unpack_next_element(next_element)
+    @staticmethod
+    def _run_exp_benchmark_step(inputs, labels, bboxes, explainer, benchmarker, saliency_dict_lst):
+        """Run the evaluation of the explanation for a batch."""
         for idx, inp in enumerate(inputs):
             inp = _EXPAND_DIMS(inp, 0)
             if isinstance(benchmarker, LabelAgnosticMetric):
@@ -425,7 +415,6 @@ class ImageClassificationRunner:
                 saliency_dict = saliency_dict_lst[idx]
                 for label, saliency in saliency_dict.items():
                     if isinstance(benchmarker, Localization):
-                        _, _, bboxes = self._unpack_next_element(next_element, True)
                         if label in labels[idx]:
                             res = benchmarker.evaluate(explainer, inp, targets=label, mask=bboxes[idx][label],
                                                        saliency=saliency)
@@ -669,8 +658,7 @@ class ImageClassificationRunner:
         abs_dir_path = self._create_subdir(*path_tokens)
         filename = f"{sample_id}.jpg"
         save_path = os.path.join(abs_dir_path, filename)
-        image.save(save_path)
-        os.chmod(save_path, self._FILE_MODE)
+        self._save_image(image, save_path)
         return os.path.join(*path_tokens[1:], filename)
 
     def _save_heatmap(self, explain_method, class_id, sample_id, image):
@@ -685,12 +673,33 @@ class ImageClassificationRunner:
         abs_dir_path = self._create_subdir(*path_tokens)
         filename = f"{sample_id}_{class_id}.jpg"
         save_path = os.path.join(abs_dir_path, filename)
-        image.save(save_path, optimize=True)
-        os.chmod(save_path, self._FILE_MODE)
+        self._save_image(image, save_path, optimize=True)
         return os.path.join(*path_tokens[1:], filename)
 
+    def _save_image(self, image, save_path, **kwargs):
+        """Save an image file, by the background threads when they are running."""
+        if self._saver is None:
+            self._save_image_file(image, save_path, **kwargs)
+            return
+        while len(self._pending_saves) >= self._MAX_PENDING_SAVES:
+            self._pending_saves.popleft().result()
+        self._pending_saves.append(self._saver.submit(self._save_image_file, image, save_path, **kwargs))
+
+    def _wait_saves(self):
+        """Wait for the image files saved by the background threads, raise the error of any failed saving."""
+        while self._pending_saves:
+            self._pending_saves.popleft().result()
+
+    @classmethod
+    def _save_image_file(cls, image, save_path, **kwargs):
+        """Save an image file and set its permission."""
+        image.save(save_path, **kwargs)
+        os.chmod(save_path, cls._FILE_MODE)
+
     def _create_subdir(self, *args):
         """Recursively create subdirectories."""
+        if args in self._created_dirs:
+            return self._created_dirs[args]
         abs_path = None
         for token in args:
             if abs_path is None:
@@ -704,6 +713,7 @@ class ImageClassificationRunner:
                 os.chmod(abs_path, mode=self._DIR_MODE)
             except FileExistsError:
                 pass
+        self._created_dirs[args] = abs_path
         return abs_path
 
     @classmethod
@@ -112,7 +112,7 @@ class LabelAgnosticMetric(AttributionMetric):
 
     def reset(self):
         """Reset global results."""
-        self._global_results.clear()
+        self._global_results = []
 
     def _check_evaluate_param(self, explainer, inputs):
         """Check the evaluate parameters."""
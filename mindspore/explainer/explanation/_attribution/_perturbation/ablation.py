@@ -142,9 +142,7 @@ class AblationWithSaliency(Ablation):
             mask (np.ndarray): boolen mask for generate perturbations.
         """
 
-        batch_size = saliency.shape[0]
         has_channel = num_channels is not None
-        num_channels = 1 if num_channels is None else num_channels
 
         if has_channel:
             saliency = saliency.mean(axis=1)
@@ -153,21 +151,23 @@ class AblationWithSaliency(Ablation):
 
         pixel_per_step, num_perturbations = self._check_and_format_perturb_param(num_pixels)
 
-        masks = np.zeros((batch_size, num_perturbations, num_channels, saliency_rank.shape[1], saliency_rank.shape[2]),
-                         dtype=np.bool)
+        # The j-th perturbation covers the ranks in [j * pixel_per_step, (j + 1) * pixel_per_step), except the first
+        # rank of the range when the perturbations are not accumulated and j > 0.
+        pixel_step = saliency_rank // pixel_per_step if pixel_per_step else np.full_like(saliency_rank, -1)
+        pixel_step[pixel_step >= num_perturbations] = -1
+        if not self._is_accumulate and pixel_per_step:
+            pixel_step[(saliency_rank % pixel_per_step == 0) & (pixel_step > 0)] = -1
 
-        # If the perturbation is added accumulately, the factor should be 0 to preserve the low bound of indexing.
-        factor = 0 if self._is_accumulate else 1
-
-        for i in range(batch_size):
-            low_bound = 0
-            up_bound = low_bound + pixel_per_step
-            for j in range(num_perturbations):
-                masks[i, j, :, ((saliency_rank[i] >= low_bound) & (saliency_rank[i] < up_bound))] = True
-                low_bound = up_bound + factor
-                up_bound += pixel_per_step
-
-        masks = masks if has_channel else np.squeeze(masks, axis=2)
+        # every pixel belongs to at most one perturbation, the masks are filled by a single scatter
+        batch_idx, row_idx, col_idx = np.nonzero(pixel_step >= 0)
+        step_idx = pixel_step[batch_idx, row_idx, col_idx]
+        if has_channel:
+            masks = np.zeros((saliency_rank.shape[0], num_perturbations, num_channels) + saliency_rank.shape[1:],
+                             dtype=bool)
+            masks[batch_idx, step_idx, :, row_idx, col_idx] = True
+        else:
+            masks = np.zeros((saliency_rank.shape[0], num_perturbations) + saliency_rank.shape[1:], dtype=bool)
+            masks[batch_idx, step_idx, row_idx, col_idx] = True
         return masks
 
     def _check_and_format_perturb_param(self, num_pixels):
@@ -108,15 +108,12 @@ class Occlusion(PerturbationAttribution):
 
         total_attribution = np.zeros_like(inputs_np)
         weights = np.ones_like(inputs_np)
-        masks = Occlusion._generate_masks(inputs_np, window_size, strides)
-        num_perturbations = masks.shape[1]
         reference = self._get_replacement(inputs_np)
 
-        count = 0
-        while count < num_perturbations:
-            ith_masks = masks[:, count:min(count+self._perturbation_per_eval, num_perturbations)]
-            actual_num_eval = ith_masks.shape[1]
+        for mask in Occlusion._generate_masks(inputs_np, window_size, strides, self._perturbation_per_eval):
+            actual_num_eval = mask.shape[0]
             num_samples = batch_size * actual_num_eval
+            ith_masks = np.broadcast_to(mask, (batch_size,) + mask.shape)
             occluded_inputs = self._ablation(inputs_np, reference, ith_masks)
             occluded_inputs = occluded_inputs.reshape((-1, *inputs_np.shape[1:]))
             targets_repeat = np.repeat(targets_np, repeats=actual_num_eval, axis=0)
@@ -124,10 +121,9 @@ class Occlusion(PerturbationAttribution):
                 ms.Tensor(occluded_inputs, ms.float32)).asnumpy()[np.arange(num_samples), targets_repeat]
             original_outputs_repeat = np.repeat(original_outputs, repeats=actual_num_eval, axis=0)
             outputs_diff = original_outputs_repeat - occluded_outputs
-            total_attribution += (
-                outputs_diff.reshape(ith_masks.shape[:2] + (1,) * (len(masks.shape) - 2)) * ith_masks).sum(axis=1)
-            weights += ith_masks.sum(axis=1)
-            count += actual_num_eval
+            # the masks are shared by the samples, the differences are summed over the perturbations at once
+            total_attribution += np.tensordot(outputs_diff.reshape(batch_size, actual_num_eval), mask, axes=1)
+            weights += mask.sum(axis=0)
         attribution = self._aggregation_fn(ms.Tensor(total_attribution / weights, ms.float32))
         return attribution
 
@@ -148,18 +144,21 @@ class Occlusion(PerturbationAttribution):
         return window_size, strides
 
     @staticmethod
-    def _generate_masks(inputs, window_size, strides):
-        """Generate masks to perturb contiguous regions."""
+    def _generate_masks(inputs, window_size, strides, chunk_size):
+        """
+        Generate masks to perturb contiguous regions, yielded in chunks of at most `chunk_size` perturbations.
+
+        The masks are shared by the samples of inputs, a chunk has the shape [num_perturbations, *inputs.shape[1:]].
+        """
         total_dim = np.prod(inputs.shape[1:]).item()
         template = np.arange(total_dim).reshape(inputs.shape[1:])
         indices = _generate_patches(template, window_size, strides)
         num_perturbations = indices.shape[0]
         indices = indices.reshape(num_perturbations, -1)
 
-        mask = np.zeros((num_perturbations, total_dim), dtype=np.bool)
-        for i in range(num_perturbations):
-            mask[i, indices[i]] = True
-        mask = mask.reshape((num_perturbations,) + inputs.shape[1:])
-
-        masks = np.tile(mask, reps=(inputs.shape[0],) + (1,) * len(mask.shape))
-        return masks
+        for start in range(0, num_perturbations, chunk_size):
+            chunk_indices = indices[start:start + chunk_size]
+            num_masks = chunk_indices.shape[0]
+            mask = np.zeros((num_masks, total_dim), dtype=bool)
+            mask[np.arange(num_masks)[:, None], chunk_indices] = True
+            yield mask.reshape((num_masks,) + inputs.shape[1:])
@@ -15,6 +15,8 @@
 """
 This module is to write data into mindrecord.
 """
+import collections
+import multiprocessing
 import os
 import sys
 import threading
@@ -22,6 +24,7 @@ import traceback
 
 import numpy as np
 import mindspore._c_mindrecord as ms
+from mindspore import log as logger
 from .common.exceptions import ParamValueError, MRMUnsupportedSchemaError
 
 SUCCESS = ms.MSRStatus.SUCCESS
@@ -45,6 +48,11 @@ VALUE_TYPE_MAP = {"int": ["int32", "int64"], "float": ["float32", "float64"], "s
 VALID_ATTRIBUTES = ["int32", "int64", "float32", "float64", "string", "bytes"]
 VALID_ARRAY_ATTRIBUTES = ["int32", "int64", "float32", "float64"]
 
+# number of rows the converters write at a time
+CONVERT_BATCH_SIZE = 256
+# the maximum number of parallel workers of the converters by default
+DEFAULT_NUM_PARALLEL_WORKERS = 8
+
 class ExceptionThread(threading.Thread):
     """ class to pass exception"""
     def __init__(self, *args, **kwargs):
@@ -96,6 +104,68 @@ def check_filename(path):
 
     return True
 
+def check_num_parallel_workers(num_parallel_workers):
+    """
+    Check the number of parallel workers of the converters.
+
+    Args:
+        num_parallel_workers (int): the number of worker processes, None means the number of cpus, but at most
+            DEFAULT_NUM_PARALLEL_WORKERS.
+
+    Raises:
+        ValueError: If num_parallel_workers is not a positive int or None.
+
+    Returns:
+        int, the number of worker processes.
+    """
+    if num_parallel_workers is None:
+        return min(DEFAULT_NUM_PARALLEL_WORKERS, os.cpu_count() or 1)
+    if not isinstance(num_parallel_workers, int) or isinstance(num_parallel_workers, bool) \
+            or num_parallel_workers < 1:
+        raise ValueError("The parameter num_parallel_workers must be positive int or None.")
+    return num_parallel_workers
+
+def write_in_parallel(writer, tasks, func, num_parallel_workers):
+    """
+    Write the rows produced from the tasks into MindRecord.
+
+    The tasks are processed by a pool of worker processes, while the rows of the finished tasks are written. At
+    most two tasks per worker are pending at a time and the rows are written in the order of the tasks.
+
+    Args:
+        writer (FileWriter): the writer of the MindRecord files.
+        tasks (iterable): the tasks, e.g. a batch of file names, each of them must be picklable.
+        func (function): a picklable function, func(task) returns the list of rows of the task.
+        num_parallel_workers (int): the number of worker processes, the tasks are processed in the current process
+            if it is 1.
+
+    Returns:
+        int, the number of rows written.
+    """
+    transform_count = 0
+
+    def write_rows(rows):
+        nonlocal transform_count
+        if rows:
+            writer.write_raw_data(rows)
+            transform_count += len(rows)
+            logger.info("transformed {} record...".format(transform_count))
+
+    if num_parallel_workers == 1:
+        for task in tasks:
+            write_rows(func(task))
+        return transform_count
+
+    with multiprocessing.Pool(num_parallel_workers) as pool:
+        pending = collections.deque()
+        for task in tasks:
+            pending.append(pool.apply_async(func, (task,)))
+            if len(pending) >= 2 * num_parallel_workers:
+                write_rows(pending.popleft().get())
+        while pending:
+            write_rows(pending.popleft().get())
+    return transform_count
+
 def populate_data(raw, blob, columns, blob_fields, schema):
     """
     Reconstruct data form raw and blob data.
@@ -131,12 +201,19 @@ def populate_data(raw, blob, columns, blob_fields, schema):
         data_shape = schema[field]['shape'] if 'shape' in schema[field] else []
         if data_shape:
             try:
-                raw[field] = np.reshape(np.frombuffer(blob_data, dtype=data_type), data_shape)
+                # a view of the blob data without copy
+                raw[field] = np.frombuffer(blob_data, dtype=data_type).reshape(data_shape)
             except ValueError:
                 raise MRMUnsupportedSchemaError('Shape in schema is illegal.')
-        else:
+        elif isinstance(blob_data, bytes):
             raw[field] = blob_data
+        else:
+            raw[field] = bytes(blob_data)
 
     for i, blob_field in enumerate(loaded_columns):
-        _render_raw(blob_field, bytes(blob[i]))
+        blob_data = blob[i]
+        # the blob data is copied only if it does not support the buffer protocol, e.g. a list of int
+        if not isinstance(blob_data, (bytes, bytearray, memoryview, np.ndarray)):
+            blob_data = bytes(blob_data)
+        _render_raw(blob_field, blob_data)
     return raw
@@ -154,16 +154,16 @@ class ShardWriter:
         Raises:
             MRMWriteCVError: If failed to write cv type dataset.
         """
-        blob_data = []
+        # the header queries the meta of C++ header, get it once for the batch
+        schema = self._header.schema
+        blob_fields = self._header.blob_fields
+        raw_fields = [field for field in schema.keys() if field not in blob_fields]
+        # slice data to blob data and raw data, the binding copies the memoryviews into its byte vectors directly
+        blob_data = [row_blob for row_blob in self._merge_blobs(data, blob_fields, schema) if row_blob]
         raw_data = []
-        # slice data to blob data and raw data
         for item in data:
-            row_blob = self._merge_blob({field: item[field] for field in self._header.blob_fields})
-            if row_blob:
-                blob_data.append(list(row_blob))
             # filter raw data according to schema
-            row_raw = {field: self._convert_np_types(item[field])
-                       for field in self._header.schema.keys() - self._header.blob_fields if field in item}
+            row_raw = {field: self._convert_np_types(item[field]) for field in raw_fields if field in item}
             if row_raw:
                 raw_data.append(row_raw)
         raw_data = {0: raw_data} if raw_data else {}
@@ -179,31 +179,64 @@ class ShardWriter:
             return val.item()
         return val
 
-    def _merge_blob(self, blob_data):
+    def _merge_blobs(self, data, blob_fields, schema):
         """
-        Merge multiple blob data whose type is bytes or ndarray
+        Merge the blob data whose type is bytes or ndarray of every row.
+
+        When there are several blob fields, every field is prefixed with its length as 8 bytes big endian, the
+        merged blobs of the batch are packed into one preallocated buffer. The blobs are returned as byte
+        memoryviews rather than bytes, as the binding only converts sequences other than bytes and str into
+        byte vectors, and without being copied into lists of Python ints first.
 
         Args:
-           blob_data (dict): Dict of blob data
+           data (list[dict]): List of raw data.
+           blob_fields (list[str]): List of blob fields.
+           schema (dict): Dict of schema.
 
         Returns:
-            bytes, merged blob data
-        """
-        if len(blob_data) == 1:
-            values = [v for v in blob_data.values()]
-            return bytes(values[0])
-        # convert int to bytes
-        def int_to_bytes(x: int) -> bytes:
-            return x.to_bytes(8, 'big')
-        merged = bytes()
-        for field, v in blob_data.items():
-            # convert ndarray to bytes
-            if isinstance(v, np.ndarray):
-                v = v.astype(self._header.schema[field]["type"]).tobytes()
-            merged += int_to_bytes(len(v))
-            merged += v
+            list[memoryview], merged blob data of every row.
+        """
+        if not blob_fields:
+            return []
+        if len(blob_fields) == 1:
+            field = blob_fields[0]
+            return [self._get_blob_bytes(item[field]) for item in data]
+
+        rows = []
+        total_size = 0
+        for item in data:
+            values = []
+            for field in blob_fields:
+                value = item[field]
+                # convert ndarray to bytes, without copy if it is contiguous and of the schema type
+                if isinstance(value, np.ndarray):
+                    value = np.ascontiguousarray(value, dtype=schema[field]["type"]).reshape(-1).view(np.uint8)
+                values.append(value)
+                total_size += 8 + len(value)
+            rows.append(values)
+
+        buffer = bytearray(total_size)
+        view = memoryview(buffer)
+        merged = []
+        offset = 0
+        for values in rows:
+            start = offset
+            for value in values:
+                size = len(value)
+                view[offset:offset + 8] = size.to_bytes(8, 'big')
+                offset += 8
+                view[offset:offset + size] = value
+                offset += size
+            merged.append(view[start:offset])
         return merged
 
+    @staticmethod
+    def _get_blob_bytes(value):
+        """Get the bytes of a blob as a byte memoryview, ndarray is viewed in its own type without copy."""
+        if isinstance(value, np.ndarray):
+            return memoryview(np.ascontiguousarray(value).reshape(-1).view(np.uint8))
+        return memoryview(value).cast('B')
+
     def commit(self):
         """
         Flush data to disk.
@@ -24,7 +24,8 @@ from mindspore import log as logger
 from .cifar100 import Cifar100
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
-from ..shardutils import check_filename, ExceptionThread, SUCCESS
+from ..shardutils import check_filename, check_num_parallel_workers, write_in_parallel, ExceptionThread, \
+    SUCCESS, FAILED, CONVERT_BATCH_SIZE
 
 try:
     cv2 = import_module("cv2")
@@ -40,11 +41,13 @@ class Cifar100ToMR:
     Args:
         source (str): the cifar100 directory to be transformed.
         destination (str): the MindRecord file path to transform into.
+        num_parallel_workers (int, optional): number of worker processes which encode the images,
+            None means the number of cpus, but at most 8 (default=None).
 
     Raises:
-        ValueError: If source or destination is invalid.
+        ValueError: If source, destination or num_parallel_workers is invalid.
     """
-    def __init__(self, source, destination):
+    def __init__(self, source, destination, num_parallel_workers=None):
         check_filename(source)
         self.source = source
 
@@ -64,6 +67,7 @@ class Cifar100ToMR:
 
         check_filename(destination)
         self.destination = destination
+        self.num_parallel_workers = check_num_parallel_workers(num_parallel_workers)
         self.writer = None
 
     def run(self, fields=None):
@@ -96,12 +100,15 @@ class Cifar100ToMR:
         test_coarse_labels = cifar100_data.Test.coarse_labels
         logger.info("test images coarse label: {}".format(coarse_labels.shape))
 
-        data_list = _construct_raw_data(images, fine_labels, coarse_labels)
-        test_data_list = _construct_raw_data(test_images, test_fine_labels, test_coarse_labels)
+        if not cv2:
+            raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
 
-        if _generate_mindrecord(self.destination, data_list, fields, "img_train") != SUCCESS:
+        if _generate_mindrecord(self.destination, _get_images_info(images, fine_labels, coarse_labels), fields,
+                                "img_train", self.num_parallel_workers) != SUCCESS:
             return FAILED
-        if _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test") != SUCCESS:
+        if _generate_mindrecord(self.destination + "_test",
+                                _get_images_info(test_images, test_fine_labels, test_coarse_labels), fields,
+                                "img_test", self.num_parallel_workers) != SUCCESS:
             return FAILED
         return SUCCESS
 
@@ -114,43 +121,57 @@ class Cifar100ToMR:
             raise t.exception
         return t.res
 
-def _construct_raw_data(images, fine_labels, coarse_labels):
+def _get_images_info(images, fine_labels, coarse_labels):
     """
-    Construct raw data from cifar100 data.
+    Split cifar100 data into batches.
 
     Args:
         images (list): image list from cifar100.
         fine_labels (list): fine label list from cifar100.
         coarse_labels (list): coarse label list from cifar100.
 
-    Returns:
-        SUCCESS/FAILED, whether successfully written into MindRecord.
+    Yields:
+        tuple, the index of the first image, the images, the fine labels and the coarse labels of a batch.
+    """
+    for start in range(0, len(images), CONVERT_BATCH_SIZE):
+        end = start + CONVERT_BATCH_SIZE
+        yield start, images[start:end], fine_labels[start:end], coarse_labels[start:end]
+
+def _construct_raw_data(images_info):
     """
-    if not cv2:
-        raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
+    Construct raw data from a batch of cifar100 data.
 
+    Args:
+        images_info (tuple): the index of the first image, the images, the fine labels and the coarse labels of
+            the batch.
+
+    Returns:
+        list[dict], the raw data of the batch.
+    """
+    start, images, fine_labels, coarse_labels = images_info
     raw_data = []
     for i, img in enumerate(images):
         fine_label = np.int(fine_labels[i][0])
         coarse_label = np.int(coarse_labels[i][0])
         _, img = cv2.imencode(".jpeg", img[..., [2, 1, 0]])
-        row_data = {"id": int(i),
+        row_data = {"id": int(start + i),
                     "data": img.tobytes(),
                     "fine_label": int(fine_label),
                     "coarse_label": int(coarse_label)}
         raw_data.append(row_data)
     return raw_data
 
-def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
+def _generate_mindrecord(file_name, images_info, fields, schema_desc, num_parallel_workers):
     """
-    Generate MindRecord file from raw data.
+    Generate MindRecord file from cifar100 data, the images are encoded in parallel.
 
     Args:
         file_name (str): File name of MindRecord File.
+        images_info (iterable): batches of cifar100 data.
         fields (list[str]): Fields would be set as index which
           could not belong to blob fields and type could not be 'array' or 'bytes'.
-        raw_data (dict): Dict of raw data.
         schema_desc (str): String of schema description.
+        num_parallel_workers (int): Number of worker processes which encode the images.
 
     Returns:
         SUCCESS/FAILED, whether successfully written into MindRecord.
@@ -164,5 +185,5 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
     writer.add_schema(schema, schema_desc)
     if fields and isinstance(fields, list):
         writer.add_index(fields)
-    writer.write_raw_data(raw_data)
+    write_in_parallel(writer, images_info, _construct_raw_data, num_parallel_workers)
     return writer.commit()
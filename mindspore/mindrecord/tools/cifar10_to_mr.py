@@ -24,7 +24,8 @@ from mindspore import log as logger
 from .cifar10 import Cifar10
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
-from ..shardutils import check_filename, ExceptionThread, SUCCESS, FAILED
+from ..shardutils import check_filename, check_num_parallel_workers, write_in_parallel, ExceptionThread, \
+    SUCCESS, FAILED, CONVERT_BATCH_SIZE
 try:
     cv2 = import_module("cv2")
 except ModuleNotFoundError:
@@ -39,11 +40,13 @@ class Cifar10ToMR:
     Args:
         source (str): the cifar10 directory to be transformed.
         destination (str): the MindRecord file path to transform into.
+        num_parallel_workers (int, optional): number of worker processes which encode the images,
+            None means the number of cpus, but at most 8 (default=None).
 
     Raises:
-        ValueError: If source or destination is invalid.
+        ValueError: If source, destination or num_parallel_workers is invalid.
     """
-    def __init__(self, source, destination):
+    def __init__(self, source, destination, num_parallel_workers=None):
         check_filename(source)
         self.source = source
 
@@ -63,6 +66,7 @@ class Cifar10ToMR:
 
         check_filename(destination)
         self.destination = destination
+        self.num_parallel_workers = check_num_parallel_workers(num_parallel_workers)
         self.writer = None
 
     def run(self, fields=None):
@@ -91,12 +95,14 @@ class Cifar10ToMR:
         test_labels = cifar10_data.Test.labels
         logger.info("test images label: {}".format(test_labels.shape))
 
-        data_list = _construct_raw_data(images, labels)
-        test_data_list = _construct_raw_data(test_images, test_labels)
+        if not cv2:
+            raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
 
-        if _generate_mindrecord(self.destination, data_list, fields, "img_train") != SUCCESS:
+        if _generate_mindrecord(self.destination, _get_images_info(images, labels), fields, "img_train",
+                                self.num_parallel_workers) != SUCCESS:
             return FAILED
-        if _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test") != SUCCESS:
+        if _generate_mindrecord(self.destination + "_test", _get_images_info(test_images, test_labels), fields,
+                                "img_test", self.num_parallel_workers) != SUCCESS:
             return FAILED
         return SUCCESS
 
@@ -109,40 +115,52 @@ class Cifar10ToMR:
             raise t.exception
         return t.res
 
-def _construct_raw_data(images, labels):
+def _get_images_info(images, labels):
     """
-    Construct raw data from cifar10 data.
+    Split cifar10 data into batches.
 
     Args:
         images (list): image list from cifar10.
         labels (list): label list from cifar10.
 
-    Returns:
-        SUCCESS/FAILED, whether successfully written into MindRecord.
+    Yields:
+        tuple, the index of the first image, the images and the labels of a batch.
+    """
+    for start in range(0, len(images), CONVERT_BATCH_SIZE):
+        yield start, images[start:start + CONVERT_BATCH_SIZE], labels[start:start + CONVERT_BATCH_SIZE]
+
+def _construct_raw_data(images_info):
     """
-    if not cv2:
-        raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
+    Construct raw data from a batch of cifar10 data.
 
+    Args:
+        images_info (tuple): the index of the first image, the images and the labels of the batch.
+
+    Returns:
+        list[dict], the raw data of the batch.
+    """
+    start, images, labels = images_info
     raw_data = []
     for i, img in enumerate(images):
         label = np.int(labels[i][0])
         _, img = cv2.imencode(".jpeg", img[..., [2, 1, 0]])
-        row_data = {"id": int(i),
+        row_data = {"id": int(start + i),
                     "data": img.tobytes(),
                     "label": int(label)}
         raw_data.append(row_data)
     return raw_data
 
-def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
+def _generate_mindrecord(file_name, images_info, fields, schema_desc, num_parallel_workers):
     """
-    Generate MindRecord file from raw data.
+    Generate MindRecord file from cifar10 data, the images are encoded in parallel.
 
     Args:
         file_name (str): File name of MindRecord File.
+        images_info (iterable): batches of cifar10 data.
         fields (list[str]): Fields would be set as index which
           could not belong to blob fields and type could not be 'array' or 'bytes'.
-        raw_data (dict): dict of raw data.
         schema_desc (str): String of schema description.
+        num_parallel_workers (int): Number of worker processes which encode the images.
 
     Returns:
         SUCCESS/FAILED, whether successfully written into MindRecord.
@@ -156,5 +174,5 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
     writer.add_schema(schema, schema_desc)
     if fields and isinstance(fields, list):
         writer.add_index(fields)
-    writer.write_raw_data(raw_data)
+    write_in_parallel(writer, images_info, _construct_raw_data, num_parallel_workers)
     return writer.commit()
@@ -20,7 +20,8 @@ import os
 
 from mindspore import log as logger
 from ..filewriter import FileWriter
-from ..shardutils import check_filename, ExceptionThread
+from ..shardutils import check_filename, check_num_parallel_workers, write_in_parallel, ExceptionThread, \
+    CONVERT_BATCH_SIZE
 
 try:
     pd = import_module("pandas")
@@ -29,6 +30,29 @@ except ModuleNotFoundError:
 
 __all__ = ['CsvToMR']
 
+
+def _get_rows_of_csv(df_info):
+    """
+    Get row data from a slice of the csv file.
+
+    Args:
+        df_info (tuple): the DataFrame slice and the list of columns to be read.
+
+    Returns:
+        list[dict], the rows of the slice.
+    """
+    df, columns_list = df_info
+    rows = []
+    for _, r in df.iterrows():
+        row = {}
+        for col in columns_list:
+            if str(df[col].dtype) == 'bool':
+                row[col] = int(r[col])
+            else:
+                row[col] = r[col]
+        rows.append(row)
+    return rows
+
 class CsvToMR:
     """
     A class to transform from csv to MindRecord.
@@ -38,13 +62,15 @@ class CsvToMR:
         destination (str): the MindRecord file path to transform into.
         columns_list(list[str], optional): A list of columns to be read(default=None).
         partition_number (int, optional): partition size (default=1).
+        num_parallel_workers (int, optional): number of worker processes which convert the rows,
+            None means the number of cpus, but at most 8 (default=None).
 
     Raises:
-        ValueError: If `source`, `destination`, `partition_number` is invalid.
+        ValueError: If `source`, `destination`, `partition_number` or `num_parallel_workers` is invalid.
         RuntimeError: If `columns_list` is invalid.
     """
 
-    def __init__(self, source, destination, columns_list=None, partition_number=1):
+    def __init__(self, source, destination, columns_list=None, partition_number=1, num_parallel_workers=None):
         if not pd:
             raise Exception("Module pandas is not found, please use pip install it.")
         if isinstance(source, str):
@@ -69,6 +95,8 @@ class CsvToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        self.num_parallel_workers = check_num_parallel_workers(num_parallel_workers)
+
         self.writer = FileWriter(self.destination, self.partition_number)
 
     def _check_columns(self, columns, columns_name):
@@ -105,16 +133,10 @@ class CsvToMR:
             raise RuntimeError("Failed to generate schema from csv file.")
         return schema
 
-    def _get_row_of_csv(self, df):
-        """Get row data from csv file."""
-        for _, r in df.iterrows():
-            row = {}
-            for col in self.columns_list:
-                if str(df[col].dtype) == 'bool':
-                    row[col] = int(r[col])
-                else:
-                    row[col] = r[col]
-            yield row
+    def _get_slices_of_csv(self, df):
+        """Get the slices of the csv file to be converted by the workers."""
+        for start in range(0, len(df), CONVERT_BATCH_SIZE):
+            yield df.iloc[start:start + CONVERT_BATCH_SIZE], list(self.columns_list)
 
     def run(self):
         """
@@ -145,23 +167,7 @@ class CsvToMR:
         # add the index
         self.writer.add_index(list(self.columns_list))
 
-        csv_iter = self._get_row_of_csv(df)
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(csv_iter.__next__())
-                    transform_count += 1
-                self.writer.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer.write_raw_data(data_list)
-                    logger.info(
-                        "transformed {} record...".format(transform_count))
-                break
+        write_in_parallel(self.writer, self._get_slices_of_csv(df), _get_rows_of_csv, self.num_parallel_workers)
 
         ret = self.writer.commit()
 
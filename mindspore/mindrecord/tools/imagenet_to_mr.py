@@ -21,11 +21,34 @@ import time
 from mindspore import log as logger
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
-from ..shardutils import check_filename, ExceptionThread
+from ..shardutils import check_filename, check_num_parallel_workers, write_in_parallel, ExceptionThread, \
+    CONVERT_BATCH_SIZE
 
 __all__ = ['ImageNetToMR']
 
 
+def _read_imagenet_images(images_info):
+    """
+    Read a batch of imagenet images.
+
+    Args:
+        images_info (list[tuple]): the file name and label of the images.
+
+    Returns:
+        list[dict], imagenet data list which contains dict.
+    """
+    data_list = []
+    for file_name, label in images_info:
+        # get the image data
+        with open(file_name, "rb") as image_file:
+            image_bytes = image_file.read()
+        if not image_bytes:
+            logger.warning("The image file: {} is invalid.".format(file_name))
+            continue
+        data_list.append({"file_name": str(file_name), "label": int(label), "image": image_bytes})
+    return data_list
+
+
 class ImageNetToMR:
     """
     A class to transform from imagenet to MindRecord.
@@ -43,11 +66,13 @@ class ImageNetToMR:
         image_dir (str): image directory contains n02119789, n02100735, n02110185 and n02096294 directory.
         destination (str): the MindRecord file path to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_parallel_workers (int, optional): number of worker processes which read the images,
+            None means the number of cpus, but at most 8 (default=None).
 
     Raises:
-        ValueError: If `map_file`, `image_dir` or `destination` is invalid.
+        ValueError: If `map_file`, `image_dir`, `destination` or `num_parallel_workers` is invalid.
     """
-    def __init__(self, map_file, image_dir, destination, partition_number=1):
+    def __init__(self, map_file, image_dir, destination, partition_number=1, num_parallel_workers=None):
         check_filename(map_file)
         self.map_file = map_file
 
@@ -64,14 +89,16 @@ class ImageNetToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        self.num_parallel_workers = check_num_parallel_workers(num_parallel_workers)
+
         self.writer = FileWriter(self.destination, self.partition_number)
 
-    def _get_imagenet_as_dict(self):
+    def _get_imagenet_images_info(self):
         """
-        Get data from imagenet as dict.
+        Get the file name and label of the imagenet images in batches.
 
         Yields:
-            data (dict of list): imagenet data list which contains dict.
+            list[tuple], the file name and label of a batch of images.
         """
         if not os.path.exists(self.map_file):
             raise IOError("map file {} not exists".format(self.map_file))
@@ -96,26 +123,20 @@ class ImageNetToMR:
         if not dir_paths:
             raise PathNotExistsError("not valid image dir in {}".format(self.image_dir))
 
-        # get the filename, label and image binary as a dict
+        # get the filename and label, the images are read by the workers
+        images_info = []
         for label in dir_paths:
             for item in os.listdir(dir_paths[label]):
                 file_name = os.path.join(dir_paths[label], item)
                 if not item.endswith("JPEG") and not item.endswith("jpg"):
                     logger.warning("{} file is not suffix with JPEG/jpg, skip it.".format(file_name))
                     continue
-                data = {}
-                data["file_name"] = str(file_name)
-                data["label"] = int(label)
-
-                # get the image data
-                image_file = open(file_name, "rb")
-                image_bytes = image_file.read()
-                image_file.close()
-                if not image_bytes:
-                    logger.warning("The image file: {} is invalid.".format(file_name))
-                    continue
-                data["image"] = image_bytes
-                yield data
+                images_info.append((file_name, label))
+                if len(images_info) == CONVERT_BATCH_SIZE:
+                    yield images_info
+                    images_info = []
+        if images_info:
+            yield images_info
 
     def run(self):
         """
@@ -144,22 +165,9 @@ class ImageNetToMR:
         # add the index
         self.writer.add_index(["label", "file_name"])
 
-        imagenet_iter = self._get_imagenet_as_dict()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(imagenet_iter.__next__())
-                    transform_count += 1
-                self.writer.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer.write_raw_data(data_list)
-                    logger.info("transformed {} record...".format(transform_count))
-                break
+        # read the images in parallel, the C++ writer writes every partition in its own thread
+        write_in_parallel(self.writer, self._get_imagenet_images_info(), _read_imagenet_images,
+                          self.num_parallel_workers)
 
         ret = self.writer.commit()
 
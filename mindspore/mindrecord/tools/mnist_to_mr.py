@@ -23,7 +23,8 @@ import numpy as np
 
 from mindspore import log as logger
 from ..filewriter import FileWriter
-from ..shardutils import check_filename, ExceptionThread, SUCCESS, FAILED
+from ..shardutils import check_filename, check_num_parallel_workers, write_in_parallel, ExceptionThread, \
+    SUCCESS, FAILED, CONVERT_BATCH_SIZE
 
 try:
     cv2 = import_module("cv2")
@@ -32,6 +33,24 @@ except ModuleNotFoundError:
 
 __all__ = ['MnistToMR']
 
+
+def _encode_mnist_images(images_info):
+    """
+    Encode a batch of mnist images to jpeg.
+
+    Args:
+        images_info (tuple): the images and their labels.
+
+    Returns:
+        list[dict], mnist data list which contains dict.
+    """
+    images, labels = images_info
+    data_list = []
+    for data, label in zip(images, labels):
+        _, img = cv2.imencode(".jpeg", data)
+        data_list.append({"label": int(label), "data": img.tobytes()})
+    return data_list
+
 class MnistToMR:
     """
     A class to transform from Mnist to MindRecord.
@@ -42,12 +61,14 @@ class MnistToMR:
                       and train-labels-idx1-ubyte.gz.
         destination (str): the MindRecord file directory to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_parallel_workers (int, optional): number of worker processes which encode the images,
+            None means the number of cpus, but at most 8 (default=None).
 
     Raises:
-        ValueError: If `source`, `destination`, `partition_number` is invalid.
+        ValueError: If `source`, `destination`, `partition_number` or `num_parallel_workers` is invalid.
     """
 
-    def __init__(self, source, destination, partition_number=1):
+    def __init__(self, source, destination, partition_number=1, num_parallel_workers=None):
         self.image_size = 28
         self.num_channels = 1
 
@@ -72,6 +93,8 @@ class MnistToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        self.num_parallel_workers = check_num_parallel_workers(num_parallel_workers)
+
         self.writer_train = FileWriter("{}_train.mindrecord".format(destination), self.partition_number)
         self.writer_test = FileWriter("{}_test.mindrecord".format(destination), self.partition_number)
 
@@ -96,29 +119,27 @@ class MnistToMR:
 
     def _mnist_train_iterator(self):
         """
-        get data from mnist train data and label file.
+        get data from mnist train data and label file in batches.
 
         Yields:
-            data (dict of list): mnist data list which contains dict.
+            tuple, the images and labels of a batch.
         """
         train_data = self._extract_images(self.train_data_filename_)
         train_labels = self._extract_labels(self.train_labels_filename_)
-        for data, label in zip(train_data, train_labels):
-            _, img = cv2.imencode(".jpeg", data)
-            yield {"label": int(label), "data": img.tobytes()}
+        for start in range(0, len(train_data), CONVERT_BATCH_SIZE):
+            yield train_data[start:start + CONVERT_BATCH_SIZE], train_labels[start:start + CONVERT_BATCH_SIZE]
 
     def _mnist_test_iterator(self):
         """
-        get data from mnist test data and label file.
+        get data from mnist test data and label file in batches.
 
         Yields:
-            data (dict of list): mnist data list which contains dict.
+            tuple, the images and labels of a batch.
         """
         test_data = self._extract_images(self.test_data_filename_)
         test_labels = self._extract_labels(self.test_labels_filename_)
-        for data, label in zip(test_data, test_labels):
-            _, img = cv2.imencode(".jpeg", data)
-            yield {"label": int(label), "data": img.tobytes()}
+        for start in range(0, len(test_data), CONVERT_BATCH_SIZE):
+            yield test_data[start:start + CONVERT_BATCH_SIZE], test_labels[start:start + CONVERT_BATCH_SIZE]
 
     def _transform_train(self):
         """
@@ -142,22 +163,8 @@ class MnistToMR:
         # add the index
         self.writer_train.add_index(["label"])
 
-        train_iter = self._mnist_train_iterator()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(train_iter.__next__())
-                    transform_count += 1
-                self.writer_train.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer_train.write_raw_data(data_list)
-                    logger.info("transformed {} record...".format(transform_count))
-                break
+        write_in_parallel(self.writer_train, self._mnist_train_iterator(), _encode_mnist_images,
+                          self.num_parallel_workers)
 
         ret = self.writer_train.commit()
 
@@ -191,22 +198,8 @@ class MnistToMR:
         # add the index
         self.writer_test.add_index(["label"])
 
-        train_iter = self._mnist_test_iterator()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(train_iter.__next__())
-                    transform_count += 1
-                self.writer_test.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer_test.write_raw_data(data_list)
-                    logger.info("transformed {} record...".format(transform_count))
-                break
+        write_in_parallel(self.writer_test, self._mnist_test_iterator(), _encode_mnist_images,
+                          self.num_parallel_workers)
 
         ret = self.writer_test.commit()
 
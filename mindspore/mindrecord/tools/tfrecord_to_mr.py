@@ -21,7 +21,7 @@ import numpy as np
 
 from mindspore import log as logger
 from ..filewriter import FileWriter
-from ..shardutils import check_filename, ExceptionThread
+from ..shardutils import check_filename, check_num_parallel_workers, ExceptionThread, CONVERT_BATCH_SIZE
 
 try:
     tf = import_module("tensorflow")    # just used to convert tfrecord to mindrecord
@@ -114,12 +114,14 @@ class TFRecordToMR:
                                         "yyyy": tf.io.VarLenFeature(tf.int64)}, \
                             "sequence": {"zzzz": tf.io.FixedLenSequenceFeature([], tf.float32)}}
         bytes_fields (list, optional): the bytes fields which are in `feature_dict` and can be images bytes.
+        num_parallel_workers (int, optional): number of records parsed in parallel by tensorflow,
+            None means the number of cpus, but at most 8 (default=None).
 
     Raises:
         ValueError: If parameter is invalid.
         Exception: when tensorflow module is not found or version is not correct.
     """
-    def __init__(self, source, destination, feature_dict, bytes_fields=None):
+    def __init__(self, source, destination, feature_dict, bytes_fields=None, num_parallel_workers=None):
         if not tf:
             raise Exception("Module tensorflow is not found, please use pip install it.")
 
@@ -136,6 +138,7 @@ class TFRecordToMR:
 
         self.source = source
         self.destination = destination
+        self.num_parallel_workers = check_num_parallel_workers(num_parallel_workers)
 
         if feature_dict is None or not isinstance(feature_dict, dict):
             raise ValueError("Parameter feature_dict is None or not dict.")
@@ -237,7 +240,9 @@ class TFRecordToMR:
         This function is for old version tensorflow whose version number < 2.1.0
         """
         dataset = tf.data.TFRecordDataset(self.source)
-        dataset = dataset.map(self._parse_record)
+        # parse the records in parallel and ahead of the conversion
+        dataset = dataset.map(self._parse_record, num_parallel_calls=self.num_parallel_workers)
+        dataset = dataset.prefetch(CONVERT_BATCH_SIZE)
         iterator = dataset.make_one_shot_iterator()
         with tf.Session() as sess:
             while True:
@@ -266,7 +271,9 @@ class TFRecordToMR:
     def tfrecord_iterator(self):
         """Yield a dictionary whose keys are fields in schema."""
         dataset = tf.data.TFRecordDataset(self.source)
-        dataset = dataset.map(self._parse_record)
+        # parse the records in parallel and ahead of the conversion
+        dataset = dataset.map(self._parse_record, num_parallel_calls=self.num_parallel_workers)
+        dataset = dataset.prefetch(CONVERT_BATCH_SIZE)
         iterator = dataset.__iter__()
         while True:
             try:
@@ -305,7 +312,7 @@ class TFRecordToMR:
             tf_iter = self.tfrecord_iterator_oldversion()
         else:
             tf_iter = self.tfrecord_iterator()
-        batch_size = 256
+        batch_size = CONVERT_BATCH_SIZE
         transform_count = 0
         while True:
             data_list = []
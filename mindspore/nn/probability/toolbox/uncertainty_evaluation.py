@@ -15,7 +15,6 @@
 """Toolbox for Uncertainty Evaluation."""
 from copy import deepcopy
 
-import numpy as np
 from mindspore._checkparam import Validator
 from mindspore.ops import composite as C
 from mindspore.ops import operations as P
@@ -52,6 +51,11 @@ class UncertaintyEvaluation:
                         and ale_uncer_model_path must not be None. If false, the model to evaluate will be loaded from
                         the the path of the uncertainty model; if the path is not given , it will not save or load the
                         uncertainty model. Default: False.
+        mc_per_eval (int): The number of Monte-Carlo samples of the epistemic uncertainty drawn by a single run of
+                        the dropout model, the data samples are tiled that many times along the batch axis. A larger
+                        number reduces the runs and device synchronizations at the cost of device memory. When the
+                        number of Monte-Carlo samples, 10, is not a multiple of it, the last run draws fewer samples,
+                        and in graph mode it compiles a second graph for its smaller batch. Default: 1.
 
     Supported Platforms:
         ``Ascend`` ``GPU``
@@ -83,7 +87,7 @@ class UncertaintyEvaluation:
     """
 
     def __init__(self, model, train_dataset, task_type, num_classes=None, epochs=1,
-                 epi_uncer_model_path=None, ale_uncer_model_path=None, save_model=False):
+                 epi_uncer_model_path=None, ale_uncer_model_path=None, save_model=False, mc_per_eval=1):
         self.epi_model = model
         self.ale_model = deepcopy(model)
         self.epi_train_dataset = train_dataset
@@ -93,11 +97,16 @@ class UncertaintyEvaluation:
         self.epi_uncer_model_path = epi_uncer_model_path
         self.ale_uncer_model_path = ale_uncer_model_path
         self.save_model = Validator.check_bool(save_model)
+        self.mc_per_eval = Validator.check_positive_int(mc_per_eval)
         self.epi_uncer_model = None
         self.ale_uncer_model = None
         self.concat = P.Concat(axis=0)
         self.sum = P.ReduceSum()
         self.pow = P.Pow()
+        self.tile = P.Tile()
+        self.reshape = P.Reshape()
+        self.mean = P.ReduceMean(keep_dims=True)
+        self.square = P.Square()
         if not isinstance(model, Cell):
             raise TypeError('The model should be Cell type.')
         if task_type not in ('regression', 'classification'):
@@ -146,17 +155,20 @@ class UncertaintyEvaluation:
         """
         self._get_epistemic_uncertainty_model()
         self.epi_uncer_model.set_train(True)
-        outputs = [None] * mc
-        for i in range(mc):
-            pred = self.epi_uncer_model(eval_data)
-            outputs[i] = pred.asnumpy()
-        if self.task_type == 'classification':
-            outputs = np.stack(outputs, axis=2)
-            epi_uncertainty = outputs.var(axis=2)
-        else:
-            outputs = np.stack(outputs, axis=1)
-            epi_uncertainty = outputs.var(axis=1)
-        epi_uncertainty = np.array(epi_uncertainty)
+        batch_size = eval_data.shape[0]
+        outputs = []
+        for i in range(0, mc, self.mc_per_eval):
+            # the dropout masks differ across the tiled copies, each copy is a sample of the model
+            num_samples = min(self.mc_per_eval, mc - i)
+            data = eval_data
+            if num_samples > 1:
+                data = self.tile(eval_data, (num_samples,) + (1,) * (len(eval_data.shape) - 1))
+            pred = self.epi_uncer_model(data)
+            outputs.append(self.reshape(pred, (num_samples, batch_size) + pred.shape[1:]))
+        # the variance over the samples is reduced on device, only the result is copied to host
+        outputs = self.concat(tuple(outputs)) if len(outputs) > 1 else outputs[0]
+        epi_uncertainty = self.mean(self.square(outputs - self.mean(outputs, 0)), 0)
+        epi_uncertainty = self.reshape(epi_uncertainty, epi_uncertainty.shape[1:]).asnumpy()
         return epi_uncertainty
 
     def _get_aleatoric_uncertainty_model(self):
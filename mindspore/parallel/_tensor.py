@@ -249,6 +249,79 @@ def _load_tensor_by_layout(tensor, layout):
     return Tensor(tensor_slice)
 
 
+def _merge_tensor_slices(tensor_slices, tensor_strategy):
+    """
+    Combine the tensor slices into the whole tensor, every slice is copied once into the preallocated whole tensor.
+
+    The position of a slice in the whole tensor is computed from its coordinate in tensor_strategy, the sizes of the
+    slices may differ along an axis, e.g. axis 0 split unevenly by param_split_shape.
+
+    Args:
+        tensor_slices (list[numpy.ndarray]): The tensor slices in order of slice index.
+        tensor_strategy (list): The split strategy of tensor.
+
+    Returns:
+        numpy.ndarray, the whole tensor.
+
+    Raises:
+        ValueError: The shapes of the slices do not fit together.
+    """
+    dim_len = len(tensor_strategy)
+    if not dim_len:
+        return np.array(tensor_slices[0])
+
+    # the offsets along an axis are given by the slices on that axis through the first slice
+    axis_offsets = []
+    stride = len(tensor_slices)
+    for axis in range(dim_len):
+        stride //= tensor_strategy[axis]
+        offsets = [0]
+        for i in range(tensor_strategy[axis]):
+            offsets.append(offsets[-1] + tensor_slices[i * stride].shape[axis])
+        axis_offsets.append(offsets)
+
+    merged_shape = [offsets[-1] for offsets in axis_offsets] + list(tensor_slices[0].shape[dim_len:])
+    merged_tensor = np.empty(merged_shape, dtype=np.result_type(*tensor_slices))
+    for slice_index, tensor_slice in enumerate(tensor_slices):
+        region = []
+        for axis, coordinate in enumerate(np.unravel_index(slice_index, tensor_strategy)):
+            begin, end = axis_offsets[axis][coordinate], axis_offsets[axis][coordinate + 1]
+            if tensor_slice.shape[axis] != end - begin:
+                raise ValueError(f"The shape {tensor_slice.shape} of the slice {slice_index} does not match the "
+                                 f"other slices in axis {axis}.")
+            region.append(slice(begin, end))
+        merged_tensor[tuple(region)] = tensor_slice
+    return merged_tensor
+
+
+def _merge_device_slices(tensor_slices, dev_mat, tensor_map):
+    """
+    Combine the tensor slices of all the devices by the device matrix and the tensor map.
+
+    Args:
+        tensor_slices (list[numpy.ndarray]): The tensor slices in order of rank, devices may hold the same slice.
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+
+    Returns:
+        numpy.ndarray, the whole tensor.
+    """
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+
+    # get the actual number of slices,as: different devices may load the same slice
+    slice_count = 1
+    for dim in tensor_strategy:
+        slice_count *= dim
+
+    # reorder slices and remove duplicates based on device matrix and tensor_map
+    tensor_slices_new = list(range(slice_count))
+    for i, tensor_slice in enumerate(tensor_slices):
+        slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i)
+        tensor_slices_new[int(slice_index)] = tensor_slice
+
+    return _merge_tensor_slices(tensor_slices_new, tensor_strategy)
+
+
 def _reshape_param_data(param_data, dev_mat, tensor_map):
     """
     Combine param slice by the device matrix and the tensor map, used in model parallel scenario.
@@ -273,34 +346,7 @@ def _reshape_param_data(param_data, dev_mat, tensor_map):
         device_count *= dim
 
     tensor_slices = np.split(param_data.asnumpy(), device_count, axis=0)
-    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
-
-    # get the actual number of slices,as: different devices may load the same slice
-    slice_count = 1
-    for dim in tensor_strategy:
-        slice_count *= dim
-
-    # reorder slices and remove duplicates based on device matrix and tensor_map
-    tensor_slices_new = list(range(slice_count))
-    for i in range(device_count):
-        slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, i)
-        tensor_slices_new[int(slice_index)] = np.array(tensor_slices[i])
-
-    # combine slices to generate complete parameter
-    dim_len = len(tensor_strategy)
-    for i in range(dim_len):
-        ele_count = int(len(tensor_slices_new) / tensor_strategy[dim_len - 1 - i])
-        tensor_slices_new_inner = []
-        for j in range(ele_count):
-            new_tensor = tensor_slices_new[j * tensor_strategy[dim_len - 1 - i]]
-            for l in range(j * tensor_strategy[dim_len - 1 - i] + 1,
-                           (j + 1) * tensor_strategy[dim_len - 1 - i]):
-                new_tensor = np.concatenate((new_tensor, tensor_slices_new[l]), axis=dim_len - 1 - i)
-
-            tensor_slices_new_inner.insert(len(tensor_slices_new_inner), np.array(new_tensor))
-        tensor_slices_new = tensor_slices_new_inner
-
-    return Tensor(tensor_slices_new[0])
+    return Tensor(_merge_device_slices(tensor_slices, dev_mat, tensor_map))
 
 
 def _reshape_param_data_with_weight(param_data, dev_mat, field_size):
@@ -324,15 +370,9 @@ def _reshape_param_data_with_weight(param_data, dev_mat, field_size):
     for dim in dev_mat:
         device_count *= dim
 
-    tensor_slices = np.split(param_data.asnumpy(), device_count, axis=0)
-    tensor_slices_col = []
-    for i in range(len(tensor_slices[0][0])):
-        tensor_slices_new = np.array(tensor_slices[0][:, i]).reshape(field_size, -1)
-        for j in range(1, device_count):
-            tensor_slices_new = np.concatenate((tensor_slices_new,\
-                                   np.array(tensor_slices[j][:, i]).reshape(field_size, -1)), axis=1)
-        tensor_slices_col.append(tensor_slices_new)
-    new_tensor = np.array(tensor_slices_col[0]).reshape(-1, 1)
-    for i in range(1, len(tensor_slices_col)):
-        new_tensor = np.concatenate((new_tensor, np.array(tensor_slices_col[i]).reshape(-1, 1)), axis=1)
-    return Tensor(new_tensor)
+    # every column of a slice holds field_size rows of the column of the whole tensor, the rows of the devices are
+    # interleaved per field
+    param_np = param_data.asnumpy()
+    column_count = param_np.shape[1]
+    new_tensor = param_np.reshape(device_count, field_size, -1, column_count).transpose(1, 0, 2, 3)
+    return Tensor(new_tensor.reshape(-1, column_count))
@@ -14,7 +14,7 @@
 # ============================================================================
 """The parser for hwts log file."""
 import os
-import struct
+import numpy as np
 from mindspore.profiler.common.util import fwrite_format, get_file_join_name
 from mindspore import log as logger
 from mindspore.profiler.common.validator.validate_path import \
@@ -33,6 +33,15 @@ class HWTSLogParser:
     _source_file_target = 'hwts.data'
     _dst_file_title = 'title:45 HWTS data'
     _dst_file_column_title = 'Type           cnt  Core_ID  Block_ID  Task_ID  Cycle_counter   Stream_ID'
+    _log_type = ['Start of task', 'End of task', 'Start of block', 'End of block', 'Block PMU']
+    # The layout of a 64 bytes hwts log record, the syscnt of log type 0-3 and block PMU are at different offsets.
+    _record_dtype = np.dtype([('head', np.uint8), ('core_id', np.uint8), ('reserved', np.uint16),
+                              ('blk_id', np.uint16), ('task_id', np.uint16), ('syscnt', np.uint64),
+                              ('stream_id', np.uint32), ('reserved_1', np.uint32), ('pmu_syscnt', np.uint64),
+                              ('reserved_2', np.void, 32)])
+    _record_size = 64
+    _read_chunk_size = 64 * 1024 * 64
+    _whitespaces = np.frombuffer(b' \t\n\r\x0b\x0c', dtype=np.uint8)
 
     def __init__(self, input_path, output_filename):
         self._input_path = input_path
@@ -64,56 +73,65 @@ class HWTSLogParser:
             bool, whether succeed to analyse hwts log.
         """
 
-        content_format = ['QIIIIIIIIIIII', 'QIIQIIIIIIII', 'IIIIQIIIIIIII']
-        log_type = ['Start of task', 'End of task', 'Start of block', 'End of block', 'Block PMU']
-
-        result_data = ""
-
         self._source_flie_name = validate_and_normalize_path(self._source_flie_name)
-        with open(self._source_flie_name, 'rb') as hwts_data:
-            while True:
-                # read 64 bit data
-                line = hwts_data.read(64)
-                if line:
-                    if not line.strip():
-                        continue
-                else:
-                    break
-                byte_first_four = struct.unpack('BBHHH', line[0:8])
-                # byte_first[0:4] refers to count. byte_first[4] refers to is_warn_res0_0v.
-                # byte_first[5:8] refers to the type of ms.
-                byte_first = bin(byte_first_four[0]).replace('0b', '').zfill(8)
-                ms_type = byte_first[-3:]
-                is_warn_res0_ov = byte_first[4]
-                cnt = int(byte_first[0:4], 2)
-                core_id = byte_first_four[1]
-                blk_id, task_id = byte_first_four[3], byte_first_four[4]
-                if ms_type in ['000', '001', '010']:  # log type 0,1,2
-                    result = struct.unpack(content_format[0], line[8:])
-                    syscnt = result[0]
-                    stream_id = result[1]
-                elif ms_type == '011':  # log type 3
-                    result = struct.unpack(content_format[1], line[8:])
-                    syscnt = result[0]
-                    stream_id = result[1]
-                elif ms_type == '100':  # log type 4
-                    result = struct.unpack(content_format[2], line[8:])
-                    stream_id = result[2]
-                    if is_warn_res0_ov == '0':
-                        syscnt = result[4]
-                    else:
-                        syscnt = None
-                else:
-                    logger.info("Profiling: invalid hwts log record type %s", ms_type)
-                    continue
-
-                if int(task_id) < 25000:
-                    task_id = str(stream_id) + "_" + str(task_id)
-                result_data += ("%-14s %-4s %-8s %-9s %-8s %-15s %s\n" %(log_type[int(ms_type, 2)], cnt, core_id,
-                                                                         blk_id, task_id, syscnt, stream_id))
-
         fwrite_format(self._output_filename, data_source=self._dst_file_title, is_start=True)
         fwrite_format(self._output_filename, data_source=self._dst_file_column_title)
-        fwrite_format(self._output_filename, data_source=result_data)
+        with open(self._source_flie_name, 'rb') as hwts_data, open(self._output_filename, 'a+') as output:
+            while True:
+                content = hwts_data.read(self._read_chunk_size)
+                if not content:
+                    break
+                tail_size = len(content) % self._record_size
+                if tail_size:
+                    if content[-tail_size:].strip():
+                        logger.warning("Profiling: the hwts log file ends with an incomplete record, ignore it.")
+                    content = content[:-tail_size]
+                output.write(self._format_records(content))
+            output.write("\n")
 
         return True
+
+    def _format_records(self, content):
+        """
+        Decode the hwts log records in content with bitwise operations and format them to the output lines.
+
+        Args:
+            content (bytes): The hwts log records, its length is a multiple of the record size.
+
+        Returns:
+            str, the formatted output lines of the records.
+        """
+        raw_records = np.frombuffer(content, dtype=np.uint8).reshape(-1, self._record_size)
+        # the records which only hold whitespaces are padding
+        is_padding = np.isin(raw_records[:, 0], self._whitespaces)
+        if is_padding.any():
+            padding_index = np.flatnonzero(is_padding)
+            is_padding[padding_index] = np.isin(raw_records[padding_index], self._whitespaces).all(axis=1)
+
+        records = np.frombuffer(content, dtype=self._record_dtype)
+        # bits 0-2 of the first byte refer to the log type, bit 3 refers to is_warn_res0_ov and bits 4-7 to count.
+        ms_type = records['head'] & 0x07
+        is_warn_res0_ov = (records['head'] >> 3) & 0x01
+        cnt = records['head'] >> 4
+
+        invalid_types = np.unique(ms_type[(ms_type > 4) & ~is_padding])
+        for invalid_type in invalid_types:
+            logger.info("Profiling: invalid hwts log record type %s", bin(invalid_type)[2:].zfill(3))
+        valid_index = np.flatnonzero((ms_type <= 4) & ~is_padding)
+        if valid_index.size == 0:
+            return ""
+
+        ms_type = ms_type[valid_index]
+        records = records[valid_index]
+        # the syscnt of the block PMU record is only valid when is_warn_res0_ov is 0
+        syscnt = np.where(ms_type == 4, records['pmu_syscnt'], records['syscnt']).tolist()
+        for index in np.flatnonzero((ms_type == 4) & (is_warn_res0_ov[valid_index] == 1)).tolist():
+            syscnt[index] = None
+        stream_id = records['stream_id'].tolist()
+        task_id = records['task_id'].tolist()
+        task_id = [str(stream) + "_" + str(task) if task < 25000 else task for stream, task in zip(stream_id, task_id)]
+
+        return "".join(["%-14s %-4s %-8s %-9s %-8s %-15s %s\n" % line
+                        for line in zip([self._log_type[log_type] for log_type in ms_type.tolist()],
+                                        cnt[valid_index].tolist(), records['core_id'].tolist(),
+                                        records['blk_id'].tolist(), task_id, syscnt, stream_id)])
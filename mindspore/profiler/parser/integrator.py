@@ -14,6 +14,7 @@
 # ============================================================================
 """The integrator for integrating parsed profiling files."""
 import csv
+import gzip
 import json
 import os
 import stat
@@ -492,6 +493,65 @@ class Integrator:
             self._display_col_names_detail.append(self._col_names_detail[5])
 
 
+class _TimelineWriter:
+    """
+    Stream timeline events into a json array file.
+
+    The events are serialized in batches and the written bytes are counted by the writer itself, so the size of
+    the file never needs to be queried while writing.
+
+    Args:
+        file_path (str): The path of the json file.
+        compress (bool): Whether to write a gzip compressed file. Default: False.
+    """
+    _batch_size = 1024
+
+    def __init__(self, file_path, compress=False):
+        self._file_path = file_path
+        if compress:
+            self._file = gzip.open(file_path, 'wt')
+        else:
+            self._file = open(file_path, 'w')
+        self._encode = json.JSONEncoder().encode
+        self._batch = []
+        self._flushed = False
+        self._file.write('[')
+        self.size = 1
+
+    def write(self, event):
+        """
+        Write an event.
+
+        Returns:
+            int, the number of uncompressed bytes written so far, not including the closing bracket.
+        """
+        event_str = self._encode(event)
+        if self.size > 1:
+            self.size += 1
+        self.size += len(event_str)
+        self._batch.append(event_str)
+        if len(self._batch) >= self._batch_size:
+            self._flush()
+        return self.size
+
+    def _flush(self):
+        """Write the serialized events of the current batch."""
+        if not self._batch:
+            return
+        if self._flushed:
+            self._file.write(',')
+        self._file.write(','.join(self._batch))
+        self._batch = []
+        self._flushed = True
+
+    def close(self):
+        """Write the closing bracket and close the file."""
+        self._flush()
+        self._file.write(']')
+        self._file.close()
+        os.chmod(self._file_path, stat.S_IREAD | stat.S_IWRITE)
+
+
 class BaseTimelineGenerator:
     """
     Analyse timeline data from file.
@@ -499,7 +559,9 @@ class BaseTimelineGenerator:
     __col_names__ = ['op_name', 'stream_id', 'start_time', 'duration']
     _output_timeline_data_file_path = 'output_timeline_data_{}.txt'
     _min_cycle_counter_file_path = 'min_cycle_counter_{}.txt'
-    _timeline_meta = []
+    _timeline_list = []
+    _min_cycle_counter = 0
+    _framework_info_dict = {}
     _timeline_summary = {
         'total_time': 0,
         'num_of_streams': 0,
@@ -510,42 +572,83 @@ class BaseTimelineGenerator:
     def _load_timeline_data(self):
         """Load timeline data from file."""
 
-    def _parse_timeline_data(self):
+    def _parse_timeline_data(self, timeline, min_cycle_counter):
         """Parse timeline data."""
 
     def init_timeline(self):
         """Init timeline metadata, adding all collected info."""
 
-    def write_timeline(self, size_limit=SIZE_LIMIT_DEFAULT):
-        """Load data according to the parsed profiling files."""
+    def _iter_timeline_meta(self):
+        """
+        Generate the timeline events from the collected timeline data.
+
+        The events are built one by one while writing, so the whole timeline metadata is never held in memory.
+        """
+        for timeline in self._timeline_list:
+            timeline_item = self._parse_timeline_data(timeline, self._min_cycle_counter)
+            framework_item = self._framework_info_dict.get(timeline_item.get('name'))
+            if framework_item:
+                timeline_item['name'] = framework_item.get('name')
+                timeline_item['args'] = framework_item.get('args')
+            yield timeline_item
+
+    def write_timeline(self, size_limit=SIZE_LIMIT_DEFAULT, compress=False, time_window=None):
+        """
+        Load data according to the parsed profiling files.
+
+        Args:
+            size_limit (int): The maximum number of bytes of the timeline events written. Default: 20MB.
+            compress (bool): Whether to write gzip compressed timeline files. Default: False.
+            time_window (float): If not None, the timeline is split into chunk files, each of which contains the
+                events starting in a time window of this length, in us. Default: None.
+        """
         # Write timeline to file.
         logger.info('Writing timeline file...')
-        self.write_timeline_to_json_by_limitation(size_limit)
+        self.write_timeline_to_json_by_limitation(size_limit, compress, time_window)
         logger.info('Finished file writing!')
 
-    def write_timeline_to_json_by_limitation(self, size_limit):
-        """Write timeline to json by limitation."""
+    def _get_display_file_path(self, chunk_index=None, compress=False):
+        """Get the path of the timeline display file, or of one of its chunk files."""
         display_filename = self._display_filename.format(self._device_id)
+        if chunk_index is not None:
+            file_root, file_ext = os.path.splitext(display_filename)
+            display_filename = '{}_{}{}'.format(file_root, chunk_index, file_ext)
+        if compress:
+            display_filename += '.gz'
         display_file_path = os.path.join(
             self._profiling_dir,
             display_filename
         )
-        display_file_path = validate_and_normalize_path(display_file_path)
+        return validate_and_normalize_path(display_file_path)
 
-        length = len(self._timeline_meta)
+    def write_timeline_to_json_by_limitation(self, size_limit, compress=False, time_window=None):
+        """
+        Write timeline to json by limitation.
+
+        The events are written until the number of written bytes, counted before compression and over all the
+        chunk files, exceeds size_limit. When time_window is set, a new chunk file is started whenever an event
+        starts in a later time window than the current chunk, the events are in start time order.
+        """
+        written_size = 0
+        writer = None
+        chunk_index = None
         try:
-            with open(display_file_path, 'w') as json_file:
-                json_file.write('[')
-                for index, item in enumerate(self._timeline_meta):
-                    json.dump(item, json_file)
-                    file_size = os.path.getsize(display_file_path)
-                    if file_size > size_limit:
-                        break
-                    if index == length - 1:
-                        break
-                    json_file.write(',')
-                json_file.write(']')
-                os.chmod(display_file_path, stat.S_IREAD | stat.S_IWRITE)
+            for timeline_item in self._iter_timeline_meta():
+                if time_window is not None:
+                    event_window = int(timeline_item['ts'] // time_window)
+                    if writer is None or event_window > chunk_index:
+                        if writer is not None:
+                            written_size += writer.size
+                            writer.close()
+                        chunk_index = event_window
+                        writer = _TimelineWriter(self._get_display_file_path(chunk_index, compress), compress)
+                elif writer is None:
+                    writer = _TimelineWriter(self._get_display_file_path(compress=compress), compress)
+                if written_size + writer.write(timeline_item) > size_limit:
+                    break
+            if writer is None:
+                writer = _TimelineWriter(self._get_display_file_path(compress=compress), compress)
+            writer.close()
         except (IOError, OSError) as err:
             logger.error('Error occurred when write timeline display file: %s', err)
             raise ProfilerIOException
@@ -629,13 +732,8 @@ class BaseTimelineGenerator:
             }
             framework_info_dict[op_full_name]['args'].update(op_info)
 
-        # Insert framework info into timeline.
-        for timeline_item in self._timeline_meta:
-            op_full_name = timeline_item.get('name')
-            framework_item = framework_info_dict.get(op_full_name)
-            if framework_item:
-                timeline_item['name'] = framework_item.get('name')
-                timeline_item['args'] = framework_item.get('args')
+        # The framework info is inserted into timeline when the events are generated.
+        self._framework_info_dict = framework_info_dict
         logger.debug('Finished adding framework info into timeline...')
 
 class GpuTimelineGenerator(BaseTimelineGenerator):
@@ -650,7 +748,7 @@ class GpuTimelineGenerator(BaseTimelineGenerator):
     def __init__(self, profiling_dir, device_id):
         self._profiling_dir = profiling_dir
         self._device_id = device_id
-        self._timeline_meta = []
+        self._timeline_list = []
         self._timeline_summary = {
             'total_time': 0,
             'num_of_streams': 0,
@@ -694,12 +792,8 @@ class GpuTimelineGenerator(BaseTimelineGenerator):
             for ix, value in enumerate(timeline[4:]):
                 args_dict[self._activity_keys_list[ix]] = value
             timeline_dict['args'] = args_dict
-        else:
-            # Update total time of operator execution.
-            self._timeline_summary['total_time'] += dur / factor
-            self._timeline_summary['op_exe_times'] += 1
 
-        self._timeline_meta.append(timeline_dict)
+        return timeline_dict
 
     def _load_timeline_data(self):
         """Load timeline data from file."""
@@ -765,13 +859,20 @@ class GpuTimelineGenerator(BaseTimelineGenerator):
         """Init timeline metadata, adding all collected info."""
         timeline_list = self._load_timeline_data()
 
+        # factor to convert the time unit of total time from 1us to 1ms
+        factor = 1000
         # Init a dict for counting the num of streams.
         stream_count_dict = {}
         for timeline in timeline_list:
-            self._parse_timeline_data(timeline, 0)
-            # Updating the collection of streams.
+            # len(timeline) == 4 refers to op data, else activity data.
             if len(timeline) == 4:
+                # Update total time of operator execution.
+                self._timeline_summary['total_time'] += TimelineContainer(timeline).duration / factor
+                self._timeline_summary['op_exe_times'] += 1
+                # Updating the collection of streams.
                 self._update_num_of_streams(timeline, stream_count_dict)
+        # The timeline events are generated while writing.
+        self._timeline_list = timeline_list
 
         # Update timeline summary info
         self._timeline_summary['num_of_streams'] += len(stream_count_dict.keys())
@@ -784,6 +885,9 @@ class AscendTimelineGenerator(BaseTimelineGenerator):
     def __init__(self, profiling_dir, device_id):
         self._profiling_dir = profiling_dir
         self._device_id = device_id
+        self._timeline_list = []
+        self._min_cycle_counter = 0
+        self._framework_info_dict = {}
 
     def _load_timeline_data(self):
         """Load timeline data from file."""
@@ -823,11 +927,9 @@ class AscendTimelineGenerator(BaseTimelineGenerator):
         timeline_dict['dur'] = dur
         if op_meta.pid is None:
             timeline_dict['pid'] = int(self._device_id)
-            # Update total time of operator execution.
-            self._timeline_summary['total_time'] += dur
         else:  # AllReduce and AI CPU pid
             timeline_dict['pid'] = op_meta.pid
-        self._timeline_meta.append(timeline_dict)
+        return timeline_dict
 
     def init_timeline(self, all_reduce_info, framework_info, aicpu_info, min_cycle_counter):
         """
@@ -846,26 +948,34 @@ class AscendTimelineGenerator(BaseTimelineGenerator):
         timeline_list = self._load_timeline_data()
         self._timeline_summary['op_exe_times'] = len(timeline_list)
 
-        # Add AllReduce info to timeline temp list and sort by start time.
+        # Add AllReduce info to timeline temp list.
         if all_reduce_info:
             logger.debug('AllReduce info found. Start adding info into timeline...')
             timeline_list.extend(all_reduce_info)
-            timeline_list.sort(key=lambda x: float(x[2]))
 
-        # Add AI CPU data into timeline temp list and sort by start time.
+        # Add AI CPU data into timeline temp list.
         aicpu_data = aicpu_info.get('info')
         if aicpu_data:
             timeline_list.extend(aicpu_data)
-            timeline_list.sort(key=lambda x: float(x[2]))
             self._timeline_summary['op_exe_times'] += aicpu_info.get('op_exe_times', 0)
             self._timeline_summary['num_of_streams'] += aicpu_info.get('num_of_streams', 0)
             self._timeline_summary['num_of_ops'] += aicpu_info.get('num_of_ops', 0)
             self._timeline_summary['total_time'] += aicpu_info.get('total_time', 0)
 
+        # Sort by start time, the timeline events are generated in this order while writing.
+        if all_reduce_info or aicpu_data:
+            timeline_list.sort(key=lambda x: float(x[2]))
+        self._timeline_list = timeline_list
+        self._min_cycle_counter = min_cycle_counter
+
+        # factor to convert the time unit from 1ms to 1us for timeline display
+        factor = 1000
         # Init a dict for counting the num of streams.
         stream_count_dict = {}
         for timeline in timeline_list:
-            self._parse_timeline_data(timeline, min_cycle_counter)
+            # Update total time of operator execution, AllReduce and AI CPU operators have a pid.
+            if len(timeline) != 5:
+                self._timeline_summary['total_time'] += TimelineContainer(timeline).duration * factor
             # Updating the collection of streams.
             if len(timeline) == 4:
                 self._update_num_of_streams(timeline, stream_count_dict)
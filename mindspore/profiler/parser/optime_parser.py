@@ -15,12 +15,12 @@
 """Op compute time files parser."""
 import os
 import stat
+import numpy as np
 from mindspore.profiler.common.util import fwrite_format
 from mindspore.profiler.common.exceptions.exceptions import ProfilerFileNotFoundException, \
     ProfilerIOException
 from mindspore import log as logger
 from mindspore.profiler.common.validator.validate_path import validate_and_normalize_path
-from mindspore.profiler.parser.container import HWTSContainer
 
 TIMELINE_FILE_COLUMN_TITLE = 'op_name, stream_id, start_time(ms), duration(ms)'
 
@@ -37,6 +37,7 @@ class OPComputeTimeParser:
     _dst_file_title = 'title:op compute time'
     _dst_file_column_title = 'op_name       compute_time(ms) stream_id'
     _dst_file_column_title += '\n------------  ---------------  ---------'
+    _write_chunk_size = 1024 * 1024
 
     def __init__(self, hwts_output_file, output_filename, op_task_info,
                  output_path, device_id):
@@ -50,34 +51,56 @@ class OPComputeTimeParser:
 
     def _get_op_task_id_map(self):
         """
-        Read hwts data file, get the task time info.
+        Read hwts data file, get the task time info of the tasks which belong to an op.
 
         Returns:
-           list: all hwts task time info.
+            dict, the columns of the task time info, with the op names and the task ids encoded as indexes into the
+            lists `op_names` and `task_ids`.
         """
-
-        op_map_result = []
-        hwts_list = []
-
         if not os.path.exists(self._hwts_output_file):
             logger.error('The hwts output file does not exist.')
             raise ProfilerFileNotFoundException('hwts output file')
 
+        op_names = []
+        op_name_codes = {}
+        task_ids = []
+        task_id_codes = {}
+        is_start = []
+        op_codes = []
+        task_codes = []
+        cycle_counters = []
+        stream_ids = []
         with open(self._hwts_output_file, 'r') as data_file:
-            lines = data_file.readlines()
-            for line in lines:
-                if line.startswith("Start of task") or line.startswith("End of task"):
-                    line_split = line.split()
-                    container = HWTSContainer(line_split)
-                    hwts_list.append(container)
-
-        # hwts op map by taskId
-        for hwts in hwts_list:
-            if hwts.task_id in self._op_task_info.keys():
-                hwts.op_name = self._op_task_info[hwts.task_id]
-                op_map_result.append(hwts)
-
-        return op_map_result
+            for line in data_file:
+                if not line.startswith(("Start of task", "End of task")):
+                    continue
+                line_split = line.split()
+                # hwts op map by taskId
+                task_id = line_split[6]
+                op_name = self._op_task_info.get(task_id)
+                if op_name is None:
+                    continue
+                if op_name not in op_name_codes:
+                    op_name_codes[op_name] = len(op_names)
+                    op_names.append(op_name)
+                if task_id not in task_id_codes:
+                    task_id_codes[task_id] = len(task_ids)
+                    task_ids.append(task_id)
+                is_start.append(line_split[0] == "Start")
+                op_codes.append(op_name_codes[op_name])
+                task_codes.append(task_id_codes[task_id])
+                cycle_counters.append(float(line_split[7]))
+                stream_ids.append(line_split[8])
+
+        return {
+            'op_names': op_names,
+            'task_ids': task_ids,
+            'is_start': np.array(is_start, dtype=np.bool_),
+            'op_code': np.array(op_codes, dtype=np.int64),
+            'task_code': np.array(task_codes, dtype=np.int64),
+            'cycle_counter': np.array(cycle_counters, dtype=np.float64),
+            'stream_id': stream_ids
+        }
 
     def execute(self):
         """Execute the parser, compute all op, get op time, and write it to the output file."""
@@ -87,40 +110,23 @@ class OPComputeTimeParser:
 
         # Convert time units from nanoseconds to milliseconds.
         # The unit of the cycle counter is 10 nanoseconds.
-        op_name_time_dict = {}
-        op_name_stream_dict = {}
-        op_name_count_dict = {}
-        op_name_task_dict = {}
-        op_name_start_time = {}
-        self._convert_op_time_unit(
-            tmp_result_data, op_name_time_dict, op_name_stream_dict,
-            op_name_count_dict, op_name_task_dict, op_name_start_time
-        )
+        op_time_data = self._convert_op_time_unit(tmp_result_data)
 
         result_data = ""
         total_time = 0
-        for op_name, time in op_name_time_dict.items():
-            if op_name in op_name_stream_dict.keys():
-                stream_id = op_name_stream_dict[op_name]
-                avg_time = time / op_name_count_dict[op_name]
-                total_time += avg_time
-                result_data += ("%s %s  %s\n" %(op_name, str(avg_time), stream_id))
+        for op_name, time, count, stream_id in zip(op_time_data['op_name'], op_time_data['time'],
+                                                   op_time_data['count'], op_time_data['stream_id']):
+            avg_time = time / count
+            total_time += avg_time
+            result_data += ("%s %s  %s\n" %(op_name, str(avg_time), stream_id))
         result_data += ("total op  %s 0" %(str(total_time)))
 
-        timeline_data = []
-        for op_name, time in op_name_time_dict.items():
-            if op_name in op_name_stream_dict.keys():
-                stream_id = op_name_stream_dict[op_name]
-                start_time_list = op_name_start_time.get(op_name)
-                for (start_time, duration) in start_time_list:
-                    timeline_data.append([op_name, stream_id, start_time, duration])
-
         # Write the metadata of operators into the file,
         # including operator name, average time, and stream id.
         self._write_op_time_into_file(result_data)
         # Write the timeline data into file,
         # including operator name, stream id, start time, and duration.
-        self._write_timeline_data_into_file(timeline_data)
+        self._write_timeline_data_into_file(op_time_data['timeline'])
 
     def _write_op_time_into_file(self, result_data):
         """
@@ -141,18 +147,22 @@ class OPComputeTimeParser:
     def _write_timeline_data_into_file(self, timeline_data):
         """
         Write the timeline information into the file, including
-            operator name, stream id, start time and duration.
+            operator name, stream id, start time and duration, sorted by start time.
 
         Args:
-            timeline_data (list): The metadata to be written into the file.
-                [
-                    ['op_name_1', 'stream_id_1', 'start_time_1', 'durarion_1'],
-                    ['op_name_2', 'stream_id_2', 'start_time_2', 'durarion_2'],
-                    [...]
-                ]
+            timeline_data (dict): The columns of the metadata to be written into the file.
+                {
+                    'op_name': ['op_name_1', 'op_name_2', ...],
+                    'stream_id': ['stream_id_1', 'stream_id_2', ...],
+                    'start_time': numpy.ndarray of the start times,
+                    'duration': numpy.ndarray of the durations
+                }
+                The timeline rows of an op are grouped in the order of the ops.
         """
-        # sorted by start times
-        timeline_data.sort(key=lambda x: float(x[2]))
+        # sorted by start times, the rows with the same start time stay in the order of the ops
+        order = np.argsort(timeline_data['start_time'], kind='stable')
+        op_name = timeline_data['op_name']
+        stream_id = timeline_data['stream_id']
         filename = 'output_timeline_data_{}.txt'.format(self._device_id)
         file_path = os.path.join(self._output_path, filename)
         file_path = validate_and_normalize_path(file_path)
@@ -161,9 +171,13 @@ class OPComputeTimeParser:
         try:
             with open(file_path, 'w') as f_obj:
                 f_obj.write(TIMELINE_FILE_COLUMN_TITLE + '\n')
-                for timeline in timeline_data:
-                    timeline = [str(item) for item in timeline]
-                    f_obj.write(','.join(timeline) + '\n')
+                for chunk_start in range(0, order.size, self._write_chunk_size):
+                    chunk = order[chunk_start:chunk_start + self._write_chunk_size]
+                    f_obj.write(''.join(['%s,%s,%r,%r\n' % line
+                                         for line in zip([op_name[index] for index in chunk.tolist()],
+                                                         [stream_id[index] for index in chunk.tolist()],
+                                                         timeline_data['start_time'][chunk].tolist(),
+                                                         timeline_data['duration'][chunk].tolist())]))
             os.chmod(file_path, stat.S_IREAD | stat.S_IWRITE)
         except (IOError, OSError) as err:
             logger.error('Error occurred when writing intermediate timeline file: %s', err)
@@ -173,73 +187,93 @@ class OPComputeTimeParser:
         """
         Calculate the execution time of each operator.
 
+        A start record followed by an end record of the same op is a task execution, the pairs are matched for all
+        the records at once.
+
         Returns:
-            list, including the intermediate data of op execution time.
+            dict, including the intermediate data of op execution time, one item per task execution.
         """
-        tmp_result_data = []
-        op_map_list = self._get_op_task_id_map()
+        hwts_data = self._get_op_task_id_map()
+        is_start = hwts_data['is_start']
+        op_code = hwts_data['op_code']
+        cycle_counter = hwts_data['cycle_counter']
+
+        # A record can not be both the end of a pair and the start of the next one, so there is no overlap between
+        # the pairs and they can be matched independently.
+        start_index = np.flatnonzero(is_start[:-1] & ~is_start[1:] & (op_code[:-1] == op_code[1:]))
+        end_index = start_index + 1
+
+        tmp_result_data = {
+            'op_names': hwts_data['op_names'],
+            'op_code': op_code[start_index],
+            'task_code': hwts_data['task_code'][start_index],
+            'cycle_counter': cycle_counter[start_index],
+            'duration': cycle_counter[end_index] - cycle_counter[start_index],
+            'stream_id': [hwts_data['stream_id'][index] for index in start_index.tolist()]
+        }
 
-        cur_index = 0
-        length = len(op_map_list)
         min_cycle_counter = float("inf")
-        while cur_index < length:
-            if cur_index + 1 == length:
-                break
-
-            op_start = op_map_list[cur_index]
-            op_end = op_map_list[cur_index + 1]
-            if op_start.status == "Start" and op_end.status == "End" \
-                    and op_start.op_name == op_end.op_name:
-                op_start.duration = op_end.cycle_counter - op_start.cycle_counter
-                tmp_result_data.append(op_start)
-                cur_index += 2
-                if not op_start.op_name.startswith("assign"):
-                    min_cycle_counter = min(min_cycle_counter, op_start.cycle_counter)
-            else:
-                cur_index += 1
+        is_assign = np.array([op_name.startswith("assign") for op_name in hwts_data['op_names']], dtype=np.bool_)
+        if start_index.size:
+            op_cycle_counter = tmp_result_data['cycle_counter'][~is_assign[tmp_result_data['op_code']]]
+            if op_cycle_counter.size:
+                min_cycle_counter = op_cycle_counter.min().item()
 
         # Update the value of minimum cycle counter.
         self._min_cycle_counter = min_cycle_counter / 1e5  # Convert the time unit from 10ns to 1ms
 
         return tmp_result_data
 
-    def _convert_op_time_unit(self, op_data_list, op_name_time_dict, op_name_stream_dict,
-                              op_name_count_dict, op_name_task_dict, op_name_start_time):
+    def _convert_op_time_unit(self, op_data):
         """
         Calculate the execution time of operator and convert it into millisecond.
 
+        The task executions are grouped by op, the ops are in the order of their first execution. The stream id of
+        an op is the one of its first execution, and only the executions of its first task are counted.
+
         Args:
-            op_data_list (list): The list of operator metadata.
-            op_name_time_dict (dict): The mapping relation of operator name and its execution time.
-            op_name_stream_dict (dict): The mapping relation of operator name and its stream id.
-            op_name_count_dict (dict): The mapping relation of operator name and its count.
-            op_name_task_dict (dict): The mapping relation of operator name and its task id.
-            op_name_start_time (dict): The mapping relation of operator name and its start time.
+            op_data (dict): The columns of operator metadata.
+
+        Returns:
+            dict, the total execution time, count and stream id of every op, and the timeline data.
         """
         factor = 1e5
-        for item in op_data_list:
-            op_name = item.op_name
-            # Unit conversion: converting the cycle counter into ms.
-            op_start_time_str = str(item.cycle_counter / factor)
-            op_duration = item.duration / factor
-            op_duration_str = str(item.duration / factor)
-            if op_name in op_name_time_dict.keys():
-                op_name_time_dict[op_name] += op_duration
-                if item.task_id == op_name_task_dict[op_name]:
-                    op_name_count_dict[op_name] += 1
-                op_name_start_time[op_name].append(
-                    (op_start_time_str, op_duration_str)
-                )
-
-            else:
-                op_name_time_dict[op_name] = op_duration
-                op_name_stream_dict[op_name] = item.stream_id
-                op_name_task_dict[op_name] = item.task_id
-                op_name_count_dict[op_name] = 1
-                op_name_start_time[op_name] = []
-                op_name_start_time[op_name].append(
-                    (op_start_time_str, op_duration_str)
-                )
+        op_code = op_data['op_code']
+        num_ops = len(op_data['op_names'])
+        # Unit conversion: converting the cycle counter into ms.
+        op_start_time = op_data['cycle_counter'] / factor
+        op_duration = op_data['duration'] / factor
+
+        # the executions are summed in order, the same as accumulating them one by one
+        op_time = np.bincount(op_code, weights=op_duration, minlength=num_ops)
+        used_codes, first_index = np.unique(op_code, return_index=True)
+        first_task_code = np.zeros(num_ops, dtype=np.int64)
+        first_task_code[used_codes] = op_data['task_code'][first_index]
+        op_count = np.bincount(op_code[op_data['task_code'] == first_task_code[op_code]], minlength=num_ops)
+
+        # ops in the order of their first execution
+        op_order = used_codes[np.argsort(first_index, kind='stable')]
+        op_rank = np.zeros(num_ops, dtype=np.int64)
+        op_rank[op_order] = np.arange(op_order.size)
+        op_stream_id = {code: op_data['stream_id'][index] for code, index in zip(used_codes.tolist(),
+                                                                                 first_index.tolist())}
+        # timeline rows grouped by op, in the order of execution for every op
+        timeline_order = np.argsort(op_rank[op_code], kind='stable')
+        timeline_op_code = op_code[timeline_order].tolist()
+
+        op_order = op_order.tolist()
+        return {
+            'op_name': [op_data['op_names'][code] for code in op_order],
+            'time': op_time[op_order].tolist(),
+            'count': op_count[op_order].tolist(),
+            'stream_id': [op_stream_id[code] for code in op_order],
+            'timeline': {
+                'op_name': [op_data['op_names'][code] for code in timeline_op_code],
+                'stream_id': [op_stream_id[code] for code in timeline_op_code],
+                'start_time': op_start_time[timeline_order],
+                'duration': op_duration[timeline_order]
+            }
+        }
 
     @property
     def min_cycle_counter(self):
@@ -19,12 +19,14 @@ import stat
 import time
 
 import threading
+from concurrent.futures import Future
 import mindspore.context as context
 from mindspore import log as logger
 from mindspore import nn
 from mindspore._checkparam import Validator
 from mindspore.train._utils import _make_directory
-from mindspore.train.serialization import save_checkpoint, _save_graph
+from mindspore.train.serialization import save_checkpoint, _save_graph, _remove_ckpt_files, _get_ckpt_data_list, \
+    _get_ckpt_hashes, _get_ckpt_base, _run_save, _exec_save, _exec_save_delta
 from mindspore.parallel._ps_context import _is_role_pserver, _get_ps_mode_rank
 from ._callback import Callback, set_cur_net
 
@@ -44,6 +46,21 @@ def _check_file_name_prefix(file_name_prefix):
     return True
 
 
+def _exec_save_base(ckpt_file_name, data_list, shard_num, base_hashes):
+    """Saves a full checkpoint as the base of delta checkpoints, then sets its chunk digests into base_hashes."""
+    try:
+        _exec_save(ckpt_file_name, data_list, shard_num)
+        base_hashes.set_result(_get_ckpt_hashes(data_list))
+    except BaseException as e:
+        base_hashes.set_exception(e)
+        raise e
+
+
+def _exec_save_delta_on_base(ckpt_file_name, data_list, base_file_name, base_hashes):
+    """Saves a delta checkpoint once the chunk digests of its base checkpoint are set into base_hashes."""
+    _exec_save_delta(ckpt_file_name, data_list, base_file_name, base_hashes.result())
+
+
 def _chg_ckpt_file_name_if_same_exist(directory, prefix):
     """Check if there is a file with the same name."""
     files = os.listdir(directory)
@@ -92,6 +109,14 @@ class CheckpointConfig:
         async_save (bool): Whether asynchronous execution saves the checkpoint to a file. Default: False.
         saved_network (Cell): Network to be saved in checkpoint file. If the saved_network has no relation
             with the network in training, the initial value of saved_network will be saved. Default: None.
+        shard_num (int): Number of shard files every checkpoint is written into in parallel, see
+            `save_checkpoint` for the sharded checkpoint format. Default: 1.
+        incremental_save (bool): Whether to save delta checkpoints, which only hold the chunks of parameter data
+            changed since the latest full checkpoint. `load_checkpoint` rebuilds a delta checkpoint from its
+            full checkpoint and its own chunks. A full checkpoint and its delta checkpoints count as one
+            checkpoint against keep_checkpoint_max, and are removed together. Default: False.
+        full_save_interval (int): When incremental_save is True, a full checkpoint is saved every
+            full_save_interval checkpoints, and delta checkpoints are saved in between. Default: 10.
 
     Raises:
         ValueError: If the input_param is None or 0.
@@ -135,7 +160,10 @@ class CheckpointConfig:
                  keep_checkpoint_per_n_minutes=0,
                  integrated_save=True,
                  async_save=False,
-                 saved_network=None):
+                 saved_network=None,
+                 shard_num=1,
+                 incremental_save=False,
+                 full_save_interval=10):
 
         if save_checkpoint_steps is not None:
             save_checkpoint_steps = Validator.check_non_negative_int(save_checkpoint_steps)
@@ -169,6 +197,9 @@ class CheckpointConfig:
         self._integrated_save = Validator.check_bool(integrated_save)
         self._async_save = Validator.check_bool(async_save)
         self._saved_network = saved_network
+        self._shard_num = Validator.check_positive_int(shard_num, "shard_num")
+        self._incremental_save = Validator.check_bool(incremental_save)
+        self._full_save_interval = Validator.check_positive_int(full_save_interval, "full_save_interval")
 
     @property
     def save_checkpoint_steps(self):
@@ -205,6 +236,21 @@ class CheckpointConfig:
         """Get the value of _saved_network"""
         return self._saved_network
 
+    @property
+    def shard_num(self):
+        """Get the value of _shard_num."""
+        return self._shard_num
+
+    @property
+    def incremental_save(self):
+        """Get the value of _incremental_save."""
+        return self._incremental_save
+
+    @property
+    def full_save_interval(self):
+        """Get the value of _full_save_interval."""
+        return self._full_save_interval
+
     def get_checkpoint_policy(self):
         """Get the policy of checkpoint."""
         checkpoint_policy = {'save_checkpoint_steps': self.save_checkpoint_steps,
@@ -261,6 +307,9 @@ class ModelCheckpoint(Callback):
         self._manager = CheckpointManager()
         self._prefix = _chg_ckpt_file_name_if_same_exist(self._directory, self._prefix)
         self._graph_saved = False
+        self._delta_base = None
+        self._delta_base_hashes = None
+        self._delta_save_count = 0
 
     def step_end(self, run_context):
         """
@@ -326,15 +375,21 @@ class ModelCheckpoint(Callback):
                                + str(step_num_in_epoch) + ".ckpt"
             # update checkpoint file list.
             self._manager.update_ckpoint_filelist(self._directory, self._prefix)
-            # keep checkpoint files number equal max number.
-            if self._config.keep_checkpoint_max and 0 < self._config.keep_checkpoint_max <= self._manager.ckpoint_num:
-                self._manager.remove_oldest_ckpoint_file()
+            # keep checkpoint files number equal max number. With incremental_save, a full checkpoint and its
+            # delta checkpoints count as one, and only a full checkpoint can rotate out the oldest of them.
+            to_save_full = not self._config.incremental_save or self._is_full_save_next()
+            ckpoint_num = self._manager.ckpoint_unit_num if self._config.incremental_save else self._manager.ckpoint_num
+            if self._config.keep_checkpoint_max and 0 < self._config.keep_checkpoint_max <= ckpoint_num:
+                if to_save_full:
+                    self._manager.remove_oldest_ckpoint_file()
             elif self._config.keep_checkpoint_per_n_minutes and self._config.keep_checkpoint_per_n_minutes > 0:
                 self._cur_time_for_keep = time.time()
                 if (self._cur_time_for_keep - self._last_time_for_keep) \
                         < self._config.keep_checkpoint_per_n_minutes * 60:
+                    # the base of the delta checkpoint to be saved must be kept
+                    keep_files = () if to_save_full else (self._delta_base,)
                     self._manager.keep_one_ckpoint_per_minutes(self._config.keep_checkpoint_per_n_minutes,
-                                                               self._cur_time_for_keep)
+                                                               self._cur_time_for_keep, keep_files)
 
             # generate the new checkpoint file and rename it.
             global _save_dir
@@ -348,11 +403,34 @@ class ModelCheckpoint(Callback):
                 cb_params.train_network.exec_checkpoint_graph()
 
             network = self._config.saved_network if self._config.saved_network is not None else cb_params.train_network
-            save_checkpoint(network, cur_file, self._config.integrated_save,
-                            self._config.async_save)
+            if self._config.incremental_save:
+                self._save_incremental_ckpt(network, cur_file)
+            else:
+                save_checkpoint(network, cur_file, self._config.integrated_save,
+                                self._config.async_save, self._config.shard_num)
 
             self._latest_ckpt_file_name = cur_file
 
+    def _is_full_save_next(self):
+        """Whether the next incremental checkpoint is a full checkpoint rather than a delta checkpoint."""
+        return self._delta_base is None or self._delta_save_count >= self._config.full_save_interval
+
+    def _save_incremental_ckpt(self, network, cur_file):
+        """Save a full checkpoint every full_save_interval checkpoints, and delta checkpoints against it between."""
+        data_list = _get_ckpt_data_list(network, self._config.integrated_save)
+        # the base is tracked in memory, with async_save it may not be written yet, and its chunk digests are
+        # computed by the save job off the training thread
+        if self._is_full_save_next():
+            self._delta_base = cur_file
+            self._delta_base_hashes = Future()
+            self._delta_save_count = 0
+            _run_save(_exec_save_base, (cur_file, data_list, self._config.shard_num, self._delta_base_hashes),
+                      self._config.async_save)
+        else:
+            _run_save(_exec_save_delta_on_base, (cur_file, data_list, self._delta_base, self._delta_base_hashes),
+                      self._config.async_save)
+        self._delta_save_count += 1
+
     @property
     def latest_ckpt_file_name(self):
         """Return the latest checkpoint path and file name."""
@@ -388,24 +466,61 @@ class CheckpointManager:
                 if flag:
                     self._ckpoint_filelist.append(directory + '/' + filename)
 
+    @property
+    def ckpoint_unit_num(self):
+        """Get the number of the related checkpoints, a full checkpoint and its delta checkpoints count as one."""
+        return len(self._get_unit_files())
+
+    def _get_unit_files(self):
+        """Get the managed checkpoint files except the delta checkpoints whose base checkpoint is managed here."""
+        ckpoint_paths = {os.path.abspath(ckpt_file) for ckpt_file in self._ckpoint_filelist}
+        return [ckpt_file for ckpt_file in self._ckpoint_filelist
+                if self._get_base_file(ckpt_file) not in ckpoint_paths]
+
     def remove_ckpoint_file(self, file_name):
         """Remove the specified checkpoint file from this checkpoint manager and also from the directory."""
         try:
+            delta_files = self._get_delta_files(file_name)
             os.chmod(file_name, stat.S_IWRITE)
-            os.remove(file_name)
+            _remove_ckpt_files(file_name)
             self._ckpoint_filelist.remove(file_name)
+            # delta checkpoints can not be loaded without their base checkpoint
+            for delta_file in delta_files:
+                self.remove_ckpoint_file(delta_file)
         except OSError:
             logger.warning("OSError, failed to remove the older ckpt file %s.", file_name)
         except ValueError:
             logger.warning("ValueError, failed to remove the older ckpt file %s.", file_name)
 
+    @staticmethod
+    def _get_base_file(ckpt_file):
+        """Get the absolute path of the base checkpoint of a delta checkpoint, None for other checkpoints."""
+        try:
+            ckpt_base = _get_ckpt_base(ckpt_file)
+        except (OSError, ValueError):
+            return None
+        if ckpt_base is None:
+            return None
+        return os.path.abspath(os.path.join(os.path.dirname(ckpt_file), ckpt_base))
+
+    def _get_delta_files(self, base_file_name):
+        """Get the managed delta checkpoint files whose base checkpoint is base_file_name."""
+        base_path = os.path.abspath(base_file_name)
+        return [ckpt_file for ckpt_file in self._ckpoint_filelist if self._get_base_file(ckpt_file) == base_path]
+
     def remove_oldest_ckpoint_file(self):
         """Remove the oldest checkpoint file from this checkpoint manager and also from the directory."""
-        ckpoint_files = sorted(self._ckpoint_filelist, key=os.path.getmtime)
+        # a delta checkpoint is removed with its base checkpoint, never before it
+        ckpoint_files = sorted(self._get_unit_files(), key=os.path.getmtime)
         self.remove_ckpoint_file(ckpoint_files[0])
 
-    def keep_one_ckpoint_per_minutes(self, minutes, cur_time):
-        """Only keep the latest one ckpt file per minutes, remove other files generated in [last_time, cur_time]."""
+    def keep_one_ckpoint_per_minutes(self, minutes, cur_time, keep_files=()):
+        """
+        Only keep the latest one ckpt file per minutes, remove other files generated in [last_time, cur_time].
+
+        The files in keep_files, and the delta checkpoints removed with their base checkpoint, are skipped.
+        """
+        keep_paths = {os.path.abspath(keep_file) for keep_file in keep_files}
         movs = []
         oldest_file = ''
         oldest_time = cur_time
@@ -419,6 +534,7 @@ class CheckpointManager:
                     oldest_file = ck_file
 
         for mv_file in movs:
-            if mv_file == oldest_file:
+            if mv_file == oldest_file or os.path.abspath(mv_file) in keep_paths \
+                    or mv_file not in self._ckpoint_filelist:
                 continue
             self.remove_ckpoint_file(mv_file)
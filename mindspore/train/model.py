@@ -17,6 +17,8 @@ from collections.abc import Iterable
 
 import os
 import math
+import queue
+import threading
 import numpy as np
 
 from mindspore import log as logger
@@ -53,6 +55,81 @@ class _StepSync(Callback):
         _pynative_exec.sync()
 
 
+class _MetricUpdater:
+    """
+    Update the metrics of eval with the outputs of the steps copied to host once, instead of once per metric.
+
+    The outputs of `update_interval` steps are passed at a time to `update_fn`, which is called in a background
+    thread if `is_async`, so the metrics are computed while the device runs the next steps.
+
+    Args:
+        update_fn (Callable): Function updating the metrics with a list of the host outputs of steps.
+        is_async (bool): Whether to update the metrics in a background thread.
+        update_interval (int): Number of steps the metrics are updated with at a time.
+    """
+    # maximum number of the groups of steps waiting for the background thread
+    _MAX_PENDING = 8
+
+    def __init__(self, update_fn, is_async, update_interval):
+        self._update_fn = update_fn
+        self._update_interval = update_interval
+        self._steps = []
+        self._error = None
+        self._queue = None
+        self._thread = None
+        if is_async:
+            self._queue = queue.Queue(self._MAX_PENDING)
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Update the metrics with the groups of steps in the queue until the end mark None."""
+        while True:
+            steps = self._queue.get()
+            if steps is None:
+                return
+            if self._error is None:
+                try:
+                    self._update_fn(steps)
+                except Exception as e:  # pylint: disable=broad-except
+                    self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _flush(self):
+        steps, self._steps = self._steps, []
+        if not steps:
+            return
+        if self._queue is None:
+            self._update_fn(steps)
+        else:
+            self._raise_error()
+            self._queue.put(steps)
+
+    def update(self, outputs):
+        """Add the outputs of a step, the tensors are copied to host."""
+        self._steps.append(tuple(output.asnumpy() if isinstance(output, Tensor) else output for output in outputs))
+        if len(self._steps) >= self._update_interval:
+            self._flush()
+
+    def stop(self):
+        """Stop the background thread, the steps not updated yet are dropped."""
+        self._steps = []
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        """Update the metrics with the remaining steps, and wait for all the steps to be updated."""
+        self._flush()
+        self.stop()
+        self._raise_error()
+
+
 class Model:
     """
     High-Level API for Training or Testing.
@@ -91,6 +168,10 @@ class Model:
             e.g. Use `loss_scale_manager=None` to set the value.
         keep_batchnorm_fp32 (bool): Keep Batchnorm running in `float32`. If it is set to true, the level setting before
             will be overwritten. Default: True.
+        loss_scale_sync_steps (int): In dataset non-sink mode, number of steps after which the overflow flags of the
+            steps are read by host to update `loss_scale_manager`, and at the end of every epoch. The loss scale is
+            updated on device every step, so reading the flags lazily avoids a host-device synchronization per step,
+            but `loss_scale_manager.get_loss_scale()` may lag behind the device. It is a key argument. Default: 1.
 
     Examples:
         >>> class Net(nn.Cell):
@@ -132,12 +213,15 @@ class Model:
         self._loss_scale_manager_set = False
         self._keep_bn_fp32 = True
         self._check_kwargs(kwargs)
+        self._loss_scale_sync_steps = Validator.check_positive_int(kwargs.get('loss_scale_sync_steps', 1),
+                                                                   'loss_scale_sync_steps')
         self._amp_level = amp_level
         self._process_amp_args(kwargs)
         self._parallel_mode = _get_parallel_mode()
         self._device_number = _get_device_num()
         self._global_rank = _get_global_rank()
         self._parameter_broadcast = _get_parameter_broadcast()
+        self._metric_updater = None
 
         self._train_network = self._build_train_network()
         self._build_eval_network(metrics, eval_network, eval_indexes)
@@ -154,7 +238,7 @@ class Model:
 
     def _check_kwargs(self, kwargs):
         for arg in kwargs:
-            if arg not in ['loss_scale_manager', 'keep_batchnorm_fp32']:
+            if arg not in ['loss_scale_manager', 'keep_batchnorm_fp32', 'loss_scale_sync_steps']:
                 raise ValueError(f"Unsupported arg '{arg}'")
 
     def _build_train_network(self):
@@ -236,17 +320,37 @@ class Model:
             raise ValueError("The length of `outputs` must be greater than or equal to 3, \
                              but got {}".format(len(outputs)))
 
+        if self._metric_updater is not None:
+            self._metric_updater.update(outputs)
+            return
+        self._update_metrics_with_steps([outputs])
+
+    def _update_metrics_with_steps(self, steps):
+        """
+        Update metrics local values with the outputs of several steps.
+
+        The outputs of the steps are concatenated along the batch axis, except for the loss, which is averaged per
+        step, and the outputs of 0 dimension.
+        """
         for metric in self._metric_fns.values():
             if self._eval_indexes is None:
-                metric.update(*outputs)
+                indexes = range(len(steps[0]))
+            elif isinstance(metric, Loss):
+                indexes = self._eval_indexes[:1]
             else:
-                if isinstance(metric, Loss):
-                    metric.update(outputs[self._eval_indexes[0]])
-                else:
-                    metric.update(outputs[self._eval_indexes[1]], outputs[self._eval_indexes[2]])
+                indexes = self._eval_indexes[1:]
+
+            if len(steps) > 1 and not isinstance(metric, Loss) and \
+                    all(np.ndim(steps[0][i]) > 0 for i in indexes):
+                metric.update(*[np.concatenate([step[i] for step in steps]) for i in indexes])
+            else:
+                for step in steps:
+                    metric.update(*[step[i] for i in indexes])
 
     def _get_metrics(self):
         """Get metrics local values."""
+        if self._metric_updater is not None:
+            self._metric_updater.close()
         metrics = dict()
         for key, value in self._metric_fns.items():
             metrics[key] = value.eval()
@@ -466,6 +570,12 @@ class Model:
 
         list_callback.end(run_context)
 
+    def _update_loss_scale(self, overflows):
+        """Update the loss scale manager with the overflow flags of the steps, which are read from device."""
+        for overflow in overflows:
+            self._loss_scale_manager.update_loss_scale(np.all(overflow.asnumpy()))
+        overflows.clear()
+
     def _train_process(self, epoch, train_dataset, list_callback=None, cb_params=None):
         """
         Training process. The data would be passed to network directly.
@@ -491,6 +601,9 @@ class Model:
         list_callback.begin(run_context)
         # used to stop training for early stop, such as stopAtTIme or stopATStep
         should_stop = False
+        update_loss_scale = self._loss_scale_manager and self._loss_scale_manager.get_drop_overflow_update()
+        # the overflow flags of the steps which are not read by host yet
+        overflows = []
 
         for i in range(epoch):
             cb_params.cur_epoch_num = i + 1
@@ -509,10 +622,11 @@ class Model:
                 list_callback.step_begin(run_context)
                 outputs = self._train_network(*next_element)
                 cb_params.net_outputs = outputs
-                if self._loss_scale_manager and self._loss_scale_manager.get_drop_overflow_update():
+                if update_loss_scale:
                     _, overflow, _ = outputs
-                    overflow = np.all(overflow.asnumpy())
-                    self._loss_scale_manager.update_loss_scale(overflow)
+                    overflows.append(overflow)
+                    if len(overflows) >= self._loss_scale_sync_steps:
+                        self._update_loss_scale(overflows)
 
                 list_callback.step_end(run_context)
                 if _is_role_pserver():
@@ -522,6 +636,7 @@ class Model:
                     break
 
             train_dataset.reset()
+            self._update_loss_scale(overflows)
 
             list_callback.epoch_end(run_context)
             should_stop = should_stop or run_context.get_stop_requested()
@@ -663,7 +778,8 @@ class Model:
         list_callback.end(run_context)
         return metrics
 
-    def eval(self, valid_dataset, callbacks=None, dataset_sink_mode=True):
+    def eval(self, valid_dataset, callbacks=None, dataset_sink_mode=True, async_metrics=False,
+             metrics_update_interval=1):
         """
         Evaluation API where the iteration is controlled by python front-end.
 
@@ -677,6 +793,12 @@ class Model:
             valid_dataset (Dataset): Dataset to evaluate the model.
             callbacks (list): List of callback objects which should be executed while training. Default: None.
             dataset_sink_mode (bool): Determines whether to pass the data through dataset channel. Default: True.
+            async_metrics (bool): Whether to update the metrics in a background thread while the next steps run.
+                The outputs of a step are copied to host once and the metrics get numpy.ndarray. Default: False.
+            metrics_update_interval (int): Number of steps the metrics are updated with at a time, the outputs of
+                these steps are concatenated along the batch axis, except for the loss and the outputs of 0
+                dimension. It suits the metrics whose result only depends on the samples, not on how they are
+                grouped, e.g. accuracy, precision or recall. Default: 1.
 
         Returns:
             Dict, which returns the loss value and metrics values for the model in the test mode.
@@ -689,6 +811,8 @@ class Model:
             >>> acc = model.eval(dataset, dataset_sink_mode=False)
         """
         dataset_sink_mode = Validator.check_bool(dataset_sink_mode)
+        async_metrics = Validator.check_bool(async_metrics)
+        metrics_update_interval = Validator.check_positive_int(metrics_update_interval)
         _device_number_check(self._parallel_mode, self._device_number)
         if not self._metric_fns:
             raise ValueError("metric fn can not be None or empty.")
@@ -709,10 +833,18 @@ class Model:
             logger.warning("CPU cannot support dataset sink mode currently."
                            "So the evaluating process will be performed with dataset non-sink mode.")
 
-        with _CallbackManager(callbacks) as list_callback:
-            if dataset_sink_mode:
-                return self._eval_dataset_sink_process(valid_dataset, list_callback, cb_params)
-            return self._eval_process(valid_dataset, list_callback, cb_params)
+        if async_metrics or metrics_update_interval > 1:
+            self._metric_updater = _MetricUpdater(self._update_metrics_with_steps, async_metrics,
+                                                  metrics_update_interval)
+        try:
+            with _CallbackManager(callbacks) as list_callback:
+                if dataset_sink_mode:
+                    return self._eval_dataset_sink_process(valid_dataset, list_callback, cb_params)
+                return self._eval_process(valid_dataset, list_callback, cb_params)
+        finally:
+            if self._metric_updater is not None:
+                self._metric_updater.stop()
+                self._metric_updater = None
 
     def predict(self, *predict_data):
         """
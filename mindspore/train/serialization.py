@@ -16,12 +16,15 @@
 import os
 import stat
 import math
+import mmap
+import json
+import hashlib
 from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
 import mindspore.nn as nn
 import mindspore.context as context
 from mindspore import log as logger
-from mindspore.train.checkpoint_pb2 import Checkpoint
 from mindspore.train.print_pb2 import Print
 from mindspore.train.node_strategy_pb2 import ParallelStrategyMap, ParallelLayouts
 from mindspore.common.tensor import Tensor
@@ -46,6 +49,12 @@ tensor_to_np_type = {"Int8": np.int8, "Uint8": np.uint8, "Int16": np.int16, "Uin
 
 _ckpt_mutex = Lock()
 SLICE_SIZE = 512 * 1024 * 1024
+CKPT_SHARD_SUFFIX = ".shard"
+CKPT_SHARD_ALIGN = 64
+CKPT_MANIFEST_VERSION = 1
+DELTA_CHUNK_SIZE = 64 * 1024
+# max. no. of checkpoint files of the ranks read in parallel by load_distributed_checkpoint
+DISTRIBUTED_CKPT_READERS = 16
 
 
 def _special_process_par(par, new_par):
@@ -108,32 +117,126 @@ def _update_param(param, new_param):
         param.set_data(type(param.data)(new_param.data))
 
 
-def _exec_save(ckpt_file_name, data_list):
+def _encode_varint(value):
+    """Encodes a non-negative int as a protobuf base 128 varint."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _write_ckpt_value(f, tag, dims, tensor_type, data):
+    """
+    Writes one serialized Checkpoint message holding data as the value of tag.
+
+    The bytes written are the same as `Checkpoint.SerializeToString`, but the tensor content is written from the
+    buffer of data directly instead of being copied into the message first.
+    """
+    tensor_head = b"".join([b"\x08" + _encode_varint(dim) for dim in dims])
+    type_bytes = tensor_type.encode('utf-8')
+    tensor_head += b"\x12" + _encode_varint(len(type_bytes)) + type_bytes
+    tensor_head += b"\x1a" + _encode_varint(data.nbytes)
+    tensor_len = len(tensor_head) + data.nbytes
+    tag_bytes = tag.encode('utf-8')
+    value_head = b"\x0a" + _encode_varint(len(tag_bytes)) + tag_bytes + b"\x12" + _encode_varint(tensor_len)
+    f.write(b"\x0a" + _encode_varint(len(value_head) + tensor_len) + value_head + tensor_head)
+    f.write(memoryview(data).cast('B'))
+
+
+def _get_shard_file_name(ckpt_file_name, shard_id):
+    """Gets the name of the shard file shard_id of a sharded checkpoint."""
+    return ckpt_file_name + CKPT_SHARD_SUFFIX + str(shard_id)
+
+
+def _remove_ckpt_files(ckpt_file_name):
+    """Removes the checkpoint file and the shard files left by a former sharded checkpoint of the same name."""
+    if os.path.exists(ckpt_file_name):
+        os.remove(ckpt_file_name)
+    ckpt_dir = os.path.dirname(os.path.abspath(ckpt_file_name))
+    shard_prefix = os.path.basename(ckpt_file_name) + CKPT_SHARD_SUFFIX
+    for file_name in os.listdir(ckpt_dir):
+        if file_name.startswith(shard_prefix) and file_name[len(shard_prefix):].isdigit():
+            os.remove(os.path.join(ckpt_dir, file_name))
+
+
+def _assign_shards(data_list, shard_num):
+    """
+    Assigns every parameter to the shard with the least bytes so far, largest parameters first.
+
+    Returns:
+        Dict, key is parameter name, value is [shard_id, offset, length] of its data in the shard file.
+    """
+    shard_sizes = [0] * shard_num
+    shard_layout = {}
+    for name in sorted(data_list, key=lambda key: data_list[key][2].nbytes, reverse=True):
+        shard_id = shard_sizes.index(min(shard_sizes))
+        offset = math.ceil(shard_sizes[shard_id] / CKPT_SHARD_ALIGN) * CKPT_SHARD_ALIGN
+        length = data_list[name][2].nbytes
+        shard_layout[name] = [shard_id, offset, length]
+        shard_sizes[shard_id] = offset + length
+    return shard_layout
+
+
+def _write_shard(shard_file_name, shard_params):
+    """Writes the data of shard_params, a list of (offset, data) sorted by offset, into the shard file."""
+    with open(shard_file_name, "wb") as f:
+        for offset, data in shard_params:
+            f.write(b"\x00" * (offset - f.tell()))
+            f.write(memoryview(data).cast('B'))
+    os.chmod(shard_file_name, stat.S_IRUSR)
+
+
+def _exec_save_shards(ckpt_file_name, data_list, shard_num):
+    """Writes data_list into shard_num shard files in parallel, then writes the manifest into ckpt_file_name."""
+    shard_layout = _assign_shards(data_list, shard_num)
+    shard_params = [[] for _ in range(shard_num)]
+    for name, (shard_id, offset, _) in shard_layout.items():
+        shard_params[shard_id].append((offset, data_list[name][2]))
+
+    with ThreadPoolExecutor(max_workers=shard_num) as executor:
+        futures = [executor.submit(_write_shard, _get_shard_file_name(ckpt_file_name, shard_id),
+                                   sorted(shard_params[shard_id], key=lambda item: item[0]))
+                   for shard_id in range(shard_num)]
+        for future in futures:
+            future.result()
+
+    manifest = {"version": CKPT_MANIFEST_VERSION,
+                "shards": [os.path.basename(_get_shard_file_name(ckpt_file_name, shard_id))
+                           for shard_id in range(shard_num)],
+                "params": []}
+    for name, value in data_list.items():
+        shard_id, offset, length = shard_layout[name]
+        manifest["params"].append({"name": name, "dims": value[0], "tensor_type": value[1],
+                                   "shard": shard_id, "offset": offset, "length": length})
+    with open(ckpt_file_name, "w") as f:
+        json.dump(manifest, f)
+
+
+def _exec_save(ckpt_file_name, data_list, shard_num=1):
     """Execute the process of saving checkpoint into file."""
 
     try:
         with _ckpt_mutex:
-            if os.path.exists(ckpt_file_name):
-                os.remove(ckpt_file_name)
-            with open(ckpt_file_name, "ab") as f:
-                for name, value in data_list.items():
-                    data_size = value[2].nbytes
-                    if data_size > SLICE_SIZE:
-                        slice_count = math.ceil(data_size / SLICE_SIZE)
-                        param_slice_list = np.array_split(value[2], slice_count)
-                    else:
-                        param_slice_list = [value[2]]
-
-                    for param_slice in param_slice_list:
-                        checkpoint_list = Checkpoint()
-                        param_value = checkpoint_list.value.add()
-                        param_value.tag = name
-                        param_tensor = param_value.tensor
-                        param_tensor.dims.extend(value[0])
-                        param_tensor.tensor_type = value[1]
-                        param_tensor.tensor_content = param_slice.tobytes()
-
-                        f.write(checkpoint_list.SerializeToString())
+            _remove_ckpt_files(ckpt_file_name)
+            if shard_num > 1:
+                _exec_save_shards(ckpt_file_name, data_list, shard_num)
+            else:
+                with open(ckpt_file_name, "ab") as f:
+                    for name, value in data_list.items():
+                        data_size = value[2].nbytes
+                        if data_size > SLICE_SIZE:
+                            slice_count = math.ceil(data_size / SLICE_SIZE)
+                            param_slice_list = np.array_split(value[2], slice_count)
+                        else:
+                            param_slice_list = [value[2]]
+
+                        for param_slice in param_slice_list:
+                            _write_ckpt_value(f, name, value[0], value[1], param_slice)
 
         os.chmod(ckpt_file_name, stat.S_IRUSR)
 
@@ -142,7 +245,7 @@ def _exec_save(ckpt_file_name, data_list):
         raise e
 
 
-def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=False):
+def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=False, shard_num=1):
     """
     Saves checkpoint info to a specified file.
 
@@ -153,19 +256,38 @@ def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=F
         ckpt_file_name (str): Checkpoint file name. If the file name already exists, it will be overwritten.
         integrated_save (bool): Whether to integrated save in automatic model parallel scene. Default: True
         async_save (bool): Whether asynchronous execution saves the checkpoint to a file. Default: False
+        shard_num (int): Number of shard files the parameters are written into in parallel. If it is greater than 1,
+            the parameter data is saved in the files named `ckpt_file_name` + ".shard" + shard id and
+            `ckpt_file_name` holds a manifest of the name, dtype, shape, shard and offset of every parameter.
+            Default: 1.
 
     Raises:
         TypeError: If the parameter save_obj is not nn.Cell or list type.And if the parameter integrated_save and
                    async_save are not bool type.
+        ValueError: If the parameter shard_num is not a positive int.
     """
 
     if not isinstance(save_obj, nn.Cell) and not isinstance(save_obj, list):
         raise TypeError("The parameter save_obj should be nn.Cell or list, but got {}".format(type(save_obj)))
     integrated_save = Validator.check_bool(integrated_save)
     async_save = Validator.check_bool(async_save)
+    shard_num = Validator.check_positive_int(shard_num, "shard_num")
 
     logger.info("Execute the process of saving checkpoint files.")
 
+    data_list = _get_ckpt_data_list(save_obj, integrated_save)
+    _run_save(_exec_save, (ckpt_file_name, data_list, shard_num), async_save)
+
+    logger.info("Saving checkpoint process is finished.")
+
+
+def _get_ckpt_data_list(save_obj, integrated_save):
+    """
+    Gets the data to be saved of every parameter in save_obj.
+
+    Returns:
+        Dict, key is parameter name, value is a list [dims, tensor_type, data], data is the flattened numpy.ndarray.
+    """
     if isinstance(save_obj, nn.Cell):
         save_obj.init_parameters_data()
         param_dict = {}
@@ -203,14 +325,86 @@ def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=F
             data_list[key].append(tensor_type)
             data = param["data"].asnumpy().reshape(-1)
             data_list[key].append(data)
+    return data_list
+
 
+def _run_save(save_func, args, async_save):
+    """Runs save_func in the thread named asyn_save_ckpt if async_save is True, else runs it directly."""
     if async_save:
-        thr = Thread(target=_exec_save, args=(ckpt_file_name, data_list), name="asyn_save_ckpt")
+        thr = Thread(target=save_func, args=args, name="asyn_save_ckpt")
         thr.start()
     else:
-        _exec_save(ckpt_file_name, data_list)
+        save_func(*args)
 
-    logger.info("Saving checkpoint process is finished.")
+
+def _get_chunk_hash(chunk):
+    """Gets the digest of a chunk of parameter data."""
+    return hashlib.blake2b(chunk, digest_size=16).digest()
+
+
+def _get_ckpt_hashes(data_list):
+    """
+    Gets the digests of the DELTA_CHUNK_SIZE bytes chunks of every parameter in data_list.
+
+    Returns:
+        Dict, key is parameter name, value is a tuple (dims, tensor_type, chunk_hashes).
+    """
+    ckpt_hashes = {}
+    for name, (dims, tensor_type, data) in data_list.items():
+        data_bytes = memoryview(data).cast('B')
+        chunk_hashes = [_get_chunk_hash(data_bytes[begin:begin + DELTA_CHUNK_SIZE])
+                        for begin in range(0, data.nbytes, DELTA_CHUNK_SIZE)]
+        ckpt_hashes[name] = (dims, tensor_type, chunk_hashes)
+    return ckpt_hashes
+
+
+def _exec_save_delta(ckpt_file_name, data_list, base_file_name, base_hashes):
+    """
+    Saves the chunks of data_list which differ from the base checkpoint whose chunk digests are base_hashes.
+
+    The changed chunks are written into the shard file of ckpt_file_name, and ckpt_file_name holds a manifest with
+    the base checkpoint name and the chunk id, offset and length of every saved chunk.
+    """
+    try:
+        with _ckpt_mutex:
+            _remove_ckpt_files(ckpt_file_name)
+            shard_file_name = _get_shard_file_name(ckpt_file_name, 0)
+            manifest = {"version": CKPT_MANIFEST_VERSION,
+                        "base": os.path.basename(base_file_name),
+                        "chunk_size": DELTA_CHUNK_SIZE,
+                        "shards": [os.path.basename(shard_file_name)],
+                        "params": []}
+            with open(shard_file_name, "wb") as f:
+                for name, (dims, tensor_type, data) in data_list.items():
+                    base_dims, base_type, base_chunk_hashes = base_hashes.get(name, (None, None, []))
+                    if base_dims != dims or base_type != tensor_type:
+                        base_chunk_hashes = []
+                    data_bytes = memoryview(data).cast('B')
+                    chunks = []
+                    for chunk_id, begin in enumerate(range(0, data.nbytes, DELTA_CHUNK_SIZE)):
+                        chunk = data_bytes[begin:begin + DELTA_CHUNK_SIZE]
+                        if chunk_id < len(base_chunk_hashes) and base_chunk_hashes[chunk_id] == _get_chunk_hash(chunk):
+                            continue
+                        chunks.append([chunk_id, f.tell(), len(chunk)])
+                        f.write(chunk)
+                    manifest["params"].append({"name": name, "dims": dims, "tensor_type": tensor_type,
+                                               "length": data.nbytes, "chunks": chunks})
+            os.chmod(shard_file_name, stat.S_IRUSR)
+            with open(ckpt_file_name, "w") as f:
+                json.dump(manifest, f)
+
+        os.chmod(ckpt_file_name, stat.S_IRUSR)
+
+    except BaseException as e:
+        logger.error("Failed to save the checkpoint file %s.", ckpt_file_name)
+        raise e
+
+
+def _get_ckpt_base(ckpt_file_name):
+    """Gets the path of the base checkpoint of a delta checkpoint, returns None for other checkpoints."""
+    if not _is_ckpt_manifest(ckpt_file_name):
+        return None
+    return _read_ckpt_manifest(ckpt_file_name).get("base")
 
 
 def _check_param_prefix(filter_prefix, param_name):
@@ -222,10 +416,262 @@ def _check_param_prefix(filter_prefix, param_name):
     return False
 
 
+def _read_varint(buf, pos, end):
+    """Reads a protobuf base 128 varint from buf at pos, returns the value and the position after it."""
+    result = 0
+    shift = 0
+    while pos < end:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Malformed varint in the checkpoint file.")
+    raise ValueError("Truncated varint in the checkpoint file.")
+
+
+def _iter_pb_fields(buf, start, end):
+    """
+    Iterates the fields of the serialized protobuf message in buf[start:end].
+
+    Yields (field_number, wire_type, value), value is an int for varint fields, the (begin, end) offsets of the
+    payload for length-delimited fields and None for fixed size fields.
+    """
+    pos = start
+    while pos < end:
+        key, pos = _read_varint(buf, pos, end)
+        field_number = key >> 3
+        wire_type = key & 0x07
+        if wire_type == 0:
+            value, pos = _read_varint(buf, pos, end)
+        elif wire_type == 2:
+            length, pos = _read_varint(buf, pos, end)
+            value = (pos, pos + length)
+            pos += length
+        elif wire_type == 1:
+            value = None
+            pos += 8
+        elif wire_type == 5:
+            value = None
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} in the checkpoint file.")
+        if pos > end:
+            raise ValueError("Truncated message in the checkpoint file.")
+        yield field_number, wire_type, value
+
+
+def _index_tensor_proto(buf, start, end):
+    """Parses the dims and tensor_type of a TensorProto and locates its tensor_content without copying it."""
+    dims = []
+    tensor_type = None
+    content = None
+    for field_number, wire_type, value in _iter_pb_fields(buf, start, end):
+        if field_number == 1 and wire_type == 0:
+            dims.append(value)
+        elif field_number == 1 and wire_type == 2:
+            pos, dims_end = value
+            while pos < dims_end:
+                dim, pos = _read_varint(buf, pos, dims_end)
+                dims.append(dim)
+        elif field_number == 2 and wire_type == 2:
+            tensor_type = bytes(buf[value[0]:value[1]]).decode('utf-8')
+        elif field_number == 3 and wire_type == 2:
+            content = (value[0], value[1] - value[0])
+    if tensor_type is None or content is None:
+        raise ValueError("The tensor in the checkpoint file is missing the tensor_type or tensor_content.")
+    return dims, tensor_type, content
+
+
+def _index_checkpoint(buf):
+    """
+    Builds a per-tag offset index over the serialized Checkpoint stream in buf, tensor data is not read.
+
+    Returns:
+        Dict, key is parameter name, value is a list [dims, tensor_type, content_list], content_list holds the
+        (offset, length) of every slice of the parameter in file order.
+    """
+    ckpt_index = {}
+    for field_number, wire_type, value in _iter_pb_fields(buf, 0, len(buf)):
+        if field_number != 1 or wire_type != 2:
+            continue
+        tag = None
+        tensor = None
+        for value_field, value_wire_type, value_data in _iter_pb_fields(buf, value[0], value[1]):
+            if value_field == 1 and value_wire_type == 2:
+                tag = bytes(buf[value_data[0]:value_data[1]]).decode('utf-8')
+            elif value_field == 2 and value_wire_type == 2:
+                tensor = _index_tensor_proto(buf, value_data[0], value_data[1])
+        if tag is None or tensor is None:
+            raise ValueError("The value in the checkpoint file is missing the tag or tensor.")
+        dims, tensor_type, content = tensor
+        if tag in ckpt_index:
+            ckpt_index[tag][0] = dims
+            ckpt_index[tag][2].append(content)
+        else:
+            ckpt_index[tag] = [dims, tensor_type, [content]]
+    return ckpt_index
+
+
+def _build_param(param_name, param_data, dims, data_type):
+    """Builds the Parameter of param_name from its flattened data read from a checkpoint."""
+    ms_type = tensor_to_ms_type[data_type]
+    if dims == [0]:
+        if 'Float' in data_type:
+            param_data = float(param_data[0])
+        elif 'Int' in data_type:
+            param_data = int(param_data[0])
+        return Parameter(Tensor(param_data, ms_type), name=param_name)
+    if dims == [1]:
+        return Parameter(Tensor(param_data, ms_type), name=param_name)
+    return Parameter(Tensor(param_data.reshape(dims), ms_type), name=param_name)
+
+
+def _get_indexed_data(buf, entry):
+    """Gets the flattened data of a parameter from zero-copy views of buf located by the checkpoint index entry."""
+    _, data_type, content_list = entry
+    np_type = tensor_to_np_type[data_type]
+    item_size = np.dtype(np_type).itemsize
+    param_data_list = []
+    for offset, length in content_list:
+        if length == 0:
+            param_data_list.append(np.empty(0, np_type))
+        else:
+            param_data_list.append(np.frombuffer(buf, np_type, length // item_size, offset))
+    if len(param_data_list) == 1:
+        return param_data_list[0]
+    return np.concatenate(param_data_list, axis=0)
+
+
+def _read_indexed_checkpoint(ckpt_file_name, param_filter):
+    """Reads the parameters accepted by param_filter from a memory-mapped checkpoint file."""
+    with open(ckpt_file_name, "rb") as f:
+        ckpt_buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    ckpt_index = _index_checkpoint(ckpt_buf)
+    param_data_dict = {}
+    for tag, entry in ckpt_index.items():
+        if param_filter(tag):
+            param_data_dict[tag] = (entry[0], entry[1], _get_indexed_data(ckpt_buf, entry))
+    return param_data_dict
+
+
+def _is_ckpt_manifest(ckpt_file_name):
+    """Checks whether the checkpoint file is the manifest of a sharded or delta checkpoint."""
+    with open(ckpt_file_name, "rb") as f:
+        # a serialized Checkpoint always starts with the key of field `value`, which is never '{'
+        return f.read(1) == b"{"
+
+
+def _read_ckpt_manifest(ckpt_file_name):
+    """Reads the manifest of a sharded or delta checkpoint, the shard file names are resolved to paths."""
+    with open(ckpt_file_name, "r") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != CKPT_MANIFEST_VERSION:
+        raise ValueError(f"Unsupported checkpoint manifest version {manifest.get('version')}.")
+    ckpt_dir = os.path.dirname(os.path.abspath(ckpt_file_name))
+    manifest["shards"] = [os.path.join(ckpt_dir, shard) for shard in manifest["shards"]]
+    if "base" in manifest:
+        manifest["base"] = os.path.join(ckpt_dir, manifest["base"])
+    return manifest
+
+
+def _read_shard(shard_file_name, params):
+    """Reads the data of params, the manifest items of one shard, in one sequential pass over the shard file."""
+    param_data_list = []
+    with open(shard_file_name, "rb") as f:
+        for param in sorted(params, key=lambda item: item["offset"]):
+            np_type = tensor_to_np_type[param["tensor_type"]]
+            param_data = np.empty(param["length"] // np.dtype(np_type).itemsize, np_type)
+            f.seek(param["offset"])
+            if f.readinto(memoryview(param_data).cast('B')) != param["length"]:
+                raise ValueError(f"The shard file {shard_file_name} is truncated.")
+            param_data_list.append((param, param_data))
+    return param_data_list
+
+
+def _read_sharded_checkpoint(manifest, param_filter):
+    """Reads the parameters accepted by param_filter from the shards of a sharded checkpoint in parallel."""
+    shard_params = [[] for _ in manifest["shards"]]
+    for param in manifest["params"]:
+        if param_filter(param["name"]):
+            shard_params[param["shard"]].append(param)
+
+    loaded_data = {}
+    with ThreadPoolExecutor(max_workers=len(manifest["shards"])) as executor:
+        futures = [executor.submit(_read_shard, shard_file_name, params)
+                   for shard_file_name, params in zip(manifest["shards"], shard_params) if params]
+        for future in futures:
+            for param, param_data in future.result():
+                loaded_data[param["name"]] = param_data
+
+    param_data_dict = {}
+    for param in manifest["params"]:
+        if param["name"] in loaded_data:
+            param_data_dict[param["name"]] = (param["dims"], param["tensor_type"], loaded_data[param["name"]])
+    return param_data_dict
+
+
+def _read_delta_checkpoint(manifest, param_filter):
+    """Reads the parameters accepted by param_filter from the base checkpoint, patched by the chunks of a delta."""
+    base_data_dict = _read_checkpoint(manifest["base"], param_filter)
+    chunk_size = manifest["chunk_size"]
+    param_data_dict = {}
+    with open(manifest["shards"][0], "rb") as f:
+        for param in manifest["params"]:
+            name = param["name"]
+            if not param_filter(name):
+                continue
+            dims = param["dims"]
+            data_type = param["tensor_type"]
+            base_data = base_data_dict.pop(name, None)
+            if base_data is not None and base_data[0] == dims and base_data[1] == data_type:
+                # the data read from a checkpoint file may be a read-only view, copy it only when it is patched
+                param_data = np.array(base_data[2]) if param["chunks"] else base_data[2]
+            else:
+                np_type = tensor_to_np_type[data_type]
+                param_data = np.zeros(param["length"] // np.dtype(np_type).itemsize, np_type)
+            if param["chunks"]:
+                data_bytes = memoryview(param_data).cast('B')
+                for chunk_id, offset, length in param["chunks"]:
+                    f.seek(offset)
+                    begin = chunk_id * chunk_size
+                    if f.readinto(data_bytes[begin:begin + length]) != length:
+                        raise ValueError(f"The delta file {manifest['shards'][0]} is truncated.")
+            param_data_dict[name] = (dims, data_type, param_data)
+    return param_data_dict
+
+
+def _read_checkpoint(ckpt_file_name, param_filter):
+    """
+    Reads the data of the parameters accepted by param_filter from a checkpoint file of any format.
+
+    Returns:
+        Dict, key is parameter name, value is a tuple (dims, tensor_type, data), data is a flattened numpy.ndarray.
+    """
+    try:
+        if not _is_ckpt_manifest(ckpt_file_name):
+            return _read_indexed_checkpoint(ckpt_file_name, param_filter)
+        manifest = _read_ckpt_manifest(ckpt_file_name)
+        if "base" in manifest:
+            return _read_delta_checkpoint(manifest, param_filter)
+        return _read_sharded_checkpoint(manifest, param_filter)
+    except BaseException as e:
+        logger.error("Failed to read the checkpoint file `%s`, please check the correct of the file.", ckpt_file_name)
+        raise ValueError(e.__str__())
+
+
 def load_checkpoint(ckpt_file_name, net=None, strict_load=False, filter_prefix=None):
     """
     Loads checkpoint info from a specified file.
 
+    The checkpoint file is memory-mapped and indexed by parameter name, the data of every parameter is read
+    directly from the mapped file, so the parameters filtered out by filter_prefix are never read. The manifest
+    of a checkpoint saved with `shard_num` greater than 1 is also accepted, its shard files are read in parallel.
+    A delta checkpoint saved by `ModelCheckpoint` with `incremental_save` is rebuilt from its base checkpoint and
+    the chunks it saved.
+
     Args:
         ckpt_file_name (str): Checkpoint file name.
         net (Cell): Cell network. Default: None
@@ -270,48 +716,16 @@ def load_checkpoint(ckpt_file_name, net=None, strict_load=False, filter_prefix=N
                                 f"but got {str(type(prefix))} at index {index}.")
 
     logger.info("Execute the process of loading checkpoint files.")
-    checkpoint_list = Checkpoint()
 
-    try:
-        with open(ckpt_file_name, "rb") as f:
-            pb_content = f.read()
-        checkpoint_list.ParseFromString(pb_content)
-    except BaseException as e:
-        logger.error("Failed to read the checkpoint file `%s`, please check the correct of the file.", ckpt_file_name)
-        raise ValueError(e.__str__())
+    def param_filter(param_name):
+        return filter_prefix is None or not _check_param_prefix(filter_prefix, param_name)
 
+    param_data_dict = _read_checkpoint(ckpt_file_name, param_filter)
     parameter_dict = {}
     try:
-        param_data_list = []
-        for element_id, element in enumerate(checkpoint_list.value):
-            if filter_prefix is not None and _check_param_prefix(filter_prefix, element.tag):
-                continue
-            data = element.tensor.tensor_content
-            data_type = element.tensor.tensor_type
-            np_type = tensor_to_np_type[data_type]
-            ms_type = tensor_to_ms_type[data_type]
-            element_data = np.frombuffer(data, np_type)
-            param_data_list.append(element_data)
-            if (element_id == len(checkpoint_list.value) - 1) or \
-                    (element.tag != checkpoint_list.value[element_id + 1].tag):
-                param_data = np.concatenate((param_data_list), axis=0)
-                param_data_list.clear()
-                dims = element.tensor.dims
-
-                if dims == [0]:
-                    if 'Float' in data_type:
-                        param_data = float(param_data[0])
-                    elif 'Int' in data_type:
-                        param_data = int(param_data[0])
-                    parameter_dict[element.tag] = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                elif dims == [1]:
-                    parameter_dict[element.tag] = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                else:
-                    param_dim = []
-                    for dim in dims:
-                        param_dim.append(dim)
-                    param_value = param_data.reshape(param_dim)
-                    parameter_dict[element.tag] = Parameter(Tensor(param_value, ms_type), name=element.tag)
+        for name in list(param_data_dict):
+            dims, data_type, param_data = param_data_dict.pop(name)
+            parameter_dict[name] = _build_param(name, param_data, dims, data_type)
 
         logger.info("Loading checkpoint files process is finished.")
 
@@ -731,18 +1145,17 @@ def _merge_param_with_strategy(sliced_data, parameter_name, strategy, is_even):
             raise ValueError("The shape of every parameter in sliced_parameters should be the same "
                              "when slice manner is even.")
 
-        all_gather_tensor = Tensor(np.concatenate(sliced_data))
-
         if field_size > 0:
             from mindspore.parallel._tensor import _reshape_param_data_with_weight
+            all_gather_tensor = Tensor(np.concatenate(sliced_data))
             merged_tensor = _reshape_param_data_with_weight(all_gather_tensor, dev_mat, field_size)
 
         else:
-            from mindspore.parallel._tensor import _reshape_param_data
-            merged_tensor = _reshape_param_data(all_gather_tensor, dev_mat, tensor_map)
+            from mindspore.parallel._tensor import _merge_device_slices
+            merged_tensor = Tensor(_merge_device_slices(sliced_data, dev_mat, tensor_map))
 
     else:
-        from mindspore.parallel._tensor import _get_tensor_strategy, _get_tensor_slice_index
+        from mindspore.parallel._tensor import _get_tensor_strategy, _get_tensor_slice_index, _merge_tensor_slices
         tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
 
         slice_count = 1
@@ -760,20 +1173,9 @@ def _merge_param_with_strategy(sliced_data, parameter_name, strategy, is_even):
             if tensor_slices[i].shape[0] != param_split_shape[slice_index]:
                 raise ValueError(f"The slice {slice_index} is {param_split_shape[slice_index]} in 0 axis, "
                                  f"but got {tensor_slices[i].shape[0]}.")
-            tensor_slices_new[slice_index] = np.array(tensor_slices[i])
-
-        dim_len = len(tensor_strategy)
-        for i in range(dim_len):
-            ele_count = int(len(tensor_slices_new) / tensor_strategy[dim_len - 1 - i])
-            tensor_slices_new_inner = []
-            for j in range(ele_count):
-                new_tensor = tensor_slices_new[j * tensor_strategy[dim_len - 1 - i]]
-                for l in range(j * tensor_strategy[dim_len - 1 - i] + 1,
-                               (j + 1) * tensor_strategy[dim_len - 1 - i]):
-                    new_tensor = np.concatenate((new_tensor, tensor_slices_new[l]), axis=dim_len - 1 - i)
-                tensor_slices_new_inner.insert(len(tensor_slices_new_inner), np.array(new_tensor))
-            tensor_slices_new = tensor_slices_new_inner
-        merged_tensor = Tensor(tensor_slices_new[0])
+            tensor_slices_new[slice_index] = tensor_slices[i]
+
+        merged_tensor = Tensor(_merge_tensor_slices(tensor_slices_new, tensor_strategy))
 
     return merged_tensor
 
@@ -945,22 +1347,20 @@ def load_distributed_checkpoint(network, checkpoint_filenames, predict_strategy=
 
     rank_list = _infer_rank_list(train_strategy, predict_strategy)
 
-    param_dict = {}
+    param_rank_list = {}
     for _, param in network.parameters_and_names():
-        sliced_params = []
-        if param.name not in rank_list.keys():
-            continue
-        param_rank = rank_list[param.name]
-        for rank in param_rank:
-            sliced_param = _load_single_param(checkpoint_filenames[rank], param.name)
-            sliced_params.append(sliced_param)
+        if param.name in rank_list.keys():
+            param_rank_list[param.name] = rank_list[param.name]
+
+    param_dict = {}
+    for param_name, sliced_params in _read_distributed_checkpoint(checkpoint_filenames, param_rank_list):
         if len(sliced_params) == 1:
             split_param = sliced_params[0]
         else:
-            param_unique_strategy = _remove_repeated_slices(train_strategy[param.name])
-            _param_unique_strategy = _convert_to_layout(param.name, param_unique_strategy)
+            param_unique_strategy = _remove_repeated_slices(train_strategy[param_name])
+            _param_unique_strategy = _convert_to_layout(param_name, param_unique_strategy)
             split_param = _merge_and_split(sliced_params, _param_unique_strategy, predict_strategy)
-        param_dict[param.name] = split_param
+        param_dict[param_name] = split_param
 
     load_param_into_net(network, param_dict)
 
@@ -1046,58 +1446,49 @@ def _merge_and_split(sliced_params, train_strategy, predict_strategy):
     return split_param
 
 
-def _load_single_param(ckpt_file_name, param_name):
-    """Load a parameter from checkpoint."""
-    logger.info("Execute the process of loading checkpoint files.")
-    checkpoint_list = Checkpoint()
-
-    try:
-        with open(ckpt_file_name, "rb") as f:
-            pb_content = f.read()
-        checkpoint_list.ParseFromString(pb_content)
-    except BaseException as e:
-        logger.error("Failed to read the checkpoint file `%s`, please check the correct of the file.", ckpt_file_name)
-        raise ValueError(e.__str__())
+def _read_distributed_checkpoint(checkpoint_filenames, param_rank_list):
+    """
+    Reads the slices of the parameters from the checkpoint files of the ranks, every file is read once and the files
+    are read in parallel.
 
-    parameter = None
-    try:
-        param_data_list = []
-        for element_id, element in enumerate(checkpoint_list.value):
-            if element.tag != param_name:
-                continue
-            data = element.tensor.tensor_content
-            data_type = element.tensor.tensor_type
-            np_type = tensor_to_np_type[data_type]
-            ms_type = tensor_to_ms_type[data_type]
-            element_data = np.frombuffer(data, np_type)
-            param_data_list.append(element_data)
-            if (element_id == len(checkpoint_list.value) - 1) or \
-                    (element.tag != checkpoint_list.value[element_id + 1].tag):
-                param_data = np.concatenate((param_data_list), axis=0)
-                param_data_list.clear()
-                dims = element.tensor.dims
-                if dims == [0]:
-                    if 'Float' in data_type:
-                        param_data = float(param_data[0])
-                    elif 'Int' in data_type:
-                        param_data = int(param_data[0])
-                    parameter = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                elif dims == [1]:
-                    parameter = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                else:
-                    param_dim = []
-                    for dim in dims:
-                        param_dim.append(dim)
-                    param_value = param_data.reshape(param_dim)
-                    parameter = Parameter(Tensor(param_value, ms_type), name=element.tag)
-            break
-        logger.info("Loading checkpoint files process is finished.")
+    Args:
+        checkpoint_filenames (list[str]): The checkpoint files in order of rank id.
+        param_rank_list (dict): Key is parameter name, value is the list of the ranks holding its slices.
 
-    except BaseException as e:
-        logger.error("Failed to load the checkpoint file `%s`.", ckpt_file_name)
-        raise RuntimeError(e.__str__())
+    Yields:
+        Tuple, the parameter name and the list of its sliced Parameter in order of its ranks, as soon as the files of
+        all its ranks are read.
+    """
+    rank_param_names = {}
+    remaining_ranks = {}
+    for param_name, ranks in param_rank_list.items():
+        for rank in ranks:
+            rank_param_names.setdefault(rank, set()).add(param_name)
+        remaining_ranks[param_name] = len(set(ranks))
+    if not rank_param_names:
+        return
 
-    if parameter is None:
-        raise ValueError(f"There is no parameter named {param_name} in this checkpoint file {ckpt_file_name}, "
-                         f"please check parameter name or checkpoint file.")
-    return parameter
+    rank_data = {}
+    max_workers = min(len(rank_param_names), DISTRIBUTED_CKPT_READERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_read_checkpoint, checkpoint_filenames[rank], param_names.__contains__): rank
+                   for rank, param_names in rank_param_names.items()}
+        for future in as_completed(futures):
+            rank = futures[future]
+            rank_data[rank] = future.result()
+            for param_name in rank_param_names[rank]:
+                if param_name not in rank_data[rank]:
+                    raise ValueError(f"There is no parameter named {param_name} in this checkpoint file "
+                                     f"{checkpoint_filenames[rank]}, please check parameter name or checkpoint file.")
+                remaining_ranks[param_name] -= 1
+                if remaining_ranks[param_name]:
+                    continue
+                ranks = param_rank_list[param_name]
+                sliced_params = []
+                for param_rank in ranks:
+                    dims, data_type, param_data = rank_data[param_rank][param_name]
+                    sliced_params.append(_build_param(param_name, param_data, dims, data_type))
+                # the data read from a file is released once all its parameters are built
+                for param_rank in set(ranks):
+                    del rank_data[param_rank][param_name]
+                yield param_name, sliced_params
@@ -267,35 +267,36 @@ def _fill_histogram_summary(tag: str, np_value: np.ndarray, summary) -> None:
         summary (summary_pb2.Summary.Histogram): Summary histogram data.
     """
     logger.debug(f"Set({tag}) the histogram summary value")
-    # Default bucket for tensor with no valid data.
-    ma_value = np.ma.masked_invalid(np_value)
-    total, valid = np_value.size, ma_value.count()
-    invalids = []
-    for isfn in np.isnan, np.isposinf, np.isneginf:
-        if total - valid > sum(invalids):
-            count = np.count_nonzero(isfn(np_value))
-            invalids.append(count)
-        else:
-            invalids.append(0)
+    total = np_value.size
+    is_float = issubclass(np_value.dtype.type, np.floating)
+    valid_value = np_value
+    valid = total
+    if is_float:
+        # the invalid values are only counted and excluded when there are any
+        is_finite = np.isfinite(np_value)
+        valid = np.count_nonzero(is_finite)
+        if valid < total:
+            nan_count = np.count_nonzero(np.isnan(np_value))
+            pos_inf_count = np.count_nonzero(np.isposinf(np_value))
+            summary.nan_count, summary.pos_inf_count = nan_count, pos_inf_count
+            summary.neg_inf_count = total - valid - nan_count - pos_inf_count
+            valid_value = np_value[is_finite]
 
     summary.count = total
-    summary.nan_count, summary.pos_inf_count, summary.neg_inf_count = invalids
     if not valid:
         logger.warning(f'There are no valid values in the ndarray(size={total}, shape={np_value.shape})')
         # summary.{min, max, sum} are 0s by default, no need to explicitly set
     else:
-        # BUG: max of a masked array with dtype np.float16 returns inf
-        # See numpy issue#15077
-        if issubclass(np_value.dtype.type, np.floating):
-            summary.min = ma_value.min(fill_value=np.PINF)
-            summary.max = ma_value.max(fill_value=np.NINF)
-            if summary.min < F32_MIN or summary.max > F32_MAX:
-                logger.warning(f'Values({summary.min}, {summary.max}) are too large, '
-                               f'you may encounter some undefined behaviours hereafter.')
+        summary.min = valid_value.min()
+        summary.max = valid_value.max()
+        if is_float and (summary.min < F32_MIN or summary.max > F32_MAX):
+            logger.warning(f'Values({summary.min}, {summary.max}) are too large, '
+                           f'you may encounter some undefined behaviours hereafter.')
+        if valid < total:
+            # summing with zeros in place of the invalid values rounds as summing the masked array does
+            summary.sum = np.where(is_finite, np_value, 0).sum(dtype=np.float64)
         else:
-            summary.min = ma_value.min()
-            summary.max = ma_value.max()
-        summary.sum = ma_value.sum(dtype=np.float64)
+            summary.sum = np_value.sum(dtype=np.float64)
         bins = _calc_histogram_bins(valid)
         first_edge, last_edge = summary.min, summary.max
 
@@ -304,7 +305,7 @@ def _fill_histogram_summary(tag: str, np_value: np.ndarray, summary) -> None:
             last_edge += 0.5
 
         bins = np.linspace(first_edge, last_edge, bins + 1, dtype=np_value.dtype)
-        hists, edges = np.histogram(np_value, bins=bins)
+        hists, edges = np.histogram(valid_value, bins=bins)
 
         for hist, edge1, edge2 in zip(hists, edges, edges[1:]):
             bucket = summary.buckets.add()
@@ -14,8 +14,10 @@
 # ============================================================================
 """Write events to disk in a base directory."""
 import os
+import queue
+import threading
 import time
-from collections import deque
+from functools import partial
 
 import mindspore.log as logger
 
@@ -30,6 +32,9 @@ try:
 except ValueError:
     import multiprocessing as ctx
 
+# The data of these plugins are dropped instead of blocking the training when the writing falls behind.
+_LOW_PRIORITY_PLUGINS = ('histogram', 'image')
+
 
 def _pack_data(datadict, wall_time):
     """Pack data according to which plugin."""
@@ -63,31 +68,54 @@ class WriterPool(ctx.Process):
     def __init__(self, base_dir, max_file_size, **filedict) -> None:
         super().__init__()
         self._base_dir, self._filedict = base_dir, filedict
-        self._queue, self._writers_ = ctx.Queue(ctx.cpu_count() * 2), None
+        self._queue_size = ctx.cpu_count() * 2
+        self._queue, self._writers_ = ctx.Queue(self._queue_size), None
         self._max_file_size = max_file_size
+        self._dropped = 0
+        self._lock, self._packed, self._next_index = None, None, 0
         self.start()
 
     def run(self):
+        self._lock, self._packed, self._next_index = threading.Lock(), {}, 0
+        # at most as many data as the queue holds are packed at a time, so the queue gets full when the writing
+        # falls behind
+        packing = threading.BoundedSemaphore(self._queue_size)
         with ctx.Pool(min(ctx.cpu_count(), 32)) as pool:
-            deq = deque()
+            index = 0
             while True:
-                while deq and deq[0].ready():
-                    for plugin, data in deq.popleft().get():
-                        self._write(plugin, data)
-
-                if not self._queue.empty():
-                    action, data = self._queue.get()
-                    if action == 'WRITE':
-                        deq.append(pool.apply_async(_pack_data, (data, time.time())))
-                    elif action == 'FLUSH':
+                action, data = self._queue.get()
+                if action == 'WRITE':
+                    packing.acquire()
+                    callback = partial(self._on_packed, index, packing)
+                    pool.apply_async(_pack_data, (data, time.time()), callback=callback, error_callback=callback)
+                    index += 1
+                elif action == 'FLUSH':
+                    with self._lock:
                         self._flush()
-                    elif action == 'END':
-                        break
-            for result in deq:
-                for plugin, data in result.get():
-                    self._write(plugin, data)
-
-            self._close()
+                elif action == 'END':
+                    break
+            # wait for the callbacks of all the data
+            pool.close()
+            pool.join()
+
+        self._close()
+
+    def _on_packed(self, index, packing, result):
+        """Write the packed data in the order of the writes, called by the pool when the data of index are packed."""
+        packing.release()
+        if isinstance(result, Exception):
+            logger.warning(f'Failed to pack the summary data, they are discarded. {result}')
+            result = []
+        with self._lock:
+            self._packed[index] = result
+            while self._next_index in self._packed:
+                try:
+                    for plugin, data in self._packed.pop(self._next_index):
+                        self._write(plugin, data)
+                except Exception as e: # pylint: disable=broad-except
+                    # an exception would stop the callbacks of the pool
+                    logger.error(f'Failed to write the summary data. {e}')
+                self._next_index += 1
 
     @property
     def _writers(self):
@@ -129,10 +157,25 @@ class WriterPool(ctx.Process):
         """
         Write the event to file.
 
+        When the queue is full, the data of the low priority plugins, histogram and image, are dropped instead of
+        waiting for the writing.
+
         Args:
-            data (Optional[str, Tuple[list, int]]): The data to write.
+            data (dict): The mapping from plugin to the list of data to write.
         """
-        self._queue.put(('WRITE', data))
+        try:
+            self._queue.put_nowait(('WRITE', data))
+            return
+        except queue.Full:
+            pass
+        kept = {plugin: datalist for plugin, datalist in data.items() if plugin not in _LOW_PRIORITY_PLUGINS}
+        if len(kept) < len(data):
+            if not self._dropped:
+                logger.warning(f'The summary writing falls behind, the data of {_LOW_PRIORITY_PLUGINS} are dropped '
+                               f'when it does.')
+            self._dropped += 1
+        if kept:
+            self._queue.put(('WRITE', kept))
 
     def flush(self):
         """Flush the writer and sync data to disk."""
@@ -17,9 +17,15 @@ import os
 import pickle
 import collections
 import argparse
+import itertools
+import multiprocessing
 import numpy as np
+import pandas as pd
 from mindspore.mindrecord import FileWriter
 
+# the arguments of the worker processes, set by _init_worker
+_WORKER_CONTEXT = {}
+
 
 class StatsDict():
     """preprocessed data"""
@@ -45,32 +51,37 @@ class StatsDict():
         self.cat2id_dict.update(
             {self.oov_prefix + col: i + len(self.val_cols) for i, col in enumerate(self.cat_cols)})
 
-    def stats_vals(self, val_list):
-        """Handling weights column"""
-        assert len(val_list) == len(self.val_cols)
-
-        def map_max_min(i, val):
-            key = self.val_cols[i]
-            if val != "":
-                if float(val) > self.val_max_dict[key]:
-                    self.val_max_dict[key] = float(val)
-                if float(val) < self.val_min_dict[key]:
-                    self.val_min_dict[key] = float(val)
-
-        for i, val in enumerate(val_list):
-            map_max_min(i, val)
-
-    def stats_cats(self, cat_list):
-        """Handling cats column"""
-
-        assert len(cat_list) == len(self.cat_cols)
-
-        def map_cat_count(i, cat):
-            key = self.cat_cols[i]
-            self.cat_count_dict[key][cat] += 1
-
-        for i, cat in enumerate(cat_list):
-            map_cat_count(i, cat)
+    def stats_vals(self, values):
+        """Handling weights column of a chunk of lines, values is a 2-D array of str"""
+        assert values.shape[1] == len(self.val_cols)
+        for i, key in enumerate(self.val_cols):
+            col = values[:, i]
+            col = col[col != ""].astype(np.float64)
+            col = col[~np.isnan(col)]
+            if col.size:
+                # the initial 0 is kept unless a value exceeds it
+                self.val_max_dict[key] = max(self.val_max_dict[key], float(col.max()))
+                self.val_min_dict[key] = min(self.val_min_dict[key], float(col.min()))
+
+    def stats_cats(self, cats):
+        """Handling cats column of a chunk of lines, cats is a 2-D array of str"""
+        assert cats.shape[1] == len(self.cat_cols)
+        for i, key in enumerate(self.cat_cols):
+            # the cats are counted in the order they first appear
+            codes, uniques = pd.factorize(cats[:, i])
+            cat_count_d = self.cat_count_dict[key]
+            for cat, count in zip(uniques, np.bincount(codes, minlength=len(uniques)).tolist()):
+                cat_count_d[cat] += count
+
+    def merge(self, other):
+        """Merge the stats of the lines after those of self"""
+        for key in self.val_cols:
+            self.val_max_dict[key] = max(self.val_max_dict[key], other.val_max_dict[key])
+            self.val_min_dict[key] = min(self.val_min_dict[key], other.val_min_dict[key])
+        for key in self.cat_cols:
+            cat_count_d = self.cat_count_dict[key]
+            for cat, count in other.cat_count_dict[key].items():
+                cat_count_d[cat] += count
 
     def save_dict(self, dict_path, prefix=""):
         with open(os.path.join(dict_path, "{}val_max_dict.pkl".format(prefix)), "wb") as file_wrt:
@@ -99,38 +110,35 @@ class StatsDict():
         print("cat2id.dict.items()[:50]:{}".format(list(self.cat2id_dict.items())[:50]))
 
     def map_cat2id(self, values, cats):
-        """Cat to id"""
-
-        def minmax_scale_value(i, val):
-            max_v = float(self.val_max_dict["val_{}".format(i + 1)])
-            return float(val) * 1.0 / max_v
-
-        id_list = []
-        weight_list = []
-        for i, val in enumerate(values):
-            if val == "":
-                id_list.append(i)
-                weight_list.append(0)
-            else:
-                key = "val_{}".format(i + 1)
-                id_list.append(self.cat2id_dict[key])
-                weight_list.append(minmax_scale_value(i, float(val)))
-
-        for i, cat_str in enumerate(cats):
-            key = "cat_{}".format(i + 1) + "_" + cat_str
-            if key in self.cat2id_dict:
-                if self.skip_id_convert is True:
+        """Cat to id of a chunk of lines, values and cats are 2-D arrays of str, returns the ids and weights"""
+        val_num = len(self.val_cols)
+        ids = np.empty((values.shape[0], val_num + len(self.cat_cols)), dtype=np.int64)
+        weights = np.zeros(ids.shape, dtype=np.float64)
+        for i, key in enumerate(self.val_cols):
+            col = values[:, i]
+            mask = col != ""
+            ids[:, i] = np.where(mask, self.cat2id_dict[key], i)
+            max_v = float(self.val_max_dict[key])
+            weights[mask, i] = col[mask].astype(np.float64) / max_v
+
+        for i, key in enumerate(self.cat_cols):
+            codes, uniques = pd.factorize(cats[:, i])
+            oov_id = self.cat2id_dict[self.oov_prefix + key]
+            unique_ids = []
+            for cat_str in uniques:
+                cat_id = self.cat2id_dict.get(key + "_" + cat_str)
+                if cat_id is None:
+                    cat_id = oov_id
+                elif self.skip_id_convert is True:
                     # For the synthetic data, if the generated id is between [0, max_vcoab], but the num examples is l
                     # ess than vocab_size/ slot_nums the id will still be converted to [0, real_vocab], where real_vocab
                     # the actually the vocab size, rather than the max_vocab. So a simple way to alleviate this
                     # problem is skip the id convert, regarding the synthetic data id as the final id.
-                    id_list.append(cat_str)
-                else:
-                    id_list.append(self.cat2id_dict[key])
-            else:
-                id_list.append(self.cat2id_dict[self.oov_prefix + "cat_{}".format(i + 1)])
-            weight_list.append(1.0)
-        return id_list, weight_list
+                    cat_id = int(cat_str)
+                unique_ids.append(cat_id)
+            ids[:, val_num + i] = np.array(unique_ids, dtype=np.int64)[codes]
+        weights[:, val_num:] = 1.0
+        return ids, weights
 
 
 def mkdir_path(file_path):
@@ -138,52 +146,112 @@ def mkdir_path(file_path):
         os.makedirs(file_path)
 
 
-def statsdata(file_path, dict_output_path, recommendation_dataset_stats_dict, dense_dim=13, slot_dim=26):
-    """Preprocess data and save data"""
+def _init_worker(recommendation_dataset_stats_dict, dense_dim, slot_dim):
+    _WORKER_CONTEXT["stats"] = recommendation_dataset_stats_dict
+    _WORKER_CONTEXT["dense_dim"] = dense_dim
+    _WORKER_CONTEXT["slot_dim"] = slot_dim
+
+
+def _read_chunks(file_path, chunk_lines):
+    """Read the lines of a file by chunks, yield the index of the first line and the lines of every chunk"""
     with open(file_path, encoding="utf-8") as file_in:
-        errorline_list = []
-        count = 0
-        for line in file_in:
-            count += 1
-            line = line.strip("\n")
-            items = line.split("\t")
-            if len(items) != (dense_dim + slot_dim + 1):
-                errorline_list.append(count)
-                print("Found line length: {}, suppose to be {}, the line is {}".format(len(items),
+        start = 0
+        while True:
+            lines = list(itertools.islice(file_in, chunk_lines))
+            if not lines:
+                return
+            yield start, lines
+            start += len(lines)
+
+
+def _imap_chunks(pool, func, chunks, max_pending):
+    """Apply func to the chunks in the pool, yield the results in order, with at most max_pending chunks in flight"""
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(func, (chunk,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _split_lines(lines, items_num):
+    """Split the lines into a 2-D array of str, returns it and the (offset, items size, line) of the wrong lines"""
+    rows = []
+    errors = []
+    for i, line in enumerate(lines):
+        line = line.strip("\n")
+        items = line.split("\t")
+        if len(items) != items_num:
+            errors.append((i, len(items), line))
+            continue
+        rows.append(items)
+    return np.array(rows, dtype=object).reshape(len(rows), items_num), errors
+
+
+def _stats_chunk(chunk):
+    """Stats of a chunk of lines in a worker process"""
+    start, lines = chunk
+    stats = _WORKER_CONTEXT["stats"]
+    dense_dim = _WORKER_CONTEXT["dense_dim"]
+    data, errors = _split_lines(lines, dense_dim + _WORKER_CONTEXT["slot_dim"] + 1)
+    chunk_stats = StatsDict(stats.field_size, stats.dense_dim, stats.slot_dim, stats.skip_id_convert)
+    chunk_stats.stats_vals(data[:, 1:dense_dim + 1])
+    chunk_stats.stats_cats(data[:, dense_dim + 1:])
+    return len(lines), [(start + i, items_num, line) for i, items_num, line in errors], chunk_stats
+
+
+def statsdata(file_path, dict_output_path, recommendation_dataset_stats_dict, dense_dim=13, slot_dim=26,
+              chunk_lines=100000, num_workers=8):
+    """Preprocess data and save data"""
+    count = 0
+    with multiprocessing.Pool(num_workers, initializer=_init_worker,
+                              initargs=(recommendation_dataset_stats_dict, dense_dim, slot_dim)) as pool:
+        for lines_num, errors, chunk_stats in _imap_chunks(pool, _stats_chunk, _read_chunks(file_path, chunk_lines),
+                                                           2 * num_workers):
+            for _, items_num, line in errors:
+                print("Found line length: {}, suppose to be {}, the line is {}".format(items_num,
                                                                                        dense_dim + slot_dim + 1, line))
-                continue
-            if count % 1000000 == 0:
-                print("Have handled {}w lines.".format(count // 10000))
-            values = items[1: dense_dim + 1]
-            cats = items[dense_dim + 1:]
-
-            assert len(values) == dense_dim, "values.size: {}".format(len(values))
-            assert len(cats) == slot_dim, "cats.size: {}".format(len(cats))
-            recommendation_dataset_stats_dict.stats_vals(values)
-            recommendation_dataset_stats_dict.stats_cats(cats)
+            recommendation_dataset_stats_dict.merge(chunk_stats)
+            if (count + lines_num) // 1000000 > count // 1000000:
+                print("Have handled {}w lines.".format((count + lines_num) // 10000))
+            count += lines_num
     recommendation_dataset_stats_dict.save_dict(dict_output_path)
 
 
+def _map_chunk(chunk):
+    """Ids, weights and labels of a chunk of lines in a worker process"""
+    start, lines = chunk
+    stats = _WORKER_CONTEXT["stats"]
+    dense_dim = _WORKER_CONTEXT["dense_dim"]
+    data, errors = _split_lines(lines, dense_dim + _WORKER_CONTEXT["slot_dim"] + 1)
+    valid = np.ones(len(lines), dtype=np.bool_)
+    valid[[i for i, _, _ in errors]] = False
+    labels = data[:, 0].astype(np.float64).astype(np.float32)
+    ids, weights = stats.map_cat2id(data[:, 1:dense_dim + 1], data[:, dense_dim + 1:])
+    return (len(lines), start + np.flatnonzero(valid), ids.astype(np.int32), weights.astype(np.float32), labels,
+            [start + i for i, _, _ in errors])
+
+
 def random_split_trans2mindrecord(input_file_path, output_file_path, recommendation_dataset_stats_dict,
                                   part_rows=2000000, line_per_sample=1000, train_line_count=None,
-                                  test_size=0.1, seed=2020, dense_dim=13, slot_dim=26):
+                                  test_size=0.1, seed=2020, dense_dim=13, slot_dim=26,
+                                  chunk_lines=100000, num_workers=8):
     """Random split data and save mindrecord"""
     if train_line_count is None:
         raise ValueError("Please provide training file line count")
     test_size = int(train_line_count * test_size)
-    all_indices = [i for i in range(train_line_count)]
     np.random.seed(seed)
-    np.random.shuffle(all_indices)
+    all_indices = np.random.permutation(train_line_count)
     print("all_indices.size:{}".format(len(all_indices)))
-    test_indices_set = set(all_indices[:test_size])
-    print("test_indices_set.size:{}".format(len(test_indices_set)))
+    is_test = np.zeros(train_line_count, dtype=np.bool_)
+    is_test[all_indices[:test_size]] = True
+    del all_indices
+    print("test_indices_set.size:{}".format(np.count_nonzero(is_test)))
     print("-----------------------" * 10 + "\n" * 2)
 
     train_data_list = []
     test_data_list = []
-    ids_list = []
-    wts_list = []
-    label_list = []
 
     writer_train = FileWriter(os.path.join(output_file_path, "train_input_part.mindrecord"), 21)
     writer_test = FileWriter(os.path.join(output_file_path, "test_input_part.mindrecord"), 3)
@@ -193,44 +261,35 @@ def random_split_trans2mindrecord(input_file_path, output_file_path, recommendat
     writer_train.add_schema(schema, "CRITEO_TRAIN")
     writer_test.add_schema(schema, "CRITEO_TEST")
 
-    with open(input_file_path, encoding="utf-8") as file_in:
-        items_error_size_lineCount = []
-        count = 0
-        train_part_number = 0
-        test_part_number = 0
-        for i, line in enumerate(file_in):
-            count += 1
-            if count % 1000000 == 0:
-                print("Have handle {}w lines.".format(count // 10000))
-            line = line.strip("\n")
-            items = line.split("\t")
-            if len(items) != (1 + dense_dim + slot_dim):
-                items_error_size_lineCount.append(i)
-                continue
-            label = float(items[0])
-            values = items[1:1 + dense_dim]
-            cats = items[1 + dense_dim:]
-
-            assert len(values) == dense_dim, "values.size: {}".format(len(values))
-            assert len(cats) == slot_dim, "cats.size: {}".format(len(cats))
-
-            ids, wts = recommendation_dataset_stats_dict.map_cat2id(values, cats)
-
-            ids_list.extend(ids)
-            wts_list.extend(wts)
-            label_list.append(label)
-
-            if count % line_per_sample == 0:
-                if i not in test_indices_set:
-                    train_data_list.append({"feat_ids": np.array(ids_list, dtype=np.int32),
-                                            "feat_vals": np.array(wts_list, dtype=np.float32),
-                                            "label": np.array(label_list, dtype=np.float32)
-                                            })
+    items_error_size_lineCount = []
+    count = 0
+    train_part_number = 0
+    test_part_number = 0
+    # the ids, weights and labels of the lines of the current sample in the previous chunks
+    sample_parts = []
+    with multiprocessing.Pool(num_workers, initializer=_init_worker,
+                              initargs=(recommendation_dataset_stats_dict, dense_dim, slot_dim)) as pool:
+        for lines_num, line_indices, ids, weights, labels, errors in \
+                _imap_chunks(pool, _map_chunk, _read_chunks(input_file_path, chunk_lines), 2 * num_workers):
+            items_error_size_lineCount.extend(errors)
+            if (count + lines_num) // 1000000 > count // 1000000:
+                print("Have handle {}w lines.".format((count + lines_num) // 10000))
+            count += lines_num
+
+            # a sample ends at a line whose number is a multiple of line_per_sample
+            start = 0
+            for end in np.flatnonzero((line_indices + 1) % line_per_sample == 0) + 1:
+                sample_parts.append((ids[start:end], weights[start:end], labels[start:end]))
+                sample = {"feat_ids": np.concatenate([part[0] for part in sample_parts]).ravel(),
+                          "feat_vals": np.concatenate([part[1] for part in sample_parts]).ravel(),
+                          "label": np.concatenate([part[2] for part in sample_parts])
+                          }
+                sample_parts = []
+                i = line_indices[end - 1]
+                if i < train_line_count and is_test[i]:
+                    test_data_list.append(sample)
                 else:
-                    test_data_list.append({"feat_ids": np.array(ids_list, dtype=np.int32),
-                                           "feat_vals": np.array(wts_list, dtype=np.float32),
-                                           "label": np.array(label_list, dtype=np.float32)
-                                           })
+                    train_data_list.append(sample)
                 if train_data_list and len(train_data_list) % part_rows == 0:
                     writer_train.write_raw_data(train_data_list)
                     train_data_list.clear()
@@ -240,15 +299,14 @@ def random_split_trans2mindrecord(input_file_path, output_file_path, recommendat
                     writer_test.write_raw_data(test_data_list)
                     test_data_list.clear()
                     test_part_number += 1
-
-                ids_list.clear()
-                wts_list.clear()
-                label_list.clear()
-
-        if train_data_list:
-            writer_train.write_raw_data(train_data_list)
-        if test_data_list:
-            writer_test.write_raw_data(test_data_list)
+                start = end
+            if start < len(line_indices):
+                sample_parts.append((ids[start:], weights[start:], labels[start:]))
+
+    if train_data_list:
+        writer_train.write_raw_data(train_data_list)
+    if test_data_list:
+        writer_test.write_raw_data(test_data_list)
     writer_train.commit()
     writer_test.commit()
 
@@ -269,6 +327,7 @@ if __name__ == '__main__':
     parser.add_argument("--train_line_count", type=int, help='The number of examples in your dataset')
     parser.add_argument("--skip_id_convert", type=int, default=0, choices=[0, 1],
                         help='Skip the id convert, regarding the original id as the final id.')
+    parser.add_argument("--num_workers", type=int, default=8, help='The number of processes handling the lines')
 
     args, _ = parser.parse_known_args()
     data_path = args.data_path
@@ -279,7 +338,8 @@ if __name__ == '__main__':
     data_file_path = data_path + "origin_data/train.txt"
     stats_output_path = data_path + "stats_dict/"
     mkdir_path(stats_output_path)
-    statsdata(data_file_path, stats_output_path, stats, dense_dim=args.dense_dim, slot_dim=args.slot_dim)
+    statsdata(data_file_path, stats_output_path, stats, dense_dim=args.dense_dim, slot_dim=args.slot_dim,
+              num_workers=args.num_workers)
 
     stats.load_dict(dict_path=stats_output_path, prefix="")
     stats.get_cat2id(threshold=args.threshold)
@@ -289,4 +349,5 @@ if __name__ == '__main__':
     mkdir_path(output_path)
     random_split_trans2mindrecord(in_file_path, output_path, stats, part_rows=2000000,
                                   train_line_count=args.train_line_count, line_per_sample=1000,
-                                  test_size=0.1, seed=2020, dense_dim=args.dense_dim, slot_dim=args.slot_dim)
+                                  test_size=0.1, seed=2020, dense_dim=args.dense_dim, slot_dim=args.slot_dim,
+                                  num_workers=args.num_workers)
@@ -0,0 +1,110 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===========================================================================
+"""Test split by pattern"""
+import model
+from model import graph_split as split
+
+
+def get_area(sp, name):
+    """Get the area of the op named name"""
+    for area in sp.areas:
+        if name in [op.output.name for op in area.ops]:
+            return area
+    raise ValueError("not found op: " + name)
+
+
+def check_topo_order(sp):
+    """Check the topological order of the areas is kept"""
+    for area in sp.areas:
+        assert sp.topo_order[area.topo_pos] is area
+        for out in area.out_relations:
+            assert out.topo_pos > area.topo_pos
+    assert sorted(a.topo_pos for a in sp.areas) == [i for i, a in enumerate(sp.topo_order) if a is not None]
+
+
+def split_names(graph):
+    """Split graph, return the op names of the subgraphs and the splitter"""
+    sp = split.GraphSplitByPattern(graph)
+    subgraphs, graphmodes = sp.split()
+    return [[op.output.name for op in g.ops] for g in subgraphs], graphmodes, sp
+
+
+def graph_diamond():
+    ''' diamond, the fusion of a and d would make a circle through b and c '''
+    gb = model.GraphBuilder()
+    with gb.graph_scope("main"):
+        a0 = gb.tensor([1024, 1024], "float32", name="a0")
+        a = gb.emit("Abs", a0, 'a')
+        b = gb.emit("Abs", a, 'b')
+        c = gb.tensor([1024, 1024], "float32", name="c")
+        gb.op("Transpose", c, [b], attrs={'perm': (1, 0)})
+        gb.emit("TensorAdd", [a, c], 'd')
+    return gb.get()[0]
+
+
+def graph_backward():
+    ''' broadcast x is fused backward into y, across the unrelated areas u and v '''
+    gb = model.GraphBuilder()
+    with gb.graph_scope("main"):
+        a0 = gb.tensor([1, 1024], "float32", name="a0")
+        a1 = gb.tensor([1024, 1024], "float32", name="a1")
+        x = gb.emit("Abs", a0, 'x')
+        u = gb.emit("Abs", a1, 'u')
+        v = gb.emit("ReduceSum", u, 'v', attrs={'reduce_axis': (0,), 'keep_dims': True})
+        y = gb.emit("BroadcastTo", x, 'y', attrs={'shape': [1024, 1024]})
+        gb.emit("TensorAdd", [y, v], 'z')
+    return gb.get()[0]
+
+
+def test_check_circle():
+    """Test the circle check of a diamond"""
+    sp = split.GraphSplitByPattern(graph_diamond())
+    a, b, d = get_area(sp, 'a'), get_area(sp, 'b'), get_area(sp, 'd')
+    assert not a.check_circle(d)
+    assert a.check_circle(b)
+
+
+def test_split_diamond():
+    """Test the split of a diamond does not fuse a circle"""
+    subgraphs, graphmodes, sp = split_names(graph_diamond())
+    assert subgraphs == [['a', 'b', 'c'], ['d']]
+    assert graphmodes == ['composite', 'basic']
+    check_topo_order(sp)
+
+
+def test_fuse_backward():
+    """Test the topological order is updated in the window of a backward fusion"""
+    sp = split.GraphSplitByPattern(graph_backward())
+    x, u, v, y, z = [get_area(sp, name) for name in ('x', 'u', 'v', 'y', 'z')]
+    assert sp.topo_order == [x, u, y, v, z]
+
+    def _selector(dom):
+        return ([y], False) if dom is x else None
+    assert sp.fuse(_selector)
+    assert sp.areas == [u, v, y, z]
+    # the op of the higher pattern is the dominant op
+    assert [op.output.name for op in y.ops] == ['y', 'x']
+    # u, which does not reach y, is moved after it
+    assert sp.topo_order == [y, u, None, v, z]
+    check_topo_order(sp)
+    assert y.check_circle(z)
+
+
+def test_split_backward():
+    """Test the split with a backward fusion"""
+    subgraphs, graphmodes, sp = split_names(graph_backward())
+    assert subgraphs == [['u', 'v'], ['x', 'y', 'z']]
+    assert graphmodes == ['composite', 'composite']
+    check_topo_order(sp)
@@ -476,6 +476,58 @@ def test_generator_17():
         i = i + 1
 
 
+def test_generator_18():
+    """
+    Test large multi column generator MP through shared memory, and rows larger than max_rowsize
+    """
+    logger.info("Test generator MP with shared memory")
+
+    source = [(np.full([x, 256, 256], x, np.uint8), np.array([x]), np.array(["str" + str(x)])) for x in range(32)]
+    for max_rowsize in [0, 1, 6]:
+        data1 = ds.GeneratorDataset(source, ["col0", "col1", "col2"], sampler=ds.SequentialSampler(),
+                                    num_parallel_workers=4, python_multiprocessing=True, max_rowsize=max_rowsize)
+        i = 0
+        for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):
+            np.testing.assert_array_equal(item["col0"], source[i][0])
+            np.testing.assert_array_equal(item["col1"], source[i][1])
+            np.testing.assert_array_equal(item["col2"], source[i][2])
+            i = i + 1
+        assert i == 32
+
+
+def test_generator_getitems():
+    """
+    Test random accessible generator with __getitems__, single worker and MP
+    """
+    logger.info("Test generator with __getitems__")
+
+    class MyDS():
+        def __init__(self):
+            self.data = np.arange(100)
+            self.batch_calls = 0
+
+        def __getitem__(self, item):
+            return (np.array([self.data[item]]),)
+
+        def __getitems__(self, items):
+            self.batch_calls += 1
+            return [(np.array([self.data[item]]),) for item in items]
+
+        def __len__(self):
+            return 100
+
+    source = MyDS()
+    for num_parallel_workers in [1, 4]:
+        data1 = ds.GeneratorDataset(source, ["data"], sampler=ds.SequentialSampler(),
+                                    num_parallel_workers=num_parallel_workers)
+        i = 0
+        for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):
+            np.testing.assert_array_equal(item["data"], np.array([i]))
+            i = i + 1
+        assert i == 100
+    assert source.batch_calls > 0
+
+
 def test_generator_error_1():
     def generator_np():
         for i in range(64):
@@ -764,6 +816,8 @@ if __name__ == "__main__":
     test_generator_15()
     test_generator_16()
     test_generator_17()
+    test_generator_18()
+    test_generator_getitems()
     test_generator_error_1()
     test_generator_error_2()
     test_generator_error_3()
@@ -0,0 +1,157 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test image classification runner"""
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import mindspore as ms
+import mindspore.dataset as ds
+import mindspore.nn as nn
+from mindspore.ops import operations as P
+from mindspore.explainer import ImageClassificationRunner
+from mindspore.explainer.benchmark._attribution.metric import LabelAgnosticMetric
+from mindspore.explainer.explanation._attribution.attribution import Attribution
+
+BATCH_NUM = 3
+BATCH_SIZE = 2
+LABELS = ["cat", "dog", "bird"]
+
+
+class FakeNet(nn.Cell):
+    """ network averaging every channel into the logit of a class """
+
+    def __init__(self):
+        super(FakeNet, self).__init__()
+        self.mean = P.ReduceMean()
+
+    def construct(self, x):
+        return self.mean(x, (2, 3))
+
+
+class FakeExplainer(Attribution):
+    """ explainer with a constant saliency map, its benchmark score is its saliency value """
+    saliency_value = 1.0
+
+    def __call__(self, inputs, targets):
+        shape = inputs.shape
+        return ms.Tensor(np.full((shape[0], 1, shape[2], shape[3]), self.saliency_value, np.float32))
+
+
+class FakeExplainerA(FakeExplainer):
+    saliency_value = 1.0
+
+
+class FakeExplainerB(FakeExplainer):
+    saliency_value = 2.0
+
+
+class FakeMetric(LabelAgnosticMetric):
+    """ metric scoring an explainer by its saliency value """
+
+    def evaluate(self, explainer, inputs):
+        return float(explainer.saliency_value)
+
+
+class FakeSummary:
+    """ summary recording the values added """
+
+    def __init__(self):
+        self.values = []
+
+    def add_value(self, plugin, name, value):
+        self.values.append((name, value))
+
+    def record(self, step):
+        pass
+
+    def get_values(self, name):
+        return [value for value_name, value in self.values if value_name == name]
+
+
+class CountingDataset:
+    """ dataset counting the passes and the batches iterated """
+
+    def __init__(self, dataset):
+        self._dataset = dataset
+        self.pass_num = 0
+        self.batch_num = 0
+
+    def __iter__(self):
+        self.pass_num += 1
+        for next_element in self._dataset.create_tuple_iterator():
+            self.batch_num += 1
+            yield next_element
+
+
+def get_runner(summary_dir):
+    """ get a runner with two explainers and a benchmarker registered, iterating a counting dataset """
+    np.random.seed(1)
+    images = np.random.rand(BATCH_NUM * BATCH_SIZE, 3, 8, 8).astype(np.float32)
+    labels = np.random.randint(0, len(LABELS), BATCH_NUM * BATCH_SIZE).astype(np.int32)
+    dataset = ds.NumpySlicesDataset((images, labels), column_names=["image", "label"], shuffle=False)
+    dataset = dataset.batch(BATCH_SIZE)
+
+    net = FakeNet()
+    runner = ImageClassificationRunner(summary_dir, (dataset, LABELS), net, nn.Softmax())
+    runner.register_saliency(explainers=[FakeExplainerA(net), FakeExplainerB(net)], benchmarkers=[FakeMetric()])
+    runner._dataset = CountingDataset(dataset)
+    runner._summary_timestamp = 0
+    return runner
+
+
+def test_run_sample_single_pass():
+    """ test the dataset is iterated once for the inference, the explainers and the benchmarkers """
+    with tempfile.TemporaryDirectory() as summary_dir:
+        runner = get_runner(summary_dir)
+        summary = FakeSummary()
+        runner._run_sample(summary)
+
+    assert runner._dataset.pass_num == 1
+    assert runner._dataset.batch_num == BATCH_NUM
+    assert len(summary.get_values("inference")) == BATCH_NUM * BATCH_SIZE
+    assert len(summary.get_values("explanation")) == 2 * BATCH_NUM * BATCH_SIZE
+
+
+def test_run_sample_benchmark_per_explainer():
+    """ test every explainer is scored by its own benchmarkers """
+    with tempfile.TemporaryDirectory() as summary_dir:
+        runner = get_runner(summary_dir)
+        summary = FakeSummary()
+        runner._run_sample(summary)
+
+    scores = {}
+    for explain in summary.get_values("benchmark"):
+        for benchmark in explain.benchmark:
+            assert benchmark.benchmark_method == "FakeMetric"
+            scores[benchmark.explain_method] = benchmark.total_score
+    assert scores == {"FakeExplainerA": 1.0, "FakeExplainerB": 2.0}
+    # the registered benchmarker is copied, not accumulated into
+    assert runner._benchmarkers[0].get_results() == []
+
+
+def test_run_sample_save_error():
+    """ test the errors of saving the image files are raised after the pass of the dataset """
+    with tempfile.TemporaryDirectory() as summary_dir:
+        runner = get_runner(summary_dir)
+        summary = FakeSummary()
+        with mock.patch.object(runner, "_save_image_file", side_effect=OSError("No space left on device")):
+            with pytest.raises(OSError):
+                runner._run_sample(summary)
+
+    assert runner._dataset.batch_num == BATCH_NUM
+    assert not runner._pending_saves
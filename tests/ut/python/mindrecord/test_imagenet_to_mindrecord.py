@@ -14,6 +14,8 @@
 # ============================================================================
 """test imagenet to mindrecord tool"""
 import os
+from unittest import mock
+
 import pytest
 
 from mindspore import log as logger
@@ -114,3 +116,42 @@ def test_imagenet_to_mindrecord_illegal_filename(fixture_file):
                                             IMAGENET_IMAGE_DIR, filename,
                                             PARTITION_NUMBER)
         imagenet_transformer.transform()
+
+def test_imagenet_to_mindrecord_parallel_workers(fixture_file):
+    """
+    test transform imagenet dataset to mindrecord
+    when the images are read by several workers.
+    """
+    imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                        MINDRECORD_FILE, PARTITION_NUMBER, 2)
+    imagenet_transformer.transform()
+    for i in range(PARTITION_NUMBER):
+        assert os.path.exists(MINDRECORD_FILE + str(i))
+        assert os.path.exists(MINDRECORD_FILE + str(i) + ".db")
+    read(MINDRECORD_FILE + "0")
+
+def test_imagenet_to_mindrecord_parallel_workers_0(fixture_file):
+    """
+    test transform imagenet dataset to mindrecord
+    when the number of parallel workers is 0.
+    """
+    with pytest.raises(Exception,
+                       match="The parameter num_parallel_workers must be positive int or None"):
+        imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE,
+                                            IMAGENET_IMAGE_DIR,
+                                            MINDRECORD_FILE, PARTITION_NUMBER, 0)
+        imagenet_transformer.transform()
+
+def test_imagenet_to_mindrecord_default_parallel_workers():
+    """
+    test the default number of parallel workers is the number of cpus,
+    but at most 8.
+    """
+    with mock.patch("os.cpu_count", return_value=64):
+        imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                            MINDRECORD_FILE, PARTITION_NUMBER)
+        assert imagenet_transformer.num_parallel_workers == 8
+    with mock.patch("os.cpu_count", return_value=2):
+        imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                            MINDRECORD_FILE, PARTITION_NUMBER)
+        assert imagenet_transformer.num_parallel_workers == 2
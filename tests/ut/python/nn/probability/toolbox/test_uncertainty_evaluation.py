@@ -0,0 +1,74 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test cases for uncertainty evaluation"""
+import numpy as np
+import pytest
+import mindspore.nn as nn
+from mindspore import Tensor
+from mindspore.nn.probability.toolbox.uncertainty_evaluation import UncertaintyEvaluation
+
+BATCH_SIZE = 5
+MC = 10
+
+
+class SampledModel:
+    """
+    Stub of the dropout model, which returns the given Monte-Carlo samples in turn, one sample for every tiled copy
+    of the data samples.
+    """
+    def __init__(self, samples):
+        self.samples = samples
+        self.sample_index = 0
+
+    def set_train(self, mode=True):
+        pass
+
+    def __call__(self, data):
+        num_samples = data.shape[0] // BATCH_SIZE
+        assert data.shape[0] == num_samples * BATCH_SIZE
+        pred = self.samples[self.sample_index:self.sample_index + num_samples]
+        self.sample_index += num_samples
+        return Tensor(pred.reshape((num_samples * BATCH_SIZE,) + pred.shape[2:]))
+
+
+def get_old_uncertainty(samples, task_type):
+    """ the epistemic uncertainty computed on host from the outputs of the MC runs, as the previous version """
+    outputs = list(samples)
+    if task_type == 'classification':
+        return np.stack(outputs, axis=2).var(axis=2)
+    return np.stack(outputs, axis=1).var(axis=1)
+
+
+@pytest.mark.parametrize("task_type, output_shape", [('classification', (4,)), ('regression', (1,))])
+@pytest.mark.parametrize("mc_per_eval", [1, 3, 4, 10])
+def test_eval_epistemic_uncertainty(task_type, output_shape, mc_per_eval):
+    """ test the batched MC samples give the variance of the MC runs, also with an uneven last chunk """
+    np.random.seed(1)
+    samples = np.random.rand(MC, BATCH_SIZE, *output_shape).astype(np.float32)
+    evaluation = UncertaintyEvaluation(nn.Dense(3, 4), None, task_type, num_classes=4, mc_per_eval=mc_per_eval)
+    evaluation.epi_uncer_model = SampledModel(samples)
+    eval_data = Tensor(np.random.rand(BATCH_SIZE, 3).astype(np.float32))
+    epi_uncertainty = evaluation._eval_epistemic_uncertainty(eval_data, MC)
+
+    expect = get_old_uncertainty(samples, task_type)
+    assert epi_uncertainty.shape == expect.shape == (BATCH_SIZE,) + output_shape
+    assert np.allclose(epi_uncertainty, expect, atol=1e-6)
+    assert evaluation.epi_uncer_model.sample_index == MC
+
+
+def test_mc_per_eval_check():
+    """ test mc_per_eval must be a positive int """
+    with pytest.raises(ValueError):
+        UncertaintyEvaluation(nn.Dense(3, 4), None, 'classification', num_classes=4, mc_per_eval=0)
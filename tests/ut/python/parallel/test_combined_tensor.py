@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+import pytest
+
 from mindspore import Tensor
-from mindspore.parallel._tensor import _reshape_param_data
+from mindspore.parallel._tensor import _reshape_param_data, _merge_tensor_slices
 
 
 def test_reshape_param_data():
@@ -50,5 +53,19 @@ def test_reshape_param_data():
         raise AssertionError
 
 
+def test_merge_tensor_slices_uneven():
+    expected_tensor = np.arange(30).reshape(5, 6)
+    tensor_strategy = [2, 3]
+    tensor_slices = [expected_tensor[0:2, 0:2], expected_tensor[0:2, 2:4], expected_tensor[0:2, 4:6],
+                     expected_tensor[2:5, 0:2], expected_tensor[2:5, 2:4], expected_tensor[2:5, 4:6]]
+    tensor = _merge_tensor_slices(tensor_slices, tensor_strategy)
+    assert np.array_equal(tensor, expected_tensor)
+
+    tensor_slices[4] = expected_tensor[2:5, 2:5]
+    with pytest.raises(ValueError):
+        _merge_tensor_slices(tensor_slices, tensor_strategy)
+
+
 if __name__ == '__main__':
     test_reshape_param_data()
+    test_merge_tensor_slices_uneven()
@@ -22,7 +22,8 @@ import logging
 import numpy as np
 
 import mindspore.nn as nn
-from mindspore import Tensor, Model, context
+from mindspore import Tensor, Model, context, get_compile_cache_info
+from mindspore.common.api import _executor
 from mindspore.nn.optim import Momentum
 from mindspore.ops.composite import add_flags
 from ...ut_filter import non_graph_engine
@@ -95,3 +96,65 @@ def test_different_args_run():
     print(out_me1)
     print(out_me2)
     assert not np.allclose(out_me1, out_me2, 0.01, 0.01)
+
+
+class ReluNet(nn.Cell):
+    """ ReluNet definition """
+
+    def __init__(self):
+        super(ReluNet, self).__init__()
+        self.relu = nn.ReLU()
+
+    def construct(self, x):
+        return self.relu(x)
+
+
+def test_compile_cache_size():
+    """ test_compile_cache_size """
+    context.set_context(mode=context.GRAPH_MODE, compile_cache_size=2)
+    try:
+        net = ReluNet()
+        info = get_compile_cache_info()["cell"]
+        for batch_size in (1, 2, 3):
+            _, is_compiled = _executor.compile(net, Tensor(np.ones([batch_size, 4], np.float32)))
+            assert is_compiled
+        _, is_compiled = _executor.compile(net, Tensor(np.ones([3, 4], np.float32)))
+        assert not is_compiled
+
+        new_info = get_compile_cache_info()["cell"]
+        assert new_info["size"] <= 2
+        assert new_info["evictions"] > info["evictions"]
+        assert new_info["hits"] == info["hits"] + 1
+        assert new_info["compile_time"] > info["compile_time"]
+    finally:
+        context.set_context(compile_cache_size=0)
+
+
+def test_compile_cache_size_dataset_sink():
+    """ test no pipeline is freed while a pipeline of dataset sink mode is cached """
+    context.set_context(mode=context.GRAPH_MODE, compile_cache_size=2)
+    try:
+        sink_net = ReluNet()
+        sink_input = Tensor(np.ones([8, 4], np.float32))
+        sink_input.virtual_flag = True
+        sink_phase, is_compiled = _executor.compile(sink_net, sink_input)
+        assert is_compiled
+
+        # freeing a pipeline resets the iteration count the sink pipeline is loaded with
+        net = ReluNet()
+        evictions = get_compile_cache_info()["cell"]["evictions"]
+        for batch_size in (1, 2, 3):
+            _executor.compile(net, Tensor(np.ones([batch_size, 4], np.float32)))
+        assert get_compile_cache_info()["cell"]["evictions"] == evictions
+        _, is_compiled = _executor.compile(sink_net, sink_input)
+        assert not is_compiled
+
+        # the pipelines are freed again once the sink pipeline is released
+        _executor.del_net_res(str(sink_net.create_time))
+        assert _executor.compile_cache.get(sink_phase) is None
+        _executor.compile(net, Tensor(np.ones([4, 4], np.float32)))
+        info = get_compile_cache_info()["cell"]
+        assert info["evictions"] > evictions
+        assert info["size"] <= 2
+    finally:
+        context.set_context(compile_cache_size=0)
@@ -19,6 +19,9 @@
 @Desc  :
 """
 import logging
+import os
+import shutil
+import tempfile
 import pytest
 import numpy as np
 
@@ -29,6 +32,8 @@ from mindspore import context
 from mindspore.ops import composite as C
 from mindspore.ops import operations as P
 from mindspore.common.api import ms_function, _executor
+from mindspore._extends.parse import Parser
+from mindspore._extends.parse.parser import AST_CACHE_PATH_ENV
 from mindspore.ops._grad.grad_base import bprop_getters
 from mindspore.ops.primitive import prim_attr_register, PrimitiveWithInfer
 from mindspore.ops.functional import tensor_add
@@ -331,3 +336,41 @@ def test_assign_check_none():
     net = AssignCheck()
     with pytest.raises(TypeError):
         net(None)
+
+
+def test_parse_ast_disk_cache():
+    cache_path = tempfile.mkdtemp(prefix='test_ast_cache_')
+    os.environ[AST_CACHE_PATH_ENV] = cache_path
+    try:
+        net = Net(0)
+        Parser.ast_cache.clear()
+        parser = Parser(net.construct)
+        tree = parser.parse()
+        assert len(os.listdir(cache_path)) == 1
+
+        # the ast tree is loaded from the disk cache by a new process
+        Parser.ast_cache.clear()
+        disk_hit = Parser.ast_cache_stats["disk_hit"]
+        cached_parser = Parser(net.construct)
+        cached_tree = cached_parser.parse()
+        assert Parser.ast_cache_stats["disk_hit"] == disk_hit + 1
+        assert cached_parser.col_offset == parser.col_offset
+        assert cached_parser.get_location(cached_tree.body[0]) == parser.get_location(tree.body[0])
+    finally:
+        del os.environ[AST_CACHE_PATH_ENV]
+        shutil.rmtree(cache_path)
+
+
+def test_parse_ast_disk_cache_unsafe_path():
+    cache_path = tempfile.mkdtemp(prefix='test_ast_cache_')
+    os.chmod(cache_path, 0o777)
+    os.environ[AST_CACHE_PATH_ENV] = cache_path
+    try:
+        net = Net(0)
+        Parser.ast_cache.clear()
+        Parser(net.construct).parse()
+        # the cache files of a directory writable by others are neither written nor loaded
+        assert not os.listdir(cache_path)
+    finally:
+        del os.environ[AST_CACHE_PATH_ENV]
+        shutil.rmtree(cache_path)
@@ -0,0 +1,71 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the hwts log parser."""
+import os
+import shutil
+import struct
+import tempfile
+
+from unittest import TestCase
+
+from mindspore.profiler.parser.hwts_log_parser import HWTSLogParser
+
+
+def _make_record(head, core_id, blk_id, task_id, content_format, content):
+    """Make a 64 bytes hwts log record."""
+    return struct.pack('BBHHH', head, core_id, 0, blk_id, task_id) + struct.pack(content_format, *content)
+
+
+class TestHWTSLogParser(TestCase):
+    """Test the class of HWTSLogParser."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.profiling_dir = tempfile.mkdtemp(prefix='hwts_log_')
+        self.output_file = os.path.join(self.profiling_dir, 'output_format_data_hwts_0.txt')
+        records = [
+            # start of task, count 2
+            _make_record(0x20, 1, 3, 10, 'QIIIIIIIIIIII', [1000, 5] + [0] * 11),
+            # padding record
+            b' ' * 64,
+            # end of block, task id not less than 25000
+            _make_record(0x13, 2, 4, 30000, 'QIIQIIIIIIII', [2000, 6, 0, 0] + [0] * 8),
+            # block PMU, with and without is_warn_res0_ov
+            _make_record(0x04, 3, 5, 11, 'IIIIQIIIIIIII', [0, 0, 7, 0, 3000] + [0] * 8),
+            _make_record(0x0c, 3, 5, 12, 'IIIIQIIIIIIII', [0, 0, 7, 0, 3000] + [0] * 8),
+            # invalid log type
+            _make_record(0x05, 3, 5, 12, 'IIIIQIIIIIIII', [0] * 13),
+        ]
+        with open(os.path.join(self.profiling_dir, 'hwts.data'), 'wb') as hwts_data:
+            hwts_data.write(b''.join(records))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.profiling_dir)
+
+    def test_hwts_log_parser(self):
+        """Test the hwts log records are decoded and formatted."""
+        HWTSLogParser(self.profiling_dir, self.output_file).execute()
+        with open(self.output_file, 'r') as result_file:
+            result = result_file.read()
+        expect_lines = [
+            '=' * 20 + '45 HWTS data' + '=' * 20,
+            'Type           cnt  Core_ID  Block_ID  Task_ID  Cycle_counter   Stream_ID',
+            'Start of task  2    1        3         5_10     1000            5',
+            'End of block   1    2        4         30000    2000            6',
+            'Block PMU      0    3        5         7_11     3000            7',
+            'Block PMU      0    3        5         7_12     None            7',
+            '', ''
+        ]
+        assert result == '\n'.join(expect_lines)
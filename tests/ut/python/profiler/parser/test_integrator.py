@@ -0,0 +1,110 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the timeline writing of the integrator."""
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from mindspore.profiler.parser.integrator import AscendTimelineGenerator
+
+
+def _get_written_size(events):
+    """Get the number of bytes counted for the events, not including the closing bracket."""
+    return 1 + len(','.join(json.JSONEncoder().encode(event) for event in events))
+
+
+class TestTimelineWriting(TestCase):
+    """Test the timeline display files written by the timeline generator."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='timeline_')
+        self.generator = AscendTimelineGenerator(self.output_path, '0')
+        # events starting every 1 ms, more than a write batch of the writer
+        self.event_num = 2500
+        self.generator._timeline_list = [['op{}'.format(i), '0', str(i), '0.5'] for i in range(self.event_num)]
+        self.display_file = os.path.join(self.output_path, 'ascend_timeline_display_0.json')
+
+    def tearDown(self) -> None:
+        """Clean up after test case execution."""
+        shutil.rmtree(self.output_path)
+
+    def _load_events(self, file_name, compress=False):
+        """Load the events of a display file, which must be a json array."""
+        file_path = os.path.join(self.output_path, file_name)
+        open_fn = gzip.open if compress else open
+        with open_fn(file_path, 'rt') as file:
+            events = json.load(file)
+        self.assertIsInstance(events, list)
+        return events
+
+    def test_write_timeline(self):
+        """Test all the events are written into one json array."""
+        self.generator.write_timeline()
+        events = self._load_events('ascend_timeline_display_0.json')
+        self.assertEqual(['op{}'.format(i) for i in range(self.event_num)], [event['name'] for event in events])
+        self.assertEqual(1000, events[1]['ts'])
+
+    def test_write_timeline_size_limit(self):
+        """Test the events are written until the written bytes exceed size_limit."""
+        size_limit = 20000
+        self.generator.write_timeline(size_limit=size_limit)
+        events = self._load_events('ascend_timeline_display_0.json')
+        self.assertLess(len(events), self.event_num)
+        self.assertLessEqual(_get_written_size(events[:-1]), size_limit)
+        self.assertGreater(_get_written_size(events), size_limit)
+
+    def test_write_timeline_compress(self):
+        """Test the events are written into a gzip file."""
+        self.generator.write_timeline(compress=True)
+        self.assertFalse(os.path.exists(self.display_file))
+        events = self._load_events('ascend_timeline_display_0.json.gz', compress=True)
+        self.assertEqual(self.event_num, len(events))
+
+    def test_write_timeline_time_window(self):
+        """Test the events are split into the chunk files of their time windows."""
+        time_window = 1000 * 1000
+        self.generator.write_timeline(time_window=time_window)
+        self.assertFalse(os.path.exists(self.display_file))
+        chunk_num = (self.event_num - 1) * 1000 // time_window + 1
+        event_num = 0
+        for chunk_index in range(chunk_num):
+            events = self._load_events('ascend_timeline_display_0_{}.json'.format(chunk_index))
+            self.assertTrue(all(event['ts'] // time_window == chunk_index for event in events))
+            event_num += len(events)
+        self.assertEqual(self.event_num, event_num)
+
+    def test_write_timeline_time_window_size_limit(self):
+        """Test size_limit counts the written bytes over all the chunk files."""
+        time_window = 1000 * 1000
+        size_limit = 100000
+        self.generator.write_timeline(size_limit=size_limit, time_window=time_window)
+        first_events = self._load_events('ascend_timeline_display_0_0.json')
+        second_events = self._load_events('ascend_timeline_display_0_1.json')
+        self.assertFalse(os.path.exists(os.path.join(self.output_path, 'ascend_timeline_display_0_2.json')))
+        self.assertEqual(1000, len(first_events))
+        self.assertLess(len(second_events), 1000)
+        self.assertLessEqual(_get_written_size(first_events) + _get_written_size(second_events[:-1]), size_limit)
+        self.assertGreater(_get_written_size(first_events) + _get_written_size(second_events), size_limit)
+
+    def test_write_timeline_empty(self):
+        """Test an empty json array is written when there is no event."""
+        self.generator._timeline_list = []
+        self.generator.write_timeline()
+        self.assertEqual([], self._load_events('ascend_timeline_display_0.json'))
@@ -0,0 +1,92 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the op compute time parser."""
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from mindspore.profiler.parser.optime_parser import OPComputeTimeParser
+
+
+def _make_line(status, task_id, cycle_counter, stream_id):
+    """Make a line of the hwts output file."""
+    return '%-14s %-4s %-8s %-9s %-8s %-15s %s\n' % (status, 0, 0, 0, task_id, cycle_counter, stream_id)
+
+
+class TestOPComputeTimeParser(TestCase):
+    """Test the class of OPComputeTimeParser."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='optime_')
+        self.hwts_output_file = os.path.join(self.output_path, 'output_format_data_hwts_0.txt')
+        self.output_file = os.path.join(self.output_path, 'output_op_compute_time_0.txt')
+        self.op_task_info = {'1_1': 'Default/Conv2D-op1', '1_2': 'Default/Conv2D-op1', '2_1': 'assign-op2'}
+        lines = [
+            _make_line('Start of task', '1_1', 200, 1),
+            # the start of a task without end is ignored
+            _make_line('Start of task', '2_1', 210, 2),
+            _make_line('Start of task', '2_1', 220, 2),
+            _make_line('End of task', '2_1', 320, 2),
+            # the tasks which do not belong to an op are ignored
+            _make_line('Start of task', '3_1', 330, 3),
+            _make_line('End of task', '3_1', 340, 3),
+            _make_line('Start of task', '1_1', 400, 1),
+            _make_line('Start of block', '1_1', 410, 1),
+            _make_line('End of task', '1_1', 600, 1),
+            _make_line('Start of task', '1_2', 600, 1),
+            _make_line('End of task', '1_2', 1000, 1),
+        ]
+        with open(self.hwts_output_file, 'w') as hwts_output:
+            hwts_output.write('title:45 HWTS data\n')
+            hwts_output.writelines(lines)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.output_path)
+
+    def test_op_compute_time_parser(self):
+        """Test the op time and the timeline are computed from the hwts records."""
+        parser = OPComputeTimeParser(self.hwts_output_file, self.output_file, self.op_task_info,
+                                     self.output_path, '0')
+        parser.execute()
+        # the start time of assign op is not taken into account
+        assert parser.min_cycle_counter == 0.004
+
+        with open(self.output_file, 'r') as result_file:
+            result = result_file.read()
+        expect_lines = [
+            '=' * 20 + 'op compute time' + '=' * 20,
+            'op_name       compute_time(ms) stream_id',
+            '------------  ---------------  ---------',
+            # only the executions of the first task of an op are counted
+            'assign-op2 0.001  2',
+            'Default/Conv2D-op1 0.006  1',
+            'total op  0.007 0',
+            ''
+        ]
+        assert result == '\n'.join(expect_lines)
+
+        with open(os.path.join(self.output_path, 'output_timeline_data_0.txt'), 'r') as timeline_file:
+            timeline = timeline_file.read()
+        expect_lines = [
+            'op_name, stream_id, start_time(ms), duration(ms)',
+            'assign-op2,2,0.0022,0.001',
+            'Default/Conv2D-op1,1,0.004,0.002',
+            'Default/Conv2D-op1,1,0.006,0.004',
+            ''
+        ]
+        assert timeline == '\n'.join(expect_lines)
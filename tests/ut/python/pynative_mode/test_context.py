@@ -125,6 +125,17 @@ def test_print_file_path():
         context.set_context(print_file_path="./")
 
 
+def test_compile_cache_size():
+    """test_compile_cache_size"""
+    with pytest.raises(TypeError):
+        context.set_context(compile_cache_size="16")
+    with pytest.raises(ValueError):
+        context.set_context(compile_cache_size=-1)
+    context.set_context(compile_cache_size=16)
+    assert context.get_context("compile_cache_size") == 16
+    context.set_context(compile_cache_size=0)
+
+
 def test_set_context():
     """ test_set_context """
     context.set_context(mode=context.GRAPH_MODE, device_target="Ascend",
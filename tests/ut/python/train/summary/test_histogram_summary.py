@@ -178,3 +178,28 @@ def test_histogram_summary_all_nan_inf():
             assert histogram.nan_count == 3
             assert histogram.pos_inf_count == 1
             assert histogram.neg_inf_count == 1
+
+
+def test_histogram_summary_statistics_nan_inf():
+    """Test histogram summary, the statistics of a tensor with nan and inf exclude them."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SummaryRecord(tmp_dir, file_suffix="_MS_HISTOGRAM") as test_writer:
+            arr = np.array([1, 2, np.nan, 3, np.inf, 4, -np.inf, np.inf], dtype=np.float32)
+            test_data = _wrap_test_data(Tensor(arr))
+            _cache_summary_tensor_data(test_data)
+            test_writer.record(step=1)
+
+        file_name = os.path.join(tmp_dir, test_writer.event_file_name)
+        with SummaryReader(file_name) as reader:
+            event = reader.read_event()
+            LOG.debug(event)
+
+            histogram = event.summary.value[0].histogram
+            assert histogram.count == 8
+            assert histogram.nan_count == 1
+            assert histogram.pos_inf_count == 2
+            assert histogram.neg_inf_count == 1
+            assert histogram.min == 1
+            assert histogram.max == 4
+            assert histogram.sum == 10
+            assert sum(bucket.count for bucket in histogram.buckets) == 4
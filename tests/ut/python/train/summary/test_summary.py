@@ -21,6 +21,7 @@
 import logging
 import os
 import random
+import tempfile
 import numpy as np
 import pytest
 
@@ -28,6 +29,7 @@ import mindspore.nn as nn
 from mindspore.common.tensor import Tensor
 from mindspore.ops import operations as P
 from mindspore.train.summary.summary_record import SummaryRecord, _cache_summary_tensor_data
+from tests.summary_utils import SummaryReader
 
 CUR_DIR = os.getcwd()
 SUMMARY_DIR = CUR_DIR + "/test_temp_summary_event_file/"
@@ -79,6 +81,23 @@ def test_scalar_summary_sample():
         log.debug("finished test_scalar_summary_sample")
 
 
+def test_scalar_summary_order():
+    """ test that the events are written in the order of the steps """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SummaryRecord(tmp_dir, file_suffix="_MS_SCALAR") as test_writer:
+            for i in range(1, 100):
+                _cache_summary_tensor_data(get_test_data(i))
+                test_writer.record(i)
+
+        steps = []
+        with SummaryReader(os.path.join(tmp_dir, test_writer.event_file_name)) as reader:
+            event = reader.read_event()
+            while event is not None:
+                steps.append(event.step)
+                event = reader.read_event()
+        assert steps == list(range(1, 100))
+
+
 def get_test_data_shape_1(step):
     """ get_test_data_shape_1 """
     test_data_list = []
@@ -20,7 +20,9 @@ import pytest
 import mindspore.nn as nn
 from mindspore import Model, context
 from mindspore import Tensor
-from mindspore.train.callback import Callback
+from mindspore.train.callback import Callback, _CallbackManager, _InternalCallbackParam
+from mindspore.train.loss_scale_manager import DynamicLossScaleManager
+from mindspore.train.model import _MetricUpdater
 from mindspore.nn.optim import Momentum
 from ..ut_filter import non_graph_engine
 from ....dataset_mock import MindData
@@ -130,6 +132,108 @@ def test_dataset_sink_mode_args_check():
         model.train(2, dataset, dataset_sink_mode=1)
 
 
+def test_eval_metrics_args_check():
+    """ test_eval_metrics_args_check """
+    dataset = get_dataset()
+    model = get_model(metrics={"acc"})
+    with pytest.raises(TypeError):
+        model.eval(dataset, async_metrics="True")
+
+    with pytest.raises(ValueError):
+        model.eval(dataset, metrics_update_interval=0)
+
+
+def get_eval_steps():
+    """ get the host outputs (loss, logits, labels) of eval steps, the last batch is smaller """
+    np.random.seed(1)
+    steps = []
+    for batch_size in (4, 4, 4, 4, 2):
+        steps.append((np.random.rand(batch_size).astype(np.float32),
+                      np.random.rand(batch_size, 3).astype(np.float32),
+                      np.eye(3)[np.random.randint(0, 3, batch_size)].astype(np.float32)))
+    return steps
+
+
+def get_eval_model():
+    """ get a model evaluated by Accuracy, Top-k and Loss """
+    metrics = {"acc": nn.Accuracy(), "top2": nn.TopKCategoricalAccuracy(2), "loss": nn.Loss()}
+    model = Model(nn.Dense(3, 3), loss_fn=nn.SoftmaxCrossEntropyWithLogits(), metrics=metrics)
+    model._clear_metrics()
+    return model
+
+
+def get_per_step_metrics(steps):
+    """ get the metrics updated step by step """
+    model = get_eval_model()
+    for step in steps:
+        model._update_metrics_with_steps([step])
+    return model._get_metrics()
+
+
+def test_update_metrics_with_steps():
+    """ test metrics updated with several steps at a time are the same as updated per step """
+    steps = get_eval_steps()
+    model = get_eval_model()
+    model._update_metrics_with_steps(steps)
+    metrics = model._get_metrics()
+    expect_metrics = get_per_step_metrics(steps)
+    assert metrics.keys() == expect_metrics.keys()
+    for key, value in expect_metrics.items():
+        assert np.isclose(metrics[key], value)
+    # Loss is averaged per step, not over the concatenated samples
+    assert not np.isclose(metrics["loss"], np.concatenate([step[0] for step in steps]).mean())
+
+
+@pytest.mark.parametrize("async_metrics, update_interval", [(False, 2), (True, 1), (True, 3)])
+def test_metric_updater(async_metrics, update_interval):
+    """ test _MetricUpdater gives the same metrics as the updates per step """
+    steps = get_eval_steps()
+    model = get_eval_model()
+    updater = _MetricUpdater(model._update_metrics_with_steps, async_metrics, update_interval)
+    for step in steps:
+        updater.update(step)
+    updater.close()
+    metrics = model._get_metrics()
+    for key, value in get_per_step_metrics(steps).items():
+        assert np.isclose(metrics[key], value)
+
+
+def test_update_metrics_with_steps_0d_outputs():
+    """ test the outputs of 0 dimension are not concatenated """
+    class StepMean(nn.Metric):
+        def clear(self):
+            self._values = []
+
+        def update(self, *inputs):
+            self._values.append(np.mean(inputs[0]))
+
+        def eval(self):
+            return np.mean(self._values)
+
+    net = nn.Dense(3, 3)
+    model = Model(net, metrics={"mean": StepMean()}, eval_network=net)
+    model._clear_metrics()
+    steps = [(np.array(value, np.float32), np.ones([2, 3], np.float32)) for value in (1.0, 2.0, 6.0)]
+    updater = _MetricUpdater(model._update_metrics_with_steps, True, 2)
+    for step in steps:
+        updater.update(step)
+    updater.close()
+    assert np.isclose(model._get_metrics()["mean"], 3.0)
+
+
+def test_metric_updater_error():
+    """ test the errors raised by the background thread are re-raised """
+    def update_fn(steps):
+        raise RuntimeError("update failed")
+
+    updater = _MetricUpdater(update_fn, True, 1)
+    with pytest.raises(RuntimeError):
+        for step in get_eval_steps():
+            updater.update(step)
+        updater.close()
+    updater.stop()
+
+
 @non_graph_engine
 def test_eval():
     """ test_eval """
@@ -221,6 +325,71 @@ def test_model_build_abnormal_string():
         assert err
 
 
+class RecordingLossScaleManager(DynamicLossScaleManager):
+    """ loss scale manager recording the overflow flags it is updated with """
+
+    def __init__(self):
+        super(RecordingLossScaleManager, self).__init__(init_loss_scale=2 ** 10, scale_factor=2, scale_window=2)
+        self.overflows = []
+
+    def update_loss_scale(self, overflow):
+        self.overflows.append(overflow)
+        super(RecordingLossScaleManager, self).update_loss_scale(overflow)
+
+
+class OverflowTrainNetwork:
+    """ train network stub returning the overflow flags of the steps in turn """
+
+    def __init__(self, overflows):
+        self.overflows = overflows
+        self.step = 0
+        self.phase = None
+
+    def set_train(self, mode=True):
+        pass
+
+    def __call__(self, *inputs):
+        overflow = self.overflows[self.step % len(self.overflows)]
+        self.step += 1
+        return Tensor(np.array(1.0, np.float32)), Tensor(np.array(overflow)), Tensor(np.array(1.0, np.float32))
+
+
+class LossScaleRecorder(Callback):
+    """ record the loss scale of the manager and the steps it is updated with at every epoch end """
+
+    def __init__(self, manager):
+        super(LossScaleRecorder, self).__init__()
+        self.manager = manager
+        self.records = []
+
+    def epoch_end(self, run_context):
+        cb_params = run_context.original_args()
+        self.records.append((self.manager.get_loss_scale(), len(self.manager.overflows), cb_params.cur_step_num))
+
+
+def train_with_loss_scale_sync_steps(loss_scale_sync_steps):
+    """ train 3 epochs of 5 steps with fake overflow flags, and get the records of every epoch end """
+    dataset = MindData(size=4, batch_size=32, np_types=(np.float32,), output_shapes=((32, 3),))
+    model = Model(nn.ReLU(), loss_scale_sync_steps=loss_scale_sync_steps)
+    model._loss_scale_manager = RecordingLossScaleManager()
+    model._train_network = OverflowTrainNetwork([False, True, False, False, False, False, True])
+    recorder = LossScaleRecorder(model._loss_scale_manager)
+    with _CallbackManager([recorder]) as list_callback:
+        model._train_process(3, dataset, list_callback, _InternalCallbackParam())
+    return recorder.records
+
+
+def test_loss_scale_sync_steps():
+    """ test the loss scale read lazily ends every epoch as read every step """
+    expect_records = train_with_loss_scale_sync_steps(1)
+    assert len({loss_scale for loss_scale, _, _ in expect_records}) > 1
+    # the overflow flags of all the steps of an epoch are read before the epoch_end callbacks
+    for _, update_num, step_num in expect_records:
+        assert update_num == step_num
+    assert train_with_loss_scale_sync_steps(3) == expect_records
+    assert train_with_loss_scale_sync_steps(100) == expect_records
+
+
 def test_init_model_error():
     """ test_init_model_error """
     net = nn.ReLU()
@@ -249,6 +418,9 @@ def test_init_model_error():
     with pytest.raises(TypeError):
         Model(net, loss, metrics=["top_1_accuracy"])
 
+    with pytest.raises(ValueError):
+        Model(net, loss, loss_scale_sync_steps=0)
+
 
 def test_model_eval_error():
     """ test_model_eval_error """
@@ -0,0 +1,113 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test_akg_process """
+import json
+import multiprocessing
+import os
+import time
+from unittest import mock
+
+import pytest
+
+from mindspore._extends.parallel_compile.akg_compiler import akg_process
+from mindspore._extends.parallel_compile.akg_compiler.akg_process import AkgProcess
+from mindspore._extends.parallel_compile.kernel_cache import CACHE_PATH_ENV
+
+
+def _run_compiler(json_str):
+    """stub of the akg compiler, the kernel fails or hangs by its op name"""
+    op_name = json.loads(json_str)["op"]
+    if op_name.startswith("fail"):
+        raise ValueError("Compile error")
+    if op_name.startswith("slow"):
+        time.sleep(60)
+
+
+def _kernel_json(op_name):
+    return json.dumps({"op": op_name})
+
+
+def _compile(process_num, op_names, wait_time=10):
+    process = AkgProcess(process_num, wait_time)
+    for op_name in op_names:
+        process.accept_json(_kernel_json(op_name))
+    return process.compile()
+
+
+def _is_terminated(pool):
+    return all(not worker.is_alive() for worker in pool._pool)
+
+
+class TestAkgProcess:
+    """Test the warm worker pool of the akg parallel compilation."""
+
+    def setup_method(self):
+        # the workers are forked after the compiler is stubbed and the kernel cache is disabled
+        AkgProcess.close_pool()
+        self._patches = [mock.patch.object(akg_process, "run_compiler", _run_compiler),
+                         mock.patch.object(akg_process, "cpu_count", return_value=4),
+                         mock.patch.dict(os.environ)]
+        for patch in self._patches:
+            patch.start()
+        os.environ.pop(CACHE_PATH_ENV, None)
+
+    def teardown_method(self):
+        AkgProcess.close_pool()
+        for patch in reversed(self._patches):
+            patch.stop()
+
+    def test_compile_task_error(self):
+        assert akg_process._compile_akg_task(_kernel_json("add")) == ""
+        assert akg_process._compile_akg_task(_kernel_json("fail_add")) == "ValueError: Compile error"
+        assert akg_process._compile_akg_task("{}") == "KeyError: 'op'"
+
+    def test_compile_success(self):
+        assert _compile(2, ["add{}".format(i) for i in range(8)])
+        assert AkgProcess._pool is not None
+        assert AkgProcess._pool_size == 2
+
+    def test_compile_failure(self):
+        with pytest.raises(ValueError) as e:
+            _compile(2, ["add", "fail_add"])
+        assert "fail_add" in str(e.value)
+        assert "ValueError: Compile error" in str(e.value)
+        assert AkgProcess._pool is None
+
+    def test_pool_reused(self):
+        _compile(2, ["add"])
+        pool = AkgProcess._pool
+        _compile(2, ["mul"])
+        assert AkgProcess._pool is pool
+        assert not _is_terminated(pool)
+
+    def test_pool_recreated(self):
+        _compile(2, ["add"])
+        pool = AkgProcess._pool
+        _compile(1, ["mul"])
+        assert AkgProcess._pool is not pool
+        assert AkgProcess._pool_size == 1
+        assert _is_terminated(pool)
+
+    def test_compile_timeout(self):
+        _compile(2, ["add"])
+        pool = AkgProcess._pool
+        start_time = time.time()
+        with pytest.raises(multiprocessing.TimeoutError):
+            _compile(2, ["slow_add", "add"], wait_time=1)
+        # the deadline covers all the kernels, and the hanging worker is terminated
+        assert time.time() - start_time < 10
+        assert AkgProcess._pool is None
+        assert _is_terminated(pool)
+        assert _compile(2, ["add"])
@@ -15,6 +15,7 @@
 """test callback function."""
 import os
 import stat
+import tempfile
 from unittest import mock
 
 import numpy as np
@@ -29,6 +30,7 @@ from mindspore.nn.optim import Momentum
 from mindspore.train.callback import ModelCheckpoint, RunContext, LossMonitor, _InternalCallbackParam, \
     _CallbackManager, Callback, CheckpointConfig, _set_cur_net, _checkpoint_cb_for_save_op
 from mindspore.train.callback._checkpoint import _check_file_name_prefix, _chg_ckpt_file_name_if_same_exist
+from mindspore.train.serialization import load_checkpoint
 
 class Net(nn.Cell):
     """Net definition."""
@@ -350,6 +352,39 @@ def test_Checkpoint_Config():
         CheckpointConfig(0, None, 0, 0, True)
 
 
+def test_checkpoint_config_incremental_save():
+    """Test CheckpointConfig incremental save options."""
+    config = CheckpointConfig(incremental_save=True, full_save_interval=4)
+    assert config.incremental_save
+    assert config.full_save_interval == 4
+
+    with pytest.raises(ValueError):
+        CheckpointConfig(incremental_save=True, full_save_interval=0)
+
+
+def test_incremental_save_keep_checkpoint_max():
+    """Test a full checkpoint and its delta checkpoints count as one against keep_checkpoint_max."""
+    train_config = CheckpointConfig(save_checkpoint_steps=1, keep_checkpoint_max=2,
+                                    incremental_save=True, full_save_interval=3)
+    cb_params = _InternalCallbackParam()
+    cb_params.train_network = nn.Dense(4, 3)
+    cb_params.epoch_num = 1
+    cb_params.cur_epoch_num = 1
+    cb_params.batch_num = 8
+    with tempfile.TemporaryDirectory() as ckpt_dir:
+        ckpoint_cb = ModelCheckpoint(prefix="inc", directory=ckpt_dir, config=train_config)
+        run_context = RunContext(cb_params)
+        for step in range(1, 9):
+            cb_params.cur_step_num = step
+            ckpoint_cb.step_end(run_context)
+
+        # saves 1, 4 and 7 are full, the unit of save 1 is rotated out by save 7
+        ckpt_files = sorted(file_name for file_name in os.listdir(ckpt_dir) if file_name.endswith(".ckpt"))
+        assert ckpt_files == ["inc-1_%d.ckpt" % step for step in range(4, 9)]
+        param_dict = load_checkpoint(os.path.join(ckpt_dir, "inc-1_8.ckpt"))
+        assert np.array_equal(param_dict["weight"].data.asnumpy(), cb_params.train_network.weight.data.asnumpy())
+
+
 def test_step_end_save_graph():
     """Test save checkpoint."""
     train_config = CheckpointConfig(
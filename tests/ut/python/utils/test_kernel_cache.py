@@ -0,0 +1,83 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test_kernel_cache """
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from mindspore._extends.parallel_compile.kernel_cache import KernelCache
+
+
+def _write_file(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'0' * size)
+
+
+class TestKernelCache:
+    """Test the content-addressed kernel cache."""
+
+    def setup_method(self):
+        self._dir = tempfile.mkdtemp(prefix='test_kernel_cache_')
+        self._cache_path = os.path.join(self._dir, 'cache')
+        self._kernel_meta_path = os.path.join(self._dir, 'kernel_meta')
+        os.makedirs(self._kernel_meta_path)
+
+    def teardown_method(self):
+        shutil.rmtree(self._dir)
+
+    def test_key_is_normalized(self):
+        key = KernelCache.get_key('{"op": "add", "shape": [1, 2]}', 'akg', 'v1')
+        assert key == KernelCache.get_key('{"shape":[1,2],"op":"add"}', 'akg', 'v1')
+        assert key != KernelCache.get_key('{"op": "add", "shape": [1, 2]}', 'akg', 'v2')
+        assert key != KernelCache.get_key('{"op": "add", "shape": [1, 2]}', 'tbe', 'v1')
+
+    def test_store_and_load(self):
+        cache = KernelCache(self._cache_path, 1024 * 1024, self._kernel_meta_path)
+        key = cache.get_key('{"op": "add"}', 'akg', 'v1')
+        assert cache.load(key) is None
+
+        _write_file(os.path.join(self._kernel_meta_path, 'add.o'), 100)
+        _write_file(os.path.join(self._kernel_meta_path, 'add.json'), 10)
+        _write_file(os.path.join(self._kernel_meta_path, 'add_1.o'), 10)
+        cache.store(key, 'add', 'result')
+        # storing again is a no-op
+        cache.store(key, 'add', 'other result')
+
+        shutil.rmtree(self._kernel_meta_path)
+        assert cache.load(key) == 'result'
+        assert sorted(os.listdir(self._kernel_meta_path)) == ['add.json', 'add.o']
+
+    def test_evict_least_recently_used(self):
+        cache = KernelCache(self._cache_path, 2500, self._kernel_meta_path)
+        for i in range(3):
+            _write_file(os.path.join(self._kernel_meta_path, 'k{}.o'.format(i)), 1000)
+            cache.store('key{}'.format(i), 'k{}'.format(i))
+            # the modification times of the entries differ
+            entry_path = os.path.join(self._cache_path, 'key{}'.format(i))
+            os.utime(entry_path, (i, i))
+
+        assert sorted(os.listdir(self._cache_path)) == ['key1', 'key2']
+
+    def test_scan_when_over_max_size(self):
+        cache = KernelCache(self._cache_path, 2500, self._kernel_meta_path)
+        with mock.patch.object(cache, '_evict', wraps=cache._evict) as evict:
+            for i in range(3):
+                _write_file(os.path.join(self._kernel_meta_path, 'k{}.o'.format(i)), 1000)
+                cache.store('key{}'.format(i), 'k{}'.format(i))
+            # the cache is scanned at the first store, and when the running total goes over the maximum size
+            assert evict.call_count == 2
+        assert cache._size == 2000
+        assert len(os.listdir(self._cache_path)) == 2
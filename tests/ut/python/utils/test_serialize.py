@@ -136,6 +136,94 @@ def test_load_checkpoint():
     assert isinstance(par_dict, dict)
 
 
+def test_load_checkpoint_filter_prefix():
+    ckpt_file_name = os.path.join(_cur_dir, './parameters.ckpt')
+    par_dict = load_checkpoint(ckpt_file_name, filter_prefix="param")
+
+    assert len(par_dict) == 2
+    assert 'param' not in par_dict
+    assert par_dict['new_param'].data.shape == (12, 1024, 1)
+    assert par_dict['new_param'].data.dtype == mstype.float32
+
+
+def test_load_checkpoint_multi_slice():
+    """ test load_checkpoint for parameter saved in several slices"""
+    from mindspore.train import serialization
+    data = np.random.rand(6, 32).astype(np.float32)
+    slice_size = serialization.SLICE_SIZE
+    serialization.SLICE_SIZE = 256
+    try:
+        save_checkpoint([{"name": "sliced_param", "data": Tensor(data)}], "./sliced.ckpt")
+    finally:
+        serialization.SLICE_SIZE = slice_size
+    par_dict = load_checkpoint("./sliced.ckpt")
+
+    assert par_dict['sliced_param'].data.shape == (6, 32)
+    assert np.allclose(par_dict['sliced_param'].data.asnumpy(), data)
+
+
+def test_save_and_load_sharded_checkpoint():
+    """ test save_checkpoint and load_checkpoint with shard_num"""
+    parameter_list = []
+    for i in range(5):
+        parameter_list.append({"name": "param_" + str(i),
+                               "data": Tensor(np.random.rand(i + 1, 16).astype(np.float32))})
+    save_checkpoint(parameter_list, "./sharded.ckpt", shard_num=3)
+    for i in range(3):
+        assert os.path.exists("./sharded.ckpt.shard" + str(i))
+
+    par_dict = load_checkpoint("./sharded.ckpt", filter_prefix="param_0")
+    assert len(par_dict) == 4
+    for param in parameter_list[1:]:
+        assert np.allclose(par_dict[param["name"]].data.asnumpy(), param["data"].asnumpy())
+
+
+def test_save_checkpoint_shard_num_error():
+    with pytest.raises(ValueError):
+        save_checkpoint([{"name": "param", "data": Tensor(np.ones([2]).astype(np.float32))}],
+                        "./sharded.ckpt", shard_num=0)
+
+
+def test_load_delta_checkpoint():
+    """ test load_checkpoint rebuilds a delta checkpoint from its base"""
+    from mindspore.train.serialization import _get_ckpt_data_list, _get_ckpt_hashes, _exec_save, _exec_save_delta
+    embedding = np.random.rand(4096, 16).astype(np.float32)
+    base_list = _get_ckpt_data_list([{"name": "embedding", "data": Tensor(embedding)}], True)
+    _exec_save("./delta_base.ckpt", base_list)
+
+    embedding[100] = 0.0
+    bias = np.ones([8]).astype(np.float32)
+    delta_list = _get_ckpt_data_list([{"name": "embedding", "data": Tensor(embedding)},
+                                      {"name": "bias", "data": Tensor(bias)}], True)
+    _exec_save_delta("./delta.ckpt", delta_list, "./delta_base.ckpt", _get_ckpt_hashes(base_list))
+    assert os.path.getsize("./delta.ckpt.shard0") < embedding.nbytes
+
+    par_dict = load_checkpoint("./delta.ckpt")
+    assert np.allclose(par_dict["embedding"].data.asnumpy(), embedding)
+    assert np.allclose(par_dict["bias"].data.asnumpy(), bias)
+
+
+def test_read_distributed_checkpoint():
+    """ test the slices of the parameters are read once from the checkpoint file of every rank"""
+    from mindspore.train.serialization import _read_distributed_checkpoint
+    checkpoint_filenames = []
+    for rank in range(4):
+        checkpoint_filenames.append("./distributed_rank{}.ckpt".format(rank))
+        save_checkpoint([{"name": "weight", "data": Tensor(np.full([2, 4], rank).astype(np.float32))},
+                         {"name": "bias", "data": Tensor(np.full([4], rank).astype(np.float32))}],
+                        checkpoint_filenames[-1])
+
+    param_rank_list = {"weight": [0, 1, 2, 3], "bias": [2]}
+    sliced_dict = dict(_read_distributed_checkpoint(checkpoint_filenames, param_rank_list))
+    assert sorted(sliced_dict.keys()) == ["bias", "weight"]
+    assert [param.data.asnumpy()[0, 0] for param in sliced_dict["weight"]] == [0, 1, 2, 3]
+    assert len(sliced_dict["bias"]) == 1
+    assert np.allclose(sliced_dict["bias"][0].data.asnumpy(), np.full([4], 2))
+
+    with pytest.raises(ValueError):
+        list(_read_distributed_checkpoint(checkpoint_filenames, {"missing": [1]}))
+
+
 def test_checkpoint_manager():
     """ test_checkpoint_manager """
     ckp_mgr = _CheckpointManager()
@@ -380,7 +468,9 @@ def test_print():
 
 
 def teardown_module():
-    files = ['parameters.ckpt', 'new_ckpt.ckpt', 'empty.ckpt']
+    files = ['parameters.ckpt', 'new_ckpt.ckpt', 'empty.ckpt', 'sliced.ckpt', 'sharded.ckpt', 'sharded.ckpt.shard0',
+             'sharded.ckpt.shard1', 'sharded.ckpt.shard2', 'delta_base.ckpt', 'delta.ckpt', 'delta.ckpt.shard0',
+             'distributed_rank0.ckpt', 'distributed_rank1.ckpt', 'distributed_rank2.ckpt', 'distributed_rank3.ckpt']
     for item in files:
         file_name = './' + item
         if not os.path.exists(file_name):